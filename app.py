@@ -3,27 +3,14 @@ from pathlib import Path
 import pandas as pd
 
 # Import Logic
-from logic.data_loader import load_data, check_database
+from logic.data_loader import get_user_data, reload_data, check_database
+from logic.view_models import get_view_model
+from logic.profiling import span
 from ui.styles import APP_STYLE
+from ui.profiler import start_profiling, finish_profiling, render_profile_panel
 
 # Import UI Modules
-from ui.dashboard import render_dashboard
-from ui.add_transaction import render_add_transaction
-from ui.expenses import render_expenses
-from ui.income import render_income
-from ui.investments import render_investments
-from ui.wallets import render_wallets
-
-# Page Config
-st.set_page_config(
-    page_title="Finance Dashboard",
-    page_icon="💸",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Apply Styles
-st.markdown(APP_STYLE, unsafe_allow_html=True)
+from ui.views import render_active_view
 
 # Main App Logic
 def login_page():
@@ -259,6 +246,16 @@ def login_page():
         st.markdown('</div>', unsafe_allow_html=True)
 
 def main():
+    # Page config and styles are set here rather than at import: report chart
+    # workers import this module (as __mp_main__) and must not render anything
+    st.set_page_config(
+        page_title="Finance Dashboard",
+        page_icon="💸",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(APP_STYLE, unsafe_allow_html=True)
+    
     # Check login status
     if 'logged_in' not in st.session_state or not st.session_state['logged_in']:
         login_page()
@@ -267,11 +264,27 @@ def main():
     # Get user_id from session
     user_id = st.session_state.get('user_id', 1)
     
-    # Load Data for current user
-    df = load_data(user_id)
+    # Opt-in per-rerun profiling (?profile=1, see ui/profiler.py)
+    profile = start_profiling(st.session_state.get("active_view", "rerun"))
+    try:
+        view_name = render_app(user_id)
+    finally:
+        finish_profiling(profile)
+    render_profile_panel(profile, view_name)
+
+def render_app(user_id):
+    """Render the app for a logged-in user and return the active view name"""
+    # Load Data for current user (cached until the next write or reload)
+    with span("load_data"):
+        df, data_version = get_user_data(user_id)
+    # Aggregates shared by all views, built once per data version
+    with span("view_model_cache"):
+        model = get_view_model(df, user_id, data_version)
     
     # Show database status in sidebar
-    if not check_database():
+    with span("check_database"):
+        connected = check_database()
+    if not connected:
         st.sidebar.error("❌ Database: NOT CONNECTED")
         st.sidebar.warning("⚠️ Configure Neon database in Secrets")
         st.sidebar.stop()
@@ -284,6 +297,7 @@ def main():
     
     # Add reload button
     if st.sidebar.button("🔄 Reload Data", use_container_width=True):
+        reload_data(user_id)
         st.rerun()
     
     # Header & Logout
@@ -293,42 +307,8 @@ def main():
         st.session_state["authenticated"] = False
         st.rerun()
     
-    # Top Navigation (Tabs instead of Sidebar)
-    tabs_labels = [
-        "Dashboard", 
-        "Add Transaction", 
-        "Expenses Analysis", 
-        "Income Tracking", 
-        "Investments", 
-        "Wallets & Banks"
-    ]
-    
-    # Create tabs
-    tabs = st.tabs(tabs_labels)
-    
-    # 1. Dashboard
-    with tabs[0]:
-        render_dashboard(df)
-        
-    # 2. Add Transaction
-    with tabs[1]:
-        render_add_transaction()
-        
-    # 3. Expenses
-    with tabs[2]:
-        render_expenses(df)
-        
-    # 4. Income
-    with tabs[3]:
-        render_income(df)
-        
-    # 5. Investments
-    with tabs[4]:
-        render_investments(df)
-        
-    # 6. Wallets
-    with tabs[5]:
-        render_wallets(df)
+    # Top Navigation: only the selected view is rendered (see ui/views.py)
+    view_name = render_active_view(model)
     
     # Optional: Keep Quick Stats in sidebar or move to Dashboard?
     # User only asked to change the "strip on the left" (sidebar) to the "image style" (tabs).
@@ -337,8 +317,9 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.markdown("### Quick Stats")
     if not df.empty:
-        total_balance = df[df['Type']=='Income']['Amount'].sum() - df[df['Type']=='Expense']['Amount'].sum()
+        total_balance = model.kpis["net_balance"]
         st.sidebar.metric("Net Balance", f"{total_balance:,.0f} EGP")
+    return view_name
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,4 @@
+"""
+Benchmarks
+Synthetic data and timing harnesses for Finance PRO.
+"""
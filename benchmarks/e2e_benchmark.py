@@ -0,0 +1,284 @@
+"""
+End-to-end benchmark
+Times the app's data path on synthetic N users x M years ledgers: loading
+(SQLite via load_transactions, or a local CSV), KPIs, filtering, the
+monthly summary, the view model build (per-type summaries, KPIs and the
+wallet balances and running totals of the Wallets page) and a full PDF report.
+Each stage is timed for every user and summed; the median over repeats is
+reported as a results table and written to JSON so runs can be compared
+across commits.
+
+Usage:
+    python -m benchmarks.e2e_benchmark
+    python -m benchmarks.e2e_benchmark --sizes 1x1 10x3 --backend csv --output e2e.json
+    python -m benchmarks.e2e_benchmark --baseline e2e_main.json --no-report
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from benchmarks.report_benchmark import _git_commit
+from benchmarks.synthetic import make_users_ledger
+from logic.calculations import filter_data, get_monthly_summary
+from logic.chart_cache import chart_cache
+from logic import database
+from logic.database import COLUMN_NAMES, load_transactions
+from logic.kpis import calculate_kpis
+from logic.periods import PERIOD_TYPES
+from logic.report_generator import generate_pdf_report
+from logic.report_profiles import DEFAULT_REPORT_PROFILE, REPORT_PROFILES
+from logic.view_models import build_view_model
+
+DEFAULT_SIZES = ["1x1", "5x3", "10x5"]
+BACKENDS = ("sqlite", "csv")
+STAGES = ["load_transactions", "calculate_kpis", "filter_data", "get_monthly_summary",
+          "build_view_model", "generate_pdf_report"]
+
+# Same tables as init_db_quick.py, in SQLite types
+SQLITE_SCHEMA = [
+    """CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        username TEXT UNIQUE NOT NULL,
+        password TEXT NOT NULL
+    )""",
+    """CREATE TABLE transactions (
+        id INTEGER PRIMARY KEY,
+        user_id INTEGER REFERENCES users(id),
+        date DATE NOT NULL,
+        type TEXT NOT NULL,
+        category TEXT,
+        source TEXT,
+        amount REAL NOT NULL,
+        description TEXT
+    )""",
+    "CREATE INDEX idx_transactions_user_date ON transactions(user_id, date)",
+]
+
+
+def parse_size(value):
+    """Parse "NxM" (N users, M years) into (N, M)."""
+    try:
+        users, years = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Size must look like 5x3 (users x years), got {value!r}")
+    if users < 1 or years < 1:
+        raise argparse.ArgumentTypeError(f"Size needs at least 1 user and 1 year, got {value!r}")
+    return users, years
+
+
+def _to_db_frame(ledger):
+    """Ledger rows in database column names, dates as YYYY-MM-DD."""
+    frame = ledger.rename(columns={v: k for k, v in COLUMN_NAMES.items()})
+    return frame.assign(date=frame["date"].dt.strftime("%Y-%m-%d"))
+
+
+def write_sqlite(ledger, path):
+    """Write a multi-user ledger to a new SQLite database; returns its URL."""
+    url = f"sqlite:///{path}"
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        for statement in SQLITE_SCHEMA:
+            conn.execute(text(statement))
+        users = pd.DataFrame({"id": sorted(ledger["user_id"].unique())})
+        users = users.assign(username="user" + users["id"].astype(str), password="")
+        users.to_sql("users", conn, if_exists="append", index=False)
+        _to_db_frame(ledger).to_sql("transactions", conn, if_exists="append", index=False,
+                                    chunksize=10_000)
+    engine.dispose()
+    return url
+
+
+def write_csv(ledger, directory):
+    """Write one data/transactions.csv-style file per user; returns {user_id: path}."""
+    paths = {}
+    for user_id, frame in ledger.groupby("user_id"):
+        paths[user_id] = os.path.join(directory, f"transactions_{user_id}.csv")
+        frame.drop(columns="user_id").to_csv(paths[user_id], index=False, date_format="%Y-%m-%d")
+    return paths
+
+
+def load_csv(path):
+    """Load a local transactions CSV in the shape load_transactions returns."""
+    df = pd.read_csv(path, parse_dates=["Date"])
+    df["Description"] = df["Description"].fillna("")
+    return df.sort_values("Date", ascending=False, kind="stable", ignore_index=True)
+
+
+@contextlib.contextmanager
+def use_database(url):
+    """
+    Point logic.database at `url` for the duration of the block.
+
+    get_db_url prefers Streamlit secrets over DATABASE_URL, so it is
+    replaced outright; a configured secrets.toml can never redirect the
+    benchmark to a real database.
+    """
+    original = database.get_db_url
+    database.get_db_url = lambda: url
+    try:
+        yield
+    finally:
+        database.get_db_url = original
+
+
+def _time(func):
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def run_user(load, args):
+    """Run every stage for one user; returns (ms per stage, rows loaded)."""
+    stages_ms = {}
+    stages_ms["load_transactions"], df = _time(load)
+    stages_ms["calculate_kpis"], _ = _time(lambda: calculate_kpis(df))
+    since = pd.Timestamp(df["Date"].max()) - pd.Timedelta(days=args.filter_days)
+    stages_ms["filter_data"], _ = _time(lambda: filter_data(df, start_date=since, txn_type="Expense"))
+    expenses = df[df["Type"] == "Expense"]
+    stages_ms["get_monthly_summary"], _ = _time(lambda: get_monthly_summary(expenses))
+    stages_ms["build_view_model"], _ = _time(lambda: build_view_model(df))
+    if not args.no_report:
+        chart_cache.clear()  # time rendering, not cache hits
+        stages_ms["generate_pdf_report"], _ = _time(
+            lambda: generate_pdf_report(df, args.period, profile=args.profile))
+    return stages_ms, len(df)
+
+
+def benchmark_size(users, years, args, workdir):
+    """Generate users x years, store it in the backend and time every stage."""
+    ledger = make_users_ledger(users, years, args.rows_per_year, args.seed, args.end)
+    expected_rows = ledger.groupby("user_id").size()
+    if args.backend == "sqlite":
+        backend = use_database(write_sqlite(ledger, os.path.join(workdir, f"e2e_{users}x{years}.db")))
+        loaders = {user_id: (lambda u=user_id: load_transactions(u, raise_errors=True))
+                   for user_id in range(1, users + 1)}
+    else:
+        backend = contextlib.nullcontext()
+        loaders = {user_id: (lambda p=path: load_csv(p)) for user_id, path in write_csv(ledger, workdir).items()}
+
+    runs = []
+    with backend:
+        for _ in range(args.repeat):
+            totals = dict.fromkeys(STAGES, 0.0)
+            for user_id, load in loaders.items():
+                # load_transactions logs every call
+                with contextlib.redirect_stdout(io.StringIO()):
+                    stages_ms, rows = run_user(load, args)
+                if rows != expected_rows[user_id]:
+                    raise RuntimeError(f"User {user_id} loaded {rows} rows, expected {expected_rows[user_id]} "
+                                       f"- not reading the generated {args.backend} data")
+                for name, ms in stages_ms.items():
+                    totals[name] += ms
+            runs.append(totals)
+
+    stages = [name for name in STAGES if not (args.no_report and name == "generate_pdf_report")]
+    return {
+        "size": f"{users}x{years}",
+        "users": users,
+        "years": years,
+        "rows": len(ledger),
+        "stages_ms": {name: statistics.median(run[name] for run in runs) for name in stages},
+    }
+
+
+def print_results(results, baseline=None):
+    """Print one row per size and one column per stage (ms, summed over users)."""
+    base = {r["size"]: r for r in (baseline or {}).get("results", [])}
+    stages = list(results[0]["stages_ms"])
+    widths = [max(len(name), 12) for name in stages]
+    header = f"{'size':>7} {'rows':>10}" + "".join(f" {name:>{w}}" for name, w in zip(stages, widths))
+    print("=" * len(header))
+    print(header)
+    print("=" * len(header))
+    for result in results:
+        print(f"{result['size']:>7} {result['rows']:>10,}"
+              + "".join(f" {result['stages_ms'][name]:>{w - 3}.1f} ms" for name, w in zip(stages, widths)))
+        previous = base.get(result["size"], {}).get("stages_ms", {})
+        if previous:
+            ratios = [f"x{result['stages_ms'][name] / previous[name]:.2f}" if previous.get(name) else "-"
+                      for name in stages]
+            print(f"{'vs baseline':>18}" + "".join(f" {ratio:>{w}}" for ratio, w in zip(ratios, widths)))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="End-to-end benchmark of the Finance PRO data path.")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=[parse_size(s) for s in DEFAULT_SIZES],
+                        help="Sizes as USERSxYEARS (default: 1x1 5x3 10x5)")
+    parser.add_argument("--backend", choices=BACKENDS, default="sqlite",
+                        help="sqlite: load_transactions on a temporary SQLite database; "
+                             "csv: local transactions CSV files (default: sqlite)")
+    parser.add_argument("--rows-per-year", type=int, default=1500,
+                        help="Typical day-to-day transactions per user and year (default: 1500)")
+    parser.add_argument("--period", choices=PERIOD_TYPES, default="yearly",
+                        help="Report period (default: yearly)")
+    parser.add_argument("--profile", choices=list(REPORT_PROFILES), default=DEFAULT_REPORT_PROFILE,
+                        help=f"Report fidelity profile (default: {DEFAULT_REPORT_PROFILE})")
+    parser.add_argument("--filter-days", type=int, default=90,
+                        help="filter_data window ending at the newest transaction (default: 90)")
+    parser.add_argument("--no-report", action="store_true", help="Skip the PDF report stage")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed runs per size; the median is reported (default: 3)")
+    parser.add_argument("--seed", type=int, default=42, help="Ledger random seed (default: 42)")
+    parser.add_argument("--end", type=date.fromisoformat,
+                        default=date.today() - timedelta(days=1),
+                        help="Last day of the ledgers, YYYY-MM-DD (default: yesterday)")
+    parser.add_argument("--output", default="e2e_benchmark.json",
+                        help="JSON file the results are written to (default: e2e_benchmark.json)")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    workdir = tempfile.mkdtemp(prefix="finance_e2e_")
+    try:
+        results = []
+        for users, years in args.sizes:
+            print(f"⏳ Benchmarking {users} user(s) x {years} year(s) on {args.backend}...")
+            results.append(benchmark_size(users, years, args, workdir))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_results(results, baseline)
+
+    with open(args.output, "w") as f:
+        json.dump({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "config": {
+                "backend": args.backend,
+                "rows_per_year": args.rows_per_year,
+                "period": args.period,
+                "profile": args.profile,
+                "filter_days": args.filter_days,
+                "repeat": args.repeat,
+                "seed": args.seed,
+                "end": args.end.isoformat(),
+            },
+            "results": results,
+        }, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
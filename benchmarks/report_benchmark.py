@@ -0,0 +1,204 @@
+"""
+Report generation benchmark
+Times each stage of PDF report generation on synthetic ledgers of
+increasing size and records peak memory, writing the results to JSON so
+runs can be compared across commits.
+
+Usage:
+    python -m benchmarks.report_benchmark
+    python -m benchmarks.report_benchmark --sizes 1000 10000 --repeat 5 --output bench.json
+    python -m benchmarks.report_benchmark --baseline bench_main.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.synthetic import make_ledger
+from logic.chart_cache import chart_cache
+from logic.periods import PERIOD_TYPES, resolve_period
+from logic.report_generator import (
+    calculate_summary_stats,
+    create_chart_image,
+    generate_pdf_report,
+    get_period_data,
+)
+from logic.report_profiles import DEFAULT_REPORT_PROFILE, REPORT_PROFILES
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+CHART_TYPES = ["summary", "income_sources", "category_breakdown", "daily_trend"]
+
+
+def _stages(df, period, profile, state):
+    """
+    Yield (stage name, callable) for one report, in pipeline order.
+
+    Intermediate results (period frame, PDF, report timings) are stored in
+    `state`. The full report runs last; its own "layout" timing is the
+    doc.build stage.
+    """
+
+    def period_data():
+        state["period_df"] = get_period_data(df, period=period)[0]
+
+    yield "get_period_data", period_data
+    yield "calculate_summary_stats", lambda: calculate_summary_stats(state["period_df"])
+    for chart_type in CHART_TYPES:
+        yield f"create_chart_image[{chart_type}]", lambda c=chart_type: create_chart_image(state["period_df"], c, profile)
+
+    def full_report():
+        timings = {}
+        state["pdf"] = generate_pdf_report(df, period=period, timings=timings, profile=profile)
+        state["report_timings"] = timings
+
+    yield "generate_pdf_report", full_report
+
+
+def run_timed(df, period, profile):
+    """One untraced pass over the pipeline; returns ms per stage."""
+    chart_cache.clear()
+    state = {}
+    stages_ms = {}
+    for name, stage in _stages(df, period, profile, state):
+        if name == "generate_pdf_report":
+            # Charts were just rendered above; render them again for an honest total
+            chart_cache.clear()
+        start = time.perf_counter()
+        stage()
+        stages_ms[name] = (time.perf_counter() - start) * 1000
+    stages_ms["doc.build"] = state["report_timings"]["layout"] * 1000
+    return stages_ms, state
+
+
+def run_traced(df, period, profile):
+    """One pass under tracemalloc; returns peak MB allocated during each stage."""
+    chart_cache.clear()
+    peaks = {}
+    tracemalloc.start()
+    try:
+        for name, stage in _stages(df, period, profile, {}):
+            if name == "generate_pdf_report":
+                chart_cache.clear()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            stage()
+            peaks[name] = (tracemalloc.get_traced_memory()[1] - baseline) / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def benchmark_size(rows, args):
+    """Build a ledger of `rows` transactions and benchmark one report on it."""
+    df = make_ledger(rows, days=args.ledger_days, seed=args.seed)
+    period = resolve_period(args.period, days=args.days)
+
+    runs = []
+    for _ in range(args.repeat):
+        stages_ms, state = run_timed(df, period, args.profile)
+        runs.append(stages_ms)
+    stages_ms = {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+
+    peak_mb = run_traced(df, period, args.profile) if not args.no_memory else {}
+
+    return {
+        "rows": rows,
+        "period_rows": len(state["period_df"]),
+        "pdf_bytes": len(state["pdf"].getvalue()),
+        "stages_ms": stages_ms,
+        "peak_memory_mb": peak_mb,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results, baseline=None):
+    """Print a per-size stage table, with the ratio to a baseline run if given."""
+    base = {r["rows"]: r for r in (baseline or {}).get("results", [])}
+    for result in results:
+        print("=" * 72)
+        print(f"{result['rows']:,} rows ({result['period_rows']:,} in period, {result['pdf_bytes'] / 1024:,.0f} KB PDF)")
+        print("=" * 72)
+        previous = base.get(result["rows"], {})
+        for name, ms in result["stages_ms"].items():
+            line = f"  {name:<40} {ms:10.1f} ms"
+            peak = result["peak_memory_mb"].get(name)
+            if peak is not None:
+                line += f"  {peak:8.1f} MB"
+            before = previous.get("stages_ms", {}).get(name)
+            if before:
+                line += f"  x{ms / before:.2f} vs baseline"
+            print(line)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Finance PRO PDF report generation.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES,
+                        help="Ledger sizes in rows (default: 1000 10000 100000 1000000)")
+    parser.add_argument("--period", choices=PERIOD_TYPES, default="rolling",
+                        help="Report period (default: rolling)")
+    parser.add_argument("--days", type=int, default=30,
+                        help="Window length for --period rolling (default: 30)")
+    parser.add_argument("--profile", choices=list(REPORT_PROFILES), default=DEFAULT_REPORT_PROFILE,
+                        help=f"Report fidelity profile (default: {DEFAULT_REPORT_PROFILE})")
+    parser.add_argument("--ledger-days", type=int, default=365,
+                        help="Number of days the synthetic ledger spans (default: 365)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed runs per size; the median is reported (default: 3)")
+    parser.add_argument("--seed", type=int, default=42, help="Ledger random seed (default: 42)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory pass")
+    parser.add_argument("--output", default="report_benchmark.json",
+                        help="JSON file the results are written to (default: report_benchmark.json)")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = []
+    for rows in args.sizes:
+        print(f"⏳ Benchmarking {rows:,} rows...")
+        results.append(benchmark_size(rows, args))
+
+    print_results(results, baseline)
+
+    with open(args.output, "w") as f:
+        json.dump({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "config": {
+                "period": args.period,
+                "days": args.days,
+                "profile": args.profile,
+                "ledger_days": args.ledger_days,
+                "repeat": args.repeat,
+                "seed": args.seed,
+            },
+            "results": results,
+        }, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+Synthetic Ledger Module
+Builds realistic transaction ledgers of any size for benchmarks.
+
+make_ledger builds one ledger of a given number of rows; make_users_ledger
+builds N users x M years with seasonal activity, monthly recurring
+transactions and price growth. Generation is vectorized and seeded, so the
+same arguments always produce the same ledger.
+"""
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Share of rows per transaction type
+TYPE_WEIGHTS = {
+    "Expense": 0.70,
+    "Income": 0.15,
+    "Investment": 0.10,
+    "Transfer": 0.05,
+}
+
+# Category -> (weight, typical amount) per type, matching the Add Transaction form
+CATEGORIES = {
+    "Expense": {
+        "Food": (0.30, 150), "Transport": (0.15, 60), "Personal": (0.10, 300),
+        "Subscriptions": (0.08, 200), "Entertainment": (0.07, 250), "Bills": (0.07, 800),
+        "University": (0.04, 3000), "Health": (0.04, 500), "Books": (0.03, 250),
+        "Rent": (0.02, 6000), "Gifts": (0.03, 700), "Other": (0.07, 200),
+    },
+    "Income": {
+        "Freelancing (Mostaql)": (0.35, 4000), "Salary": (0.25, 15000), "Pocket Money": (0.20, 1500),
+        "Bonus": (0.05, 5000), "Business": (0.05, 8000), "Gift": (0.04, 1000),
+        "Refund": (0.04, 400), "Other": (0.02, 800),
+    },
+    "Investment": {
+        "Gold": (0.40, 5000), "Stock Trading": (0.30, 3000), "Crypto": (0.15, 2000),
+        "Real Estate": (0.05, 50000), "NFT": (0.02, 1000), "Other": (0.08, 1500),
+    },
+    "Transfer": {
+        "Transfer": (1.0, 2000),
+    },
+}
+
+# Payment source weights
+SOURCES = {
+    "Vodafone Cash": 0.22, "InstaPay": 0.18, "Cash": 0.18, "National Bank of Egypt": 0.10,
+    "CIB Bank": 0.08, "Banque Misr": 0.06, "Credit Card": 0.07, "Apple Pay": 0.04,
+    "Wallet": 0.05, "Other": 0.02,
+}
+
+
+# Relative activity per calendar month (Jan..Dec) and weekday (Mon..Sun):
+# end-of-year and back-to-school spending, busier Egyptian weekends (Fri/Sat)
+MONTH_WEIGHTS = (0.95, 0.85, 0.90, 1.00, 1.00, 0.95, 1.05, 1.10, 1.20, 1.00, 0.95, 1.30)
+WEEKDAY_WEIGHTS = (0.90, 0.90, 0.95, 1.00, 1.20, 1.25, 0.85)
+
+# Yearly price growth: older transactions are smaller
+ANNUAL_INFLATION = 0.15
+
+# Monthly recurring transactions: (type, category) -> (day of month, typical amount, share of users)
+RECURRING = {
+    ("Income", "Salary"): (25, 15000, 0.70),
+    ("Expense", "Rent"): (1, 6000, 0.40),
+    ("Expense", "Bills"): (10, 800, 0.90),
+    ("Expense", "Subscriptions"): (5, 200, 0.80),
+}
+
+# Accounts salaries are paid into and rent/bills are paid from
+BANK_SOURCES = ("National Bank of Egypt", "CIB Bank", "Banque Misr", "InstaPay")
+
+
+def _normalized(weights):
+    weights = np.asarray(weights, dtype=float)
+    return weights / weights.sum()
+
+
+def make_ledger(rows: int, days: int = 365, seed: int = 42, end: Optional[date] = None) -> pd.DataFrame:
+    """
+    Build a synthetic ledger in the shape returned by load_transactions.
+
+    Args:
+        rows: Number of transactions
+        days: Number of days the ledger spans, ending at `end`
+        seed: Random seed
+        end: Last day of the ledger (default: today)
+
+    Returns:
+        DataFrame with Date, Type, Category, Source, Amount, Description,
+        sorted by Date
+    """
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp(end or date.today()).normalize()
+
+    dates = end - pd.to_timedelta(rng.integers(0, days, rows), unit="D")
+    df = pd.DataFrame({"Date": dates, **_draw_fields(rng, rows)})
+    return df.sort_values("Date", kind="stable", ignore_index=True)
+
+
+def _draw_fields(rng, rows: int) -> dict:
+    """Type, Category, Source, Amount and Description columns for `rows` transactions."""
+    type_names = list(TYPE_WEIGHTS)
+    types = rng.choice(len(type_names), size=rows, p=_normalized(list(TYPE_WEIGHTS.values())))
+
+    categories = np.empty(rows, dtype=object)
+    amounts = np.empty(rows, dtype=float)
+    for type_index, type_name in enumerate(type_names):
+        mask = types == type_index
+        count = int(mask.sum())
+        if not count:
+            continue
+        names = list(CATEGORIES[type_name])
+        weights, typical = zip(*CATEGORIES[type_name].values())
+        picks = rng.choice(len(names), size=count, p=_normalized(weights))
+        categories[mask] = np.asarray(names, dtype=object)[picks]
+        # Log-normal around the category's typical amount: mostly small, a few large
+        amounts[mask] = np.asarray(typical)[picks] * rng.lognormal(0.0, 0.5, count)
+
+    source_names = np.asarray(list(SOURCES), dtype=object)
+    sources = source_names[rng.choice(len(source_names), size=rows, p=_normalized(list(SOURCES.values())))]
+
+    return {
+        "Type": np.asarray(type_names, dtype=object)[types],
+        "Category": categories,
+        "Source": sources,
+        "Amount": amounts.round(2),
+        "Description": "",
+    }
+
+
+def _seasonal_dates(rng, rows: int, start: pd.Timestamp, end: pd.Timestamp) -> pd.DatetimeIndex:
+    """Draw `rows` dates in [start, end], weighted by month and weekday."""
+    days = pd.date_range(start, end, freq="D")
+    weights = (np.asarray(MONTH_WEIGHTS)[days.month - 1]
+               * np.asarray(WEEKDAY_WEIGHTS)[days.weekday])
+    return days[rng.choice(len(days), size=rows, p=_normalized(weights))]
+
+
+def _recurring_rows(rng, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Monthly salary, rent, bills and subscriptions of one user."""
+    months = pd.date_range(start.replace(day=1), end, freq="MS")
+    bank = BANK_SOURCES[rng.integers(len(BANK_SOURCES))]
+    frames = []
+    for (txn_type, category), (day, typical, share) in RECURRING.items():
+        # Draw for every entry so a user's other entries do not depend on this one
+        has_it, scale = rng.random() < share, rng.lognormal(0.0, 0.3)
+        jitter = rng.normal(1.0, 0.05, len(months))
+        if not has_it:
+            continue
+        dates = months + pd.Timedelta(days=day - 1)
+        keep = (dates >= start) & (dates <= end)
+        frames.append(pd.DataFrame({
+            "Date": dates[keep],
+            "Type": txn_type,
+            "Category": category,
+            "Source": bank,
+            "Amount": (typical * scale * jitter[keep]).round(2),
+            "Description": f"Monthly {category.lower()}",
+        }))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def make_user_ledger(user_id: int, years: int, rows_per_year: int = 1500, seed: int = 42,
+                     end: Optional[date] = None) -> pd.DataFrame:
+    """
+    Build `years` years of transactions for one user.
+
+    Each user draws from its own random stream (seed, user_id), so a user's
+    ledger does not depend on how many other users are generated. Users
+    differ in activity (log-normal around rows_per_year), in which monthly
+    recurring transactions they have and in their size. Day-to-day
+    transactions follow MONTH_WEIGHTS and WEEKDAY_WEIGHTS, and amounts grow
+    by ANNUAL_INFLATION per year up to `end`.
+
+    Args:
+        user_id: User id (part of the random stream)
+        years: Number of years the ledger spans, ending at `end`
+        rows_per_year: Typical number of day-to-day transactions per year
+        seed: Random seed
+        end: Last day of the ledger (default: today)
+
+    Returns:
+        DataFrame with Date, Type, Category, Source, Amount, Description,
+        sorted by Date
+    """
+    rng = np.random.default_rng([seed, user_id])
+    end = pd.Timestamp(end or date.today()).normalize()
+    start = end - pd.DateOffset(years=years) + pd.Timedelta(days=1)
+
+    rows = max(1, int(rows_per_year * years * rng.lognormal(0.0, 0.3)))
+    df = pd.DataFrame({"Date": _seasonal_dates(rng, rows, start, end), **_draw_fields(rng, rows)})
+    df = pd.concat([df, _recurring_rows(rng, start, end)], ignore_index=True)
+
+    years_ago = (end - df["Date"]).dt.days / 365.25
+    df["Amount"] = (df["Amount"] / (1 + ANNUAL_INFLATION) ** years_ago).round(2)
+    return df.sort_values("Date", kind="stable", ignore_index=True)
+
+
+def make_users_ledger(users: int, years: int, rows_per_year: int = 1500, seed: int = 42,
+                      end: Optional[date] = None) -> pd.DataFrame:
+    """
+    Build ledgers for users 1..`users` (see make_user_ledger).
+
+    Returns:
+        DataFrame shaped like make_user_ledger plus a user_id column,
+        sorted by user_id then Date
+    """
+    return pd.concat(
+        [make_user_ledger(user_id, years, rows_per_year, seed, end).assign(user_id=user_id)
+         for user_id in range(1, users + 1)],
+        ignore_index=True,
+    )
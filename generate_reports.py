@@ -0,0 +1,127 @@
+"""
+Batch report generation
+Generates PDF reports for many users at once, e.g. for month-end reporting.
+
+Usage:
+    python generate_reports.py --period monthly
+    python generate_reports.py --period weekly quarterly --users 1 2 3 --output reports --workers 4
+    python generate_reports.py --period rolling --days 90
+    python generate_reports.py --period custom --start 2025-01-01 --end 2025-06-30
+    python generate_reports.py --period yearly --profile print
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+
+from logic.database import load_transactions, load_user_ids
+from logic.periods import PERIOD_TYPES, resolve_period
+from logic.report_generator import generate_pdf_report, set_chart_pool_workers
+from logic.report_profiles import DEFAULT_REPORT_PROFILE, REPORT_PROFILES
+
+
+def generate_user_report(user_id, period, output_dir, profile=DEFAULT_REPORT_PROFILE):
+    """Load one user's ledger and write one PDF report. Runs in a worker process."""
+    start = time.perf_counter()
+    period_type = period.period_type
+    df = load_transactions(user_id)
+    pdf = generate_pdf_report(df, period_type=period_type, period=period, profile=profile).getvalue()
+    
+    file_name = f"User{user_id}_{period_type.capitalize()}_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
+    path = os.path.join(output_dir, file_name)
+    with open(path, "wb") as f:
+        f.write(pdf)
+    
+    return {
+        "user_id": user_id,
+        "period_type": period_type,
+        "path": path,
+        "rows": len(df),
+        "bytes": len(pdf),
+        "seconds": time.perf_counter() - start
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate Finance PRO PDF reports in batch.")
+    parser.add_argument("--period", nargs="+", choices=PERIOD_TYPES, default=["monthly"],
+                        help="Report period(s) to generate (default: monthly)")
+    parser.add_argument("--days", type=int, default=30,
+                        help="Window length for --period rolling (default: 30)")
+    parser.add_argument("--start", type=date.fromisoformat,
+                        help="First day (YYYY-MM-DD) for --period custom")
+    parser.add_argument("--end", type=date.fromisoformat,
+                        help="Last day (YYYY-MM-DD) for --period custom")
+    parser.add_argument("--profile", choices=list(REPORT_PROFILES), default=DEFAULT_REPORT_PROFILE,
+                        help=f"Report fidelity profile (default: {DEFAULT_REPORT_PROFILE})")
+    parser.add_argument("--users", nargs="+", type=int,
+                        help="User ids to report on (default: all users)")
+    parser.add_argument("--output", default="reports",
+                        help="Directory the PDFs are written to (default: reports)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--chart-workers", type=int,
+                        help="Chart processes per worker process; 1 draws charts in the worker itself "
+                             "(default: CPU count / workers, between 1 and 4)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    user_ids = args.users or load_user_ids()
+    if not user_ids:
+        print("❌ No users found. Check the database connection or pass --users.")
+        return 1
+    
+    try:
+        periods = [
+            resolve_period(period_type, start=args.start, end=args.end, days=args.days)
+            for period_type in args.period
+        ]
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    
+    os.makedirs(args.output, exist_ok=True)
+    # Processes already run in parallel; keep workers x chart processes near the core count
+    chart_workers = args.chart_workers or min(4, max(1, (os.cpu_count() or 1) // args.workers))
+    jobs = [(user_id, period) for user_id in user_ids for period in periods]
+    
+    print("=" * 60)
+    print(f"Generating {len(jobs)} report(s) with {args.workers} worker(s) "
+          f"x {chart_workers} chart process(es) -> {args.output}")
+    print("=" * 60)
+    
+    batch_start = time.perf_counter()
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=set_chart_pool_workers,
+                             initargs=(chart_workers,)) as pool:
+        futures = {
+            pool.submit(generate_user_report, user_id, period, args.output, args.profile): (user_id, period.period_type)
+            for user_id, period in jobs
+        }
+        for future in as_completed(futures):
+            user_id, period_type = futures[future]
+            try:
+                result = future.result()
+                print(
+                    f"✅ user {user_id:>5} {period_type:<9} {result['rows']:>7} rows "
+                    f"{result['bytes'] / 1024:>8.0f} KB {result['seconds']:>7.2f}s  {result['path']}"
+                )
+            except Exception as e:
+                failures += 1
+                print(f"❌ user {user_id:>5} {period_type:<9} failed: {e}")
+    
+    elapsed = time.perf_counter() - batch_start
+    done = len(jobs) - failures
+    print("=" * 60)
+    print(f"Generated {done}/{len(jobs)} report(s) in {elapsed:.2f}s "
+          f"({done / elapsed if elapsed else 0:.2f} reports/s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,9 @@ import pandas as pd
 from datetime import datetime
 from typing import Optional, List
 
+from logic.metrics import instrument
+
+@instrument()
 def filter_data(df: pd.DataFrame, 
                 start_date: Optional[datetime] = None, 
                 end_date: Optional[datetime] = None, 
@@ -10,11 +13,14 @@ def filter_data(df: pd.DataFrame,
                 txn_type: Optional[str] = None) -> pd.DataFrame:
     """
     Filter the transactions DataFrame based on criteria.
+    
+    Each filter produces a new frame; when no criteria apply the input is
+    returned as is, so callers must copy before modifying the result.
     """
     if df.empty:
         return df
         
-    out = df.copy()
+    out = df
     
     if start_date:
         out = out[out["Date"] >= pd.Timestamp(start_date)]
@@ -32,6 +38,7 @@ def filter_data(df: pd.DataFrame,
         
     return out
 
+@instrument()
 def get_monthly_summary(df: pd.DataFrame, value_col: str = "Amount", agg_func: str = "sum") -> pd.DataFrame:
     """
     Resample data by month and aggregate.
@@ -45,6 +52,7 @@ def get_monthly_summary(df: pd.DataFrame, value_col: str = "Amount", agg_func: s
     monthly["Month"] = monthly["Date"].dt.strftime("%Y-%m")
     return monthly
 
+@instrument()
 def group_by_category(df: pd.DataFrame) -> pd.DataFrame:
     """
     Group expenses by category for pie/bar charts.
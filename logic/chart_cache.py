@@ -0,0 +1,188 @@
+"""
+Chart Cache Module
+Content-addressed cache of rendered report chart images (PNG or SVG).
+
+Charts are keyed by (chart_type, fingerprint of the aggregated input,
+style version, dpi, format), so regenerating a report whose aggregates have not
+changed skips matplotlib entirely.
+
+Both layers are bounded: the in-memory LRU by max_bytes, and the optional
+cache directory by max_disk_bytes, evicting the least recently used files
+(by mtime) when a new chart is written.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import pandas as pd
+
+
+def fingerprint(data) -> str:
+    """
+    Stable content hash of an aggregated chart input.
+
+    Args:
+        data: pandas Series/DataFrame produced by aggregate_chart_data, or None
+
+    Returns:
+        Hex digest identifying the data
+    """
+    h = hashlib.sha256()
+    if data is None:
+        h.update(b"none")
+    elif isinstance(data, (pd.Series, pd.DataFrame)):
+        h.update(type(data).__name__.encode())
+        if isinstance(data, pd.DataFrame):
+            h.update(repr(list(data.columns)).encode())
+        h.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+    else:
+        h.update(repr(data).encode())
+    return h.hexdigest()
+
+
+def chart_cache_key(chart_type: str, data, style_version: int, dpi: int, fmt: str = "png") -> str:
+    """Build the cache key for one chart."""
+    raw = f"{chart_type}|{fingerprint(data)}|v{style_version}|{dpi}|{fmt}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class ChartCache:
+    """
+    Size-bounded LRU of chart image bytes (PNG or SVG) with optional on-disk persistence.
+
+    Thread safe; shared by every session in the process.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, cache_dir: Optional[str] = None,
+                 max_disk_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.chart")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached image bytes for key, or None."""
+        with self._lock:
+            png = self._entries.get(key)
+            if png is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return png
+
+        if self.cache_dir:
+            try:
+                with open(self._path(key), "rb") as f:
+                    png = f.read()
+            except OSError:
+                png = None
+            if png:
+                self._touch(key)
+                self._remember(key, png)
+                with self._lock:
+                    self.hits += 1
+                return png
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, png: bytes):
+        """Store image bytes under key (and on disk when persistence is enabled)."""
+        if not png:
+            return
+        self._remember(key, png)
+        if self.cache_dir:
+            tmp_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(png)
+                os.replace(tmp_path, self._path(key))
+            except OSError as e:
+                print(f"Chart cache write error: {e}")
+            else:
+                self._trim_disk()
+
+    def _touch(self, key: str):
+        """Mark a file as recently used, so disk eviction is LRU."""
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def _disk_entries(self):
+        """(mtime, size, path) of every chart file in the cache directory."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".chart"):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue  # removed by another process
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            pass
+        return entries
+
+    def _trim_disk(self):
+        """Delete the least recently used files until the directory fits max_disk_bytes."""
+        entries = self._disk_entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_disk_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_disk_bytes:
+                break
+
+    def _remember(self, key: str, png: bytes):
+        if len(png) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = png
+            self._size += len(png)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self):
+        """Drop all entries, including the files in the cache directory."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.cache_dir:
+            for _, _, path in self._disk_entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Process-wide cache. Set REPORT_CHART_CACHE_DIR to persist charts across restarts.
+chart_cache = ChartCache(
+    max_bytes=int(os.environ.get("REPORT_CHART_CACHE_MB", "32")) * 1024 * 1024,
+    cache_dir=os.environ.get("REPORT_CHART_CACHE_DIR") or None,
+    max_disk_bytes=int(os.environ.get("REPORT_CHART_CACHE_DISK_MB", "256")) * 1024 * 1024
+)
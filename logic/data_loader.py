@@ -1,20 +1,178 @@
 """
 Data loader - simple wrapper around database
+
+Each user's transactions are loaded once and kept in a process-level store,
+tagged with a data version. The version only ever increases and is bumped
+by every write (and by an explicit reload), so reruns reuse the cached frame
+and downstream caches can key off (user_id, data_version) instead of
+hashing the frame.
+
+Saving a transaction does not reload anything: the new row is inserted into
+the cached frame and view model, and the database copy is compared with the
+local one in a background thread.
 """
+import itertools
+import threading
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 from logic.database import load_transactions, save_transaction, test_connection
+from logic.ledger import insert_newest_first, make_row
+from logic.view_models import view_model_cache
+
+
+class DataStore:
+    """
+    Process-level cache of each user's transaction frame.
+
+    Frames are shared by every session of the user and must be treated as
+    read-only; derive new frames instead of modifying them in place.
+    """
+
+    def __init__(self):
+        self._versions = {}  # user_id -> current data version
+        self._frames = {}  # user_id -> (version, DataFrame)
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def version(self, user_id) -> int:
+        """Current data version of a user (assigned on first use)."""
+        with self._lock:
+            if user_id not in self._versions:
+                self._versions[user_id] = next(self._counter)
+            return self._versions[user_id]
+
+    def get(self, user_id):
+        """
+        Return (DataFrame, data_version) for a user, loading from the database
+        only when the cached frame is older than the current version.
+        """
+        version = self.version(user_id)
+        with self._lock:
+            cached = self._frames.get(user_id)
+        if cached is not None and cached[0] == version:
+            return cached[1], version
+
+        print(f"🔄 load_data called for user_id={user_id} (data version {version})")
+        try:
+            df = load_transactions(user_id, raise_errors=True)
+        except Exception as e:
+            print(f"❌ load_data failed for user_id={user_id}: {e}")
+            # Retire this version so nothing derived from the empty frame
+            # (view model, figures) is reused once the database is back
+            self.bump(user_id)
+            return pd.DataFrame(), version
+        with self._lock:
+            # Only keep the frame if no write happened while loading
+            if self._versions.get(user_id) == version:
+                self._frames[user_id] = (version, df)
+        print(f"📊 load_data returning {len(df)} rows")
+        return df, version
+
+    def bump(self, user_id) -> int:
+        """Mark a user's data as changed and return the new version."""
+        with self._lock:
+            self._versions[user_id] = next(self._counter)
+            self._frames.pop(user_id, None)
+            return self._versions[user_id]
+
+    def append(self, user_id, *values):
+        """
+        Apply a saved transaction to the cached frame under a new version.
+
+        Args:
+            user_id: Owner of the transaction
+            values: date, trans_type, category, source, amount, description
+
+        Returns:
+            (previous_version, new_version, frame, row); frame and row are None
+            when there was no current frame to patch (the next get() loads it)
+        """
+        with self._lock:
+            previous = self._versions.get(user_id)
+            cached = self._frames.get(user_id)
+            version = self._versions[user_id] = next(self._counter)
+            if cached is None or cached[0] != previous or cached[1].empty:
+                self._frames.pop(user_id, None)
+                return previous, version, None, None
+            row = make_row(cached[1], *values)
+            df = insert_newest_first(cached[1], row)
+            self._frames[user_id] = (version, df)
+            return previous, version, df, row
+
+    def reconcile(self, user_id, version):
+        """
+        Compare the patched frame of `version` with the database and adopt the
+        database copy under a new version if they differ (e.g. concurrent
+        writes from another process).
+        """
+        try:
+            df = load_transactions(user_id, raise_errors=True)
+        except Exception as e:
+            print(f"⚠️ Reconcile skipped for user_id={user_id}: {e}")
+            return  # database unavailable, keep the local copy
+        with self._lock:
+            cached = self._frames.get(user_id)
+            if self._versions.get(user_id) != version or cached is None or cached[0] != version:
+                return  # superseded by a newer write or reload
+            local = cached[1]
+            if len(df) == len(local) and np.isclose(df["Amount"].sum(), local["Amount"].sum()):
+                return
+            version = self._versions[user_id] = next(self._counter)
+            self._frames[user_id] = (version, df)
+        print(f"🔁 Reconciled user_id={user_id} with the database (data version {version})")
+
+
+# Process-wide store shared by all sessions
+data_store = DataStore()
+
+
+def get_user_data(user_id=1):
+    """
+    Load transactions for a user together with their data version.
+
+    Returns:
+        (DataFrame, data_version)
+    """
+    return data_store.get(user_id)
+
+
+def get_data_version(user_id=1):
+    """Current data version of a user's transactions"""
+    return data_store.version(user_id)
+
 
 def load_data(user_id=1):
     """Load transactions for a user"""
-    print(f"🔄 load_data called for user_id={user_id}")
-    df = load_transactions(user_id)
-    print(f"📊 load_data returning {len(df)} rows")
-    return df
+    return get_user_data(user_id)[0]
+
+
+def reload_data(user_id=1):
+    """Drop the cached frame so the next load reads from the database"""
+    return data_store.bump(user_id)
+
 
 def save_data(user_id, date, trans_type, category, source, amount, description=""):
-    """Save a transaction"""
-    return save_transaction(user_id, date, trans_type, category, source, amount, description)
+    """
+    Save a transaction.
+    
+    The cached frame and view model are patched with the new row rather than
+    reloaded; the database is reconciled in the background.
+    """
+    success = save_transaction(user_id, date, trans_type, category, source, amount, description)
+    if success:
+        previous, version, df, row = data_store.append(
+            user_id, date, trans_type, category, source, amount, description
+        )
+        if df is not None:
+            view_model_cache.patch(user_id, previous, version, df, row)
+            threading.Thread(
+                target=data_store.reconcile, args=(user_id, version),
+                name=f"reconcile-{user_id}", daemon=True
+            ).start()
+    return success
+
 
 def check_database():
     """Check if database is available"""
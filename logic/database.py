@@ -6,6 +6,16 @@ import streamlit as st
 from sqlalchemy import create_engine, text
 import os
 
+# Database column -> app column
+COLUMN_NAMES = {
+    'date': 'Date',
+    'type': 'Type',
+    'category': 'Category',
+    'source': 'Source',
+    'amount': 'Amount',
+    'description': 'Description'
+}
+
 def get_db_url():
     """Get database URL from secrets or environment"""
     try:
@@ -29,11 +39,19 @@ def get_engine():
     )
     return engine
 
-def load_transactions(user_id=1):
-    """Load all transactions for a user"""
+def load_transactions(user_id=1, raise_errors=False):
+    """
+    Load all transactions for a user
+    
+    Returns an empty DataFrame when the database is unavailable, or raises
+    (ConnectionError or the database error) if raise_errors is set, so
+    callers can tell a failed load from a user without transactions.
+    """
     engine = get_engine()
     if not engine:
         print("❌ No database connection")
+        if raise_errors:
+            raise ConnectionError("No database URL configured")
         return pd.DataFrame()
     
     try:
@@ -53,14 +71,7 @@ def load_transactions(user_id=1):
         
         if not df.empty:
             # Rename columns to match app format
-            df = df.rename(columns={
-                'date': 'Date',
-                'type': 'Type',
-                'category': 'Category',
-                'source': 'Source',
-                'amount': 'Amount',
-                'description': 'Description'
-            })
+            df = df.rename(columns=COLUMN_NAMES)
             # Convert date
             df['Date'] = pd.to_datetime(df['Date'])
             print(f"✅ Successfully loaded {len(df)} transactions")
@@ -69,10 +80,53 @@ def load_transactions(user_id=1):
         
     except Exception as e:
         print(f"❌ Database error: {e}")
+        if raise_errors:
+            raise
         import traceback
         traceback.print_exc()
         return pd.DataFrame()
 
+def iter_transactions(user_id=1, chunksize=10000):
+    """
+    Stream a user's transactions from the database in DataFrame chunks.
+    
+    Uses a server-side cursor where the driver supports it, so only one
+    chunk is held in memory at a time. Yields nothing if the database is
+    unavailable.
+    """
+    engine = get_engine()
+    if not engine:
+        print("❌ No database connection")
+        return
+    
+    query = """
+        SELECT date, type, category, source, amount, description
+        FROM transactions
+        WHERE user_id = :user_id
+        ORDER BY date DESC
+    """
+    
+    with engine.connect().execution_options(stream_results=True) as conn:
+        for chunk in pd.read_sql_query(text(query), conn, params={"user_id": user_id}, chunksize=chunksize):
+            chunk = chunk.rename(columns=COLUMN_NAMES)
+            chunk['Date'] = pd.to_datetime(chunk['Date'])
+            yield chunk
+
+def load_user_ids():
+    """List the ids of all registered users"""
+    engine = get_engine()
+    if not engine:
+        print("❌ No database connection")
+        return []
+    
+    try:
+        with engine.connect() as conn:
+            result = conn.execute(text("SELECT id FROM users ORDER BY id"))
+            return [row[0] for row in result]
+    except Exception as e:
+        print(f"❌ Database error: {e}")
+        return []
+
 def save_transaction(user_id, date, trans_type, category, source, amount, description=""):
     """Save a single transaction"""
     engine = get_engine()
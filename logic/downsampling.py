@@ -0,0 +1,105 @@
+"""
+Downsampling Module
+Reduce long series to a point budget before they are charted.
+
+Largest-Triangle-Three-Buckets (LTTB) keeps the points that preserve the
+visual shape of a line; min/max bucketing keeps every bucket's extremes,
+which suits jagged series where spikes must stay visible.
+"""
+import numpy as np
+
+
+def _numeric_x(x) -> np.ndarray:
+    """x as float64 offsets (datetimes as nanoseconds), or positions for other types."""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype("datetime64[ns]").view("int64")
+    elif not np.issubdtype(x.dtype, np.number):
+        return np.arange(len(x), dtype="float64")
+    x = x.astype("float64")
+    return x - x[0] if len(x) else x
+
+
+def lttb_indices(x, y, max_points: int) -> np.ndarray:
+    """
+    Indices of the points LTTB keeps (first and last point always included).
+
+    Args:
+        x: Sorted x values (numbers or datetimes)
+        y: y values
+        max_points: Number of points to keep
+
+    Returns:
+        Sorted integer index array of at most max_points entries
+    """
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    x = _numeric_x(x)
+    y = np.asarray(y, dtype="float64")
+
+    # max_points - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    kept = np.empty(max_points, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+
+    a = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        # Twice the triangle area (a, candidate, next bucket average)
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        kept[i + 1] = a
+    return kept
+
+
+def minmax_indices(y, max_points: int) -> np.ndarray:
+    """
+    Indices of the minimum and maximum of each bucket, plus the end points.
+
+    Args:
+        y: y values
+        max_points: Upper bound on the number of points kept
+
+    Returns:
+        Sorted integer index array
+    """
+    n = len(y)
+    buckets = (max_points - 2) // 2
+    if max_points >= n or buckets < 1:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype="float64")
+    starts = np.linspace(0, n, buckets, endpoint=False).astype(np.int64)
+    ids = np.repeat(np.arange(buckets), np.diff(np.append(starts, n)))
+    order = np.lexsort((y, ids))  # by bucket, then by value
+    bucket_ends = np.append(starts[1:], n) - 1
+    kept = np.concatenate([order[starts], order[bucket_ends], [0, n - 1]])
+    return np.unique(kept)
+
+
+def downsample(x, y, max_points: int, method: str = "lttb") -> np.ndarray:
+    """
+    Indices of the points to chart so at most max_points are kept.
+
+    Args:
+        x: Sorted x values
+        y: y values
+        max_points: Point budget
+        method: "lttb" or "minmax"
+
+    Returns:
+        Sorted integer index array
+    """
+    if method == "lttb":
+        return lttb_indices(x, y, max_points)
+    if method == "minmax":
+        return minmax_indices(y, max_points)
+    raise ValueError(f"Unknown downsampling method: {method} (expected 'lttb' or 'minmax')")
@@ -0,0 +1,124 @@
+"""
+Export Module
+Writes transactions to CSV, Excel (XLSX) or Parquet download buffers.
+
+Rows are consumed as an iterator of DataFrame chunks - slices of a cached
+frame or batches streamed from the database - and each chunk is written
+straight to the output, so memory stays bounded by the chunk size rather
+than the length of the history.
+"""
+import io
+from typing import Iterable, Iterator
+
+import pandas as pd
+
+EXPORT_COLUMNS = ["Date", "Type", "Category", "Source", "Amount", "Description"]
+
+# format -> (label, mime type, file extension)
+EXPORT_FORMATS = {
+    "csv": ("CSV", "text/csv", "csv"),
+    "xlsx": ("Excel", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx"),
+    "parquet": ("Parquet", "application/vnd.apache.parquet", "parquet"),
+}
+
+DEFAULT_CHUNK_ROWS = 10_000
+
+
+def iter_frame_chunks(df: pd.DataFrame, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Yield consecutive row slices of an in-memory frame (views, not copies)."""
+    for offset in range(0, len(df), chunk_rows):
+        yield df.iloc[offset:offset + chunk_rows]
+
+
+def _normalize(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Keep export columns in a fixed order with stable dtypes."""
+    chunk = chunk.reindex(columns=EXPORT_COLUMNS)
+    return chunk.assign(
+        Date=pd.to_datetime(chunk["Date"]),
+        Amount=pd.to_numeric(chunk["Amount"], errors="coerce").astype("float64"),
+        **{col: chunk[col].astype("string") for col in ("Type", "Category", "Source", "Description")}
+    )
+
+
+def _write_csv(chunks: Iterable[pd.DataFrame], buf: io.BytesIO):
+    text = io.TextIOWrapper(buf, encoding="utf-8", newline="")
+    header = True
+    for chunk in chunks:
+        _normalize(chunk).to_csv(text, header=header, index=False, date_format="%Y-%m-%d")
+        header = False
+    if header:
+        text.write(",".join(EXPORT_COLUMNS) + "\n")
+    text.flush()
+    text.detach()
+
+
+def _write_xlsx(chunks: Iterable[pd.DataFrame], buf: io.BytesIO):
+    try:
+        from openpyxl import Workbook
+    except ImportError as e:
+        raise ImportError("Excel export requires openpyxl (pip install openpyxl)") from e
+
+    # Write-only workbooks stream rows to the file instead of keeping cell objects
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Transactions")
+    sheet.append(EXPORT_COLUMNS)
+    for chunk in chunks:
+        chunk = _normalize(chunk).astype(object).where(lambda c: c.notna(), None)
+        chunk["Date"] = chunk["Date"].map(lambda d: d.date() if d is not None else None)
+        for row in chunk.itertuples(index=False, name=None):
+            sheet.append(row)
+    workbook.save(buf)
+
+
+def _write_parquet(chunks: Iterable[pd.DataFrame], buf: io.BytesIO):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)") from e
+
+    schema = pa.schema([
+        ("Date", pa.timestamp("ms")),
+        ("Type", pa.string()),
+        ("Category", pa.string()),
+        ("Source", pa.string()),
+        ("Amount", pa.float64()),
+        ("Description", pa.string()),
+    ])
+    # One row group per chunk
+    with pq.ParquetWriter(buf, schema, compression="snappy") as writer:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(_normalize(chunk), schema=schema, preserve_index=False, safe=False)
+            writer.write_table(table)
+
+
+_WRITERS = {
+    "csv": _write_csv,
+    "xlsx": _write_xlsx,
+    "parquet": _write_parquet,
+}
+
+
+def export_transactions(chunks: Iterable[pd.DataFrame], fmt: str = "csv") -> io.BytesIO:
+    """
+    Write transaction chunks to an in-memory file.
+
+    Args:
+        chunks: Iterable of transaction DataFrames (see iter_frame_chunks and
+                logic.database.iter_transactions)
+        fmt: "csv", "xlsx" or "parquet"
+
+    Returns:
+        BytesIO positioned at the start of the file
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    buf = io.BytesIO()
+    _WRITERS[fmt](chunks, buf)
+    buf.seek(0)
+    return buf
+
+
+def export_frame(df: pd.DataFrame, fmt: str = "csv", chunk_rows: int = DEFAULT_CHUNK_ROWS) -> io.BytesIO:
+    """Export an in-memory (e.g. filtered) frame chunk by chunk."""
+    return export_transactions(iter_frame_chunks(df, chunk_rows), fmt)
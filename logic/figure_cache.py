@@ -0,0 +1,59 @@
+"""
+Figure Cache Module
+Process-level cache of built chart figures, stored as plotly JSON.
+
+Figures are keyed by (chart name, data version, filter state). Data
+versions only increase and are never reused, so an entry can never go
+stale; old ones simply age out of the LRU. Entries are immutable strings,
+so sharing them between reruns and sessions is safe.
+"""
+import threading
+from collections import OrderedDict
+
+
+class FigureCache:
+    """Small thread-safe LRU of serialized figures."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """
+        Return the value cached under key, calling build() on a miss.
+
+        Args:
+            key: Hashable (chart name, data version, *filter state)
+            build: Zero-argument callable returning the figure JSON
+
+        Returns:
+            The cached or newly built figure JSON
+        """
+        with self._lock:
+            figure = self._entries.get(key)
+            if figure is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return figure
+            self.misses += 1
+
+        figure = build()
+        with self._lock:
+            self._entries[key] = figure
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Process-wide cache shared by all sessions
+figure_cache = FigureCache()
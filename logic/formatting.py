@@ -0,0 +1,54 @@
+"""
+Formatting Module
+Vectorized amount labels for tables and chart text, and picking the rows a
+table actually shows before anything gets formatted.
+
+Formatting is done on whole arrays (and only on the visible slice of a
+table), so display cost follows what is on screen rather than the size of
+the ledger.
+"""
+import numpy as np
+import pandas as pd
+
+# Insert a separator before every group of three digits, right to left
+_THOUSANDS = r"\B(?=(\d{3})+(?!\d))"
+
+
+def format_amounts(values, suffix: str = "") -> np.ndarray:
+    """
+    Format amounts as whole numbers with thousands separators.
+
+    Vectorized equivalent of f"{x:,.0f}{suffix}" for every element.
+
+    Args:
+        values: Array-like of numbers
+        suffix: Text appended to every label (e.g. " EGP")
+
+    Returns:
+        numpy object array of labels, positionally aligned with values
+    """
+    rounded = np.rint(np.asarray(values, dtype="float64"))
+    digits = pd.Series(np.abs(rounded).astype(np.int64), dtype="int64").astype(str)
+    digits = digits.str.replace(_THOUSANDS, ",", regex=True)
+    signs = pd.Series(np.where(rounded < 0, "-", ""), dtype="object")
+    return (signs + digits + suffix).to_numpy(dtype=object)
+
+
+def latest_rows(df: pd.DataFrame, limit=None, date_col: str = "Date") -> pd.DataFrame:
+    """
+    Newest rows of a frame, newest first.
+
+    With a limit only the top `limit` rows are selected (a partial sort),
+    without one the whole frame is sorted.
+
+    Args:
+        df: Frame with a datetime column
+        limit: Maximum number of rows to return (None for all)
+        date_col: Column to order by
+
+    Returns:
+        DataFrame
+    """
+    if limit is None:
+        return df.sort_values(date_col, ascending=False, kind="stable")
+    return df.nlargest(limit, date_col)
@@ -1,5 +1,9 @@
+import numpy as np
 import pandas as pd
 
+from logic.metrics import instrument
+
+@instrument()
 def calculate_kpis(df: pd.DataFrame):
     """
     Calculate headline KPIs from the dataframe.
@@ -15,10 +19,8 @@ def calculate_kpis(df: pd.DataFrame):
             "investments_value": 0.0
         }
         
-    # 1. Income & Expenses (Cash Flow)
-    income = df[df["Type"] == "Income"]["Amount"].sum()
-    expenses = df[df["Type"] == "Expense"]["Amount"].sum()
-    net = income - expenses
+    # 1. Income & Expenses (Cash Flow): one groupby for every type total
+    type_totals = df.groupby("Type")["Amount"].sum()
     
     # 2. Balances (Calculated from inflows/outflows per source)
     # We need to consider Transfer logic if implemented. 
@@ -50,13 +52,28 @@ def calculate_kpis(df: pd.DataFrame):
     
     # NOTE: "Investment" type reduces cash in wallet/bank, but increases "Investment Portfolio".
     
-    df_calc = df.copy()
-    df_calc['signed_amount'] = df_calc.apply(
-        lambda row: row['Amount'] if row['Type'] == 'Income' else -row['Amount'], axis=1
+    signed_amount = pd.Series(
+        np.where(df["Type"] == "Income", df["Amount"], -df["Amount"]), index=df.index
     )
     
     # Group by Source to get balances
-    source_balances = df_calc.groupby("Source")["signed_amount"].sum()
+    source_balances = signed_amount.groupby(df["Source"]).sum()
+    
+    return kpis_from_aggregates(type_totals, source_balances)
+
+
+@instrument()
+def kpis_from_aggregates(type_totals, source_balances: pd.Series):
+    """
+    Build the KPI dictionary from precomputed aggregates.
+    
+    Args:
+        type_totals: Mapping (or Series) of Type -> summed Amount
+        source_balances: Series of Source -> net signed amount
+    """
+    income = type_totals.get("Income", 0.0)
+    expenses = type_totals.get("Expense", 0.0)
+    net = income - expenses
     
     # Define groups
     wallets = ["Vodafone Cash", "InstaPay", "Wallet"]
@@ -70,7 +87,7 @@ def calculate_kpis(df: pd.DataFrame):
     # 3. Investment Value
     # Sum of all 'Investment' type transactions (Cost basis)
     # Ideally user updates this with current market value, but for now sum of invested capital is a good start.
-    invested_capital = df[df["Type"] == "Investment"]["Amount"].sum()
+    invested_capital = type_totals.get("Investment", 0.0)
     
     return {
         "total_income": income,
@@ -0,0 +1,62 @@
+"""
+Ledger Module
+Row-level edits of in-memory transaction frames.
+
+Used to apply a saved transaction to cached frames without reloading them:
+every function returns a new frame and leaves its inputs untouched.
+"""
+import pandas as pd
+
+
+def make_row(df: pd.DataFrame, date, trans_type, category, source, amount, description="") -> pd.DataFrame:
+    """
+    Build a one-row frame shaped like `df` for a new transaction.
+
+    The row gets the next free index label of `df`, so it keeps a unique
+    label in every frame derived from the ledger.
+    """
+    label = int(df.index.max()) + 1 if len(df) else 0
+    row = pd.DataFrame({
+        "Date": [pd.Timestamp(date)],
+        "Type": [trans_type],
+        "Category": [category],
+        "Source": [source],
+        "Amount": [float(amount)],
+        "Description": [description],
+    }, index=[label])
+    if "Date" in df.columns:
+        row["Date"] = row["Date"].astype(df["Date"].dtype)
+    return row.reindex(columns=df.columns) if len(df.columns) else row
+
+
+def _concat(parts) -> pd.DataFrame:
+    parts = [part for part in parts if not part.empty]
+    return pd.concat(parts) if len(parts) > 1 else parts[0].copy()
+
+
+def insert_newest_first(frame: pd.DataFrame, row: pd.DataFrame) -> pd.DataFrame:
+    """Insert a row into a frame ordered newest first, ahead of rows on the same date."""
+    position = int((frame["Date"] > row["Date"].iloc[0]).sum())
+    return _concat([frame.iloc[:position], row, frame.iloc[position:]])
+
+
+def insert_by_date(frame: pd.DataFrame, row: pd.DataFrame, value_col: str, running_col: str) -> pd.DataFrame:
+    """
+    Insert a row into a frame sorted oldest first that carries a running total.
+
+    The row goes ahead of rows on the same date, and the running total of
+    every later row is shifted by the row's value.
+
+    Args:
+        frame: Rows sorted by Date with running_col = cumulative sum of value_col
+        row: One-row frame (without running_col)
+        value_col: Column being accumulated
+        running_col: Running total column
+    """
+    value = float(row[value_col].iloc[0])
+    position = int((frame["Date"] < row["Date"].iloc[0]).sum())
+    before, after = frame.iloc[:position], frame.iloc[position:]
+    start = float(before[running_col].iloc[-1]) if position else 0.0
+    row = row.assign(**{running_col: start + value})
+    after = after.assign(**{running_col: after[running_col] + value})
+    return _concat([before, row, after])
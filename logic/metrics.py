@@ -0,0 +1,245 @@
+"""
+Metrics Module
+Call counters and latency histograms for the analytics hot paths.
+
+Functions decorated with @instrument() count calls, errors, rows in (the
+first DataFrame/Series argument) and rows out (a DataFrame/Series result,
+or the first element of a tuple result), and record their duration in a
+histogram. Metrics are collected only when FINANCE_METRICS is set (or
+after enable()); otherwise an instrumented call costs one flag check.
+observe() records durations measured elsewhere, such as the stages of a
+PDF report ("report_generator.stage.<stage>").
+
+Export with to_prometheus() / to_json(), or set FINANCE_METRICS_FILE to
+have them written periodically (every FINANCE_METRICS_INTERVAL seconds,
+default 60) and at exit:
+    *.prom   Prometheus text format (e.g. for the node_exporter textfile collector)
+    *.jsonl  one JSON snapshot appended per write
+    other    JSON snapshot, overwritten
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from functools import wraps
+from typing import Optional
+
+import pandas as pd
+
+# Histogram bucket upper bounds in seconds (Prometheus "le" labels)
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_enabled = os.environ.get("FINANCE_METRICS", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _row_count(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value)
+    if isinstance(value, tuple) and value:
+        return _row_count(value[0])
+    return None
+
+
+class FunctionMetrics:
+    """Counters and duration histogram of one instrumented function."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows_in = 0
+        self.rows_out = 0
+        self.duration_sum = 0.0
+        self.buckets = [0] * (len(DURATION_BUCKETS) + 1)  # last bucket is +Inf
+
+    def record(self, duration, rows_in, rows_out, failed):
+        self.calls += 1
+        self.errors += failed
+        self.rows_in += rows_in or 0
+        self.rows_out += rows_out or 0
+        self.duration_sum += duration
+        self.buckets[bisect_left(DURATION_BUCKETS, duration)] += 1
+
+    def cumulative_buckets(self):
+        counts, total = [], 0
+        for count in self.buckets:
+            total += count
+            counts.append(total)
+        return counts
+
+    def snapshot(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "duration_sum_s": self.duration_sum,
+            "duration_mean_s": self.duration_sum / self.calls if self.calls else 0.0,
+            "duration_buckets": dict(zip(
+                [str(b) for b in DURATION_BUCKETS] + ["+Inf"], self.cumulative_buckets()
+            )),
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe collection of per-function metrics."""
+
+    def __init__(self):
+        self._functions = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, duration, rows_in=None, rows_out=None, failed=False):
+        with self._lock:
+            metrics = self._functions.get(name)
+            if metrics is None:
+                metrics = self._functions[name] = FunctionMetrics()
+            metrics.record(duration, rows_in, rows_out, failed)
+
+    def snapshot(self):
+        """Plain-dict copy of every function's metrics."""
+        with self._lock:
+            return {name: m.snapshot() for name, m in sorted(self._functions.items())}
+
+    def to_prometheus(self, prefix="finance"):
+        """Metrics in the Prometheus text exposition format."""
+        with self._lock:
+            functions = sorted(self._functions.items())
+            lines = []
+            for metric, help_text, attr in (
+                ("calls_total", "Calls of instrumented functions.", "calls"),
+                ("errors_total", "Calls that raised an exception.", "errors"),
+                ("rows_in_total", "Rows passed in to instrumented functions.", "rows_in"),
+                ("rows_out_total", "Rows returned by instrumented functions.", "rows_out"),
+            ):
+                lines.append(f"# HELP {prefix}_function_{metric} {help_text}")
+                lines.append(f"# TYPE {prefix}_function_{metric} counter")
+                for name, m in functions:
+                    lines.append(f'{prefix}_function_{metric}{{function="{name}"}} {getattr(m, attr)}')
+
+            histogram = f"{prefix}_function_duration_seconds"
+            lines.append(f"# HELP {histogram} Duration of instrumented function calls.")
+            lines.append(f"# TYPE {histogram} histogram")
+            for name, m in functions:
+                bounds = [repr(b) for b in DURATION_BUCKETS] + ["+Inf"]
+                for bound, count in zip(bounds, m.cumulative_buckets()):
+                    lines.append(f'{histogram}_bucket{{function="{name}",le="{bound}"}} {count}')
+                lines.append(f'{histogram}_sum{{function="{name}"}} {m.duration_sum!r}')
+                lines.append(f'{histogram}_count{{function="{name}"}} {m.calls}')
+        return "\n".join(lines) + "\n"
+
+    def to_json(self):
+        """Snapshot as a JSON document with its export time."""
+        return json.dumps({
+            "exported_at": datetime.now().isoformat(timespec="seconds"),
+            "functions": self.snapshot(),
+        })
+
+    def write(self, path):
+        """
+        Write metrics to a file, in the format given by its extension.
+
+        Args:
+            path: *.prom (Prometheus text), *.jsonl (appended snapshot) or JSON file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if path.endswith(".jsonl"):
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(self.to_json() + "\n")
+            return
+        text = self.to_prometheus() if path.endswith(".prom") else self.to_json()
+        # Replace atomically so collectors never read a partial file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def clear(self):
+        with self._lock:
+            self._functions.clear()
+
+
+# Process-wide registry
+registry = MetricsRegistry()
+
+
+def enable():
+    """Start collecting metrics."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop collecting metrics (recorded values are kept)."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def instrument(name: Optional[str] = None):
+    """
+    Decorator: record calls, rows and duration of a function.
+
+    Args:
+        name: Metric label (default: "<module>.<function>", e.g. "kpis.calculate_kpis")
+    """
+    def decorator(func):
+        label = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            rows_in = _row_count(args[0]) if args else None
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                registry.record(label, time.perf_counter() - start, rows_in, failed=True)
+                raise
+            registry.record(label, time.perf_counter() - start, rows_in, _row_count(result))
+            return result
+        return wrapper
+    return decorator
+
+
+def observe(name: str, seconds: float):
+    """Record a duration measured by the caller (no-op while disabled)."""
+    if _enabled:
+        registry.record(name, seconds)
+
+
+def to_prometheus():
+    return registry.to_prometheus()
+
+
+def to_json():
+    return registry.to_json()
+
+
+def _export_loop(path, interval):
+    while True:
+        time.sleep(interval)
+        try:
+            registry.write(path)
+        except OSError as e:
+            print(f"❌ Could not write metrics to {path}: {e}")
+
+
+def _start_file_export():
+    path = os.environ.get("FINANCE_METRICS_FILE")
+    if not (_enabled and path):
+        return
+    interval = float(os.environ.get("FINANCE_METRICS_INTERVAL", "60"))
+    threading.Thread(target=_export_loop, args=(path, interval), name="metrics-export", daemon=True).start()
+    atexit.register(registry.write, path)
+    print(f"📈 Exporting metrics to {path} every {interval:g}s")
+
+
+_start_file_export()
@@ -0,0 +1,216 @@
+"""
+Periods Module
+Resolves report periods and slices transactions by date range.
+
+A period is either calendar aligned (week, month, quarter, year - to date
+or a specific past one), a rolling window of N days, or any custom
+start/end. Filtering works on datetime64 values of a date-sorted frame, so
+slicing is a binary search instead of a per-row comparison.
+"""
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+PERIOD_TYPES = ("weekly", "monthly", "quarterly", "yearly", "rolling", "custom")
+
+PERIOD_LABELS = {
+    "weekly": "Last 7 Days",
+    "monthly": "Current Month to Date",
+    "quarterly": "Current Quarter to Date",
+    "yearly": "Current Year to Date",
+}
+
+# Calendar step (in months) used to find the previous period of aligned types
+_CALENDAR_MONTHS = {"monthly": 1, "quarterly": 3, "yearly": 12}
+
+
+@dataclass(frozen=True)
+class Period:
+    """An inclusive date range with its display names."""
+    period_type: str
+    start: date
+    end: date
+    name: str
+    label: str
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days + 1
+
+    def previous(self) -> "Period":
+        """
+        The period immediately before this one.
+
+        Calendar periods step back one calendar unit: a complete unit maps to
+        the whole previous unit (Feb 1-28 -> Jan 1-31), a unit to date to the
+        same span of the previous unit, never past its end (Mar 1-31 to date
+        -> Feb 1-28). Other periods step back by their length.
+        """
+        months = _CALENDAR_MONTHS.get(self.period_type)
+        if months:
+            offset = pd.DateOffset(months=months)
+            start = (pd.Timestamp(self.start) - offset).date()
+            if self.end == (pd.Timestamp(self.start) + offset).date() - timedelta(days=1):
+                end = self.start - timedelta(days=1)
+            else:
+                unit_end = pd.Timestamp(start) + pd.offsets.MonthEnd(months)
+                end = min(pd.Timestamp(self.end) - offset, unit_end).date()
+        else:
+            start = self.start - timedelta(days=self.days)
+            end = self.start - timedelta(days=1)
+        return replace(self, start=start, end=end, name=f"Previous {self.name}", label="Previous Period")
+
+
+def resolve_period(period_type: str = "weekly",
+                   start: Optional[date] = None,
+                   end: Optional[date] = None,
+                   days: Optional[int] = None,
+                   year: Optional[int] = None,
+                   quarter: Optional[int] = None,
+                   month: Optional[int] = None,
+                   today: Optional[date] = None) -> Period:
+    """
+    Build a Period.
+
+    Args:
+        period_type: "weekly", "monthly", "quarterly", "yearly", "rolling" or "custom"
+        start, end: Bounds of a "custom" period (inclusive)
+        days: Length of a "rolling" period ending today
+        year, quarter, month: Select a specific past month/quarter/year instead
+                              of the current one to date
+        today: Reference date (defaults to the current date)
+
+    Returns:
+        Period
+    """
+    today = today or datetime.now().date()
+
+    if period_type == "custom":
+        if start is None or end is None:
+            raise ValueError("A custom period needs both start and end")
+        start, end = pd.Timestamp(start).date(), pd.Timestamp(end).date()
+        if start > end:
+            start, end = end, start
+        return Period("custom", start, end,
+                      f"Custom Report ({start.strftime('%d %b %Y')} - {end.strftime('%d %b %Y')})",
+                      "Custom Period")
+
+    if period_type == "rolling":
+        days = int(days or 30)
+        return Period("rolling", today - timedelta(days=days - 1), today,
+                      f"Rolling Report (Last {days} Days)", f"Last {days} Days")
+
+    if period_type == "weekly":
+        # Last 7 days
+        return Period("weekly", today - timedelta(days=7), today,
+                      "Weekly Report (Last 7 Days)", PERIOD_LABELS["weekly"])
+
+    if period_type == "quarterly":
+        if year and quarter:
+            start = date(year, 3 * (quarter - 1) + 1, 1)
+            end = (pd.Timestamp(start) + pd.offsets.QuarterEnd(0)).date()
+            return Period("quarterly", start, end, f"Quarterly Report (Q{quarter} {year})", f"Q{quarter} {year}")
+        quarter = (today.month - 1) // 3 + 1
+        return Period("quarterly", today.replace(month=3 * (quarter - 1) + 1, day=1), today,
+                      f"Quarterly Report (Q{quarter} {today.year})", PERIOD_LABELS["quarterly"])
+
+    if period_type == "yearly":
+        if year:
+            return Period("yearly", date(year, 1, 1), date(year, 12, 31), f"Yearly Report ({year})", str(year))
+        return Period("yearly", today.replace(month=1, day=1), today,
+                      f"Yearly Report ({today.year})", PERIOD_LABELS["yearly"])
+
+    # monthly
+    if year and month:
+        start = date(year, month, 1)
+        end = (pd.Timestamp(start) + pd.offsets.MonthEnd(0)).date()
+        return Period("monthly", start, end, f"Monthly Report ({start.strftime('%B %Y')})", start.strftime('%B %Y'))
+    return Period("monthly", today.replace(day=1), today,
+                  f"Monthly Report ({today.strftime('%B %Y')})", PERIOD_LABELS["monthly"])
+
+
+def sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return df ordered by ascending Date with a datetime64 Date column.
+
+    Frames loaded from the database come newest first, which is reversed in
+    O(n) instead of being re-sorted.
+    """
+    if df.empty:
+        return df
+    if not pd.api.types.is_datetime64_any_dtype(df["Date"]):
+        df = df.assign(Date=pd.to_datetime(df["Date"]))
+    dates = df["Date"]
+    if dates.is_monotonic_increasing:
+        return df
+    if dates.is_monotonic_decreasing:
+        return df.iloc[::-1]
+    return df.sort_values("Date", kind="stable")
+
+
+def _day_bounds(sorted_dates: pd.Series, start: date, end: date):
+    """Positions of [start, end] (whole days, inclusive) in sorted dates."""
+    lo, hi = sorted_dates.searchsorted(
+        [pd.Timestamp(start), pd.Timestamp(end) + pd.Timedelta(days=1)], side="left"
+    )
+    return int(lo), int(hi)
+
+
+def filter_period(df: pd.DataFrame, start: date, end: date) -> pd.DataFrame:
+    """
+    Transactions dated within [start, end], inclusive of whole days.
+
+    Args:
+        df: Transaction dataframe (any order)
+        start, end: Period bounds
+
+    Returns:
+        Date-sorted copy of the matching rows
+    """
+    if df.empty:
+        return df.copy()
+    ordered = sort_by_date(df)
+    lo, hi = _day_bounds(ordered["Date"], start, end)
+    return ordered.iloc[lo:hi].copy()
+
+
+def compare_periods(df: pd.DataFrame, period: Period, previous: Optional[Period] = None) -> pd.DataFrame:
+    """
+    Amount per Type for a period and the one before it, in a single pass.
+
+    Rows are labelled by binary search against the period boundaries and
+    aggregated with one groupby.
+
+    Returns:
+        DataFrame indexed by Type with "current" and "previous" columns
+        (plus a "count" row holding transaction counts)
+    """
+    previous = previous or period.previous()
+    result = pd.DataFrame(columns=["current", "previous"], dtype=float)
+    if df.empty:
+        result.loc["count"] = [0, 0]
+        return result
+
+    ordered = sort_by_date(df)
+    dates = ordered["Date"]
+    prev_lo, prev_hi = _day_bounds(dates, previous.start, previous.end)
+    cur_lo, cur_hi = _day_bounds(dates, period.start, period.end)
+
+    lo, hi = min(prev_lo, cur_lo), max(prev_hi, cur_hi)
+    window = ordered.iloc[lo:hi]
+    positions = np.arange(lo, hi)
+    labels = np.where(
+        (positions >= cur_lo) & (positions < cur_hi), "current",
+        np.where((positions >= prev_lo) & (positions < prev_hi), "previous", "")
+    )
+
+    grouped = window.groupby([labels, window["Type"].to_numpy()])["Amount"].agg(["sum", "count"])
+    totals = grouped["sum"].unstack(level=0)
+    counts = grouped["count"].groupby(level=0).sum()
+
+    result = totals.reindex(columns=["current", "previous"]).fillna(0.0)
+    result.loc["count"] = [counts.get("current", 0), counts.get("previous", 0)]
+    return result
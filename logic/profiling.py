@@ -0,0 +1,162 @@
+"""
+Profiling Module
+Opt-in timing of app reruns.
+
+A rerun profile collects nested, timed spans (data loading, database check,
+view rendering, chart builds, cache lookups). Without an active profile,
+span() returns a shared no-op context manager, so instrumented code costs
+one context variable lookup.
+
+Modes:
+    timers        spans only
+    cprofile      spans and a cProfile .prof file per rerun
+    pyinstrument  spans and a pyinstrument HTML report per rerun (if installed)
+
+Profiler output is written to FINANCE_PROFILE_DIR (default: profiles/).
+"""
+import contextvars
+import cProfile
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from functools import wraps
+from typing import Optional
+
+PROFILE_MODES = ("timers", "cprofile", "pyinstrument")
+PROFILE_DIR = os.environ.get("FINANCE_PROFILE_DIR", "profiles")
+
+_current = contextvars.ContextVar("rerun_profile", default=None)
+_NOOP = nullcontext()
+
+
+@dataclass(frozen=True)
+class Span:
+    """One timed section of a rerun."""
+    name: str
+    start: float  # seconds since the rerun started
+    duration: float  # seconds
+    depth: int  # nesting level, 0 for top-level spans
+
+
+class RerunProfile:
+    """Spans (and optionally a profiler) of one rerun."""
+
+    def __init__(self, mode: str = "timers", label: str = "rerun"):
+        self.mode = mode
+        self.label = label
+        self.spans = []
+        self.total = None  # seconds, set by finish_rerun
+        self.output_path = None  # profiler output file, if any
+        self._depth = 0
+        self._profiler = None
+        self._token = None
+        self._t0 = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str):
+        start = time.perf_counter()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.spans.append(Span(name, start - self._t0, time.perf_counter() - start, depth))
+
+    def waterfall(self):
+        """Spans in the order they started."""
+        return sorted(self.spans, key=lambda s: (s.start, s.depth))
+
+
+def resolve_mode(requested=None) -> Optional[str]:
+    """
+    Profiling mode from a request (e.g. a query parameter) or the
+    FINANCE_PROFILE environment variable; None when profiling is off.
+    """
+    value = (requested or os.environ.get("FINANCE_PROFILE") or "").strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return "timers"
+    return value if value in PROFILE_MODES else None
+
+
+def span(name: str):
+    """Time a block as part of the current rerun profile (no-op without one)."""
+    profile = _current.get()
+    return profile.span(name) if profile is not None else _NOOP
+
+
+def timed(name: Optional[str] = None):
+    """Decorator: time every call of a function as a span."""
+    def decorator(func):
+        label = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _start_profiler(mode):
+    if mode == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            print("⚠️ pyinstrument not installed - falling back to cProfile")
+        else:
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as e:
+        # Only one profiler can be active per interpreter
+        print(f"⚠️ Could not start cProfile: {e}")
+        return None
+    return profiler
+
+
+def _write_profiler_output(profile: RerunProfile):
+    profiler = profile._profiler
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    now = time.time()
+    stamp = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}.{int(now * 1000) % 1000:03d}"
+    stem = os.path.join(PROFILE_DIR, f"{stamp}-{profile.label}")
+    if isinstance(profiler, cProfile.Profile):
+        profiler.disable()
+        path = f"{stem}.prof"
+        profiler.dump_stats(path)
+    else:
+        profiler.stop()
+        path = f"{stem}.html"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(profiler.output_html())
+    return path
+
+
+def start_rerun(mode: str = "timers", label: str = "rerun") -> RerunProfile:
+    """Start profiling the current rerun; pair with finish_rerun."""
+    profile = RerunProfile(mode, label)
+    profile._token = _current.set(profile)
+    if mode in ("cprofile", "pyinstrument"):
+        profile._profiler = _start_profiler(mode)
+    return profile
+
+
+def finish_rerun(profile: RerunProfile) -> RerunProfile:
+    """Stop profiling a rerun, writing profiler output if one was running."""
+    profile.total = time.perf_counter() - profile._t0
+    if profile._token is not None:
+        _current.reset(profile._token)
+        profile._token = None
+    if profile._profiler is not None:
+        try:
+            profile.output_path = _write_profiler_output(profile)
+            print(f"⏱️ Profile written to {profile.output_path}")
+        except OSError as e:
+            print(f"❌ Could not write profile: {e}")
+        profile._profiler = None
+    return profile
@@ -0,0 +1,128 @@
+"""
+Report Cache Module
+Memoizes generated PDF reports per user, period, profile and data version.
+
+The data version of a report is a hash of the transactions inside its
+window (and the previous period it is compared with), so adding (or
+editing) a transaction that falls inside the window invalidates the cached PDF automatically, while changes outside it do not.
+"""
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from typing import Optional
+
+import pandas as pd
+
+from logic.chart_cache import fingerprint
+from logic.periods import Period, filter_period, resolve_period
+from logic.report_generator import generate_pdf_report
+from logic.report_profiles import get_report_profile
+
+REPORT_COLUMNS = ["Date", "Type", "Category", "Source", "Amount"]
+
+
+def report_data_version(period_df: pd.DataFrame) -> str:
+    """Version token for the transactions inside a report window."""
+    if period_df.empty:
+        return "empty"
+    columns = [c for c in REPORT_COLUMNS if c in period_df.columns]
+    return fingerprint(period_df[columns].reset_index(drop=True))
+
+
+class ReportCache:
+    """
+    LRU cache of PDF bytes with a time-to-live and a total size bound.
+
+    Thread safe; shared by every session in the process.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600, max_bytes: int = 64 * 1024 * 1024, max_entries: int = 64):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (created_at, pdf bytes)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return cached PDF bytes for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            created_at, pdf = entry
+            if time.monotonic() - created_at > self.ttl_seconds:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return pdf
+
+    def put(self, key, pdf: bytes):
+        """Store PDF bytes under key, evicting the least recently used entries."""
+        if len(pdf) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic(), pdf)
+            self._size += len(pdf)
+            while self._size > self.max_bytes or len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id):
+        """Forget every cached report of a user."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == user_id]:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _drop(self, key):
+        _, pdf = self._entries.pop(key)
+        self._size -= len(pdf)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Process-wide cache shared by all sessions
+report_cache = ReportCache()
+
+
+def get_pdf_report(df: pd.DataFrame, period_type: str = "weekly", user_id=1, progress=None,
+                   period: Optional[Period] = None, profile: Optional[str] = None) -> BytesIO:
+    """
+    Return the PDF report for a user and period, generating it only when the
+    transactions inside the report window changed since the last request.
+
+    Args:
+        df: Full transaction dataframe of the user
+        period_type: "weekly", "monthly", "quarterly" or "yearly"
+        user_id: Owner of the transactions
+        progress: Optional stage callback forwarded to generate_pdf_report
+        period: Explicit Period; overrides period_type
+        profile: Report profile name ("draft", "standard", "print")
+
+    Returns:
+        BytesIO object containing the PDF
+    """
+    period = period or resolve_period(period_type)
+    profile = get_report_profile(profile)
+    # The report also compares against the previous period, so both windows count
+    window_df = filter_period(df, period.previous().start, period.end)
+    key = (user_id, period.period_type, period.start, period.end, profile.name, report_data_version(window_df))
+
+    pdf = report_cache.get(key)
+    if pdf is None:
+        pdf = generate_pdf_report(
+            df, period_type=period.period_type, progress=progress, period=period, profile=profile
+        ).getvalue()
+        report_cache.put(key, pdf)
+    else:
+        print(f"📄 Serving cached {period_type} ({profile.name}) report for user_id={user_id}")
+
+    return BytesIO(pdf)
@@ -1,64 +1,54 @@
 """
 Report Generator Module
-Generates professional PDF reports for weekly and monthly financial summaries.
+Generates professional PDF reports for weekly, monthly, quarterly, yearly
+and custom-period financial summaries.
 """
+import multiprocessing
+import multiprocessing.util
+import os
+import threading
+import time
 import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
 from io import BytesIO
+from typing import Callable, Optional
 from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend for server environments
-import matplotlib.pyplot as plt
-import numpy as np
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, PageBreak, Image
+from reportlab.platypus.doctemplate import FrameActionFlowable
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from logic.chart_cache import chart_cache, chart_cache_key
+from logic.report_theme import get_report_theme
+from logic.periods import Period, compare_periods, filter_period, resolve_period
+from logic.report_profiles import get_report_profile
+from logic.metrics import instrument, observe
 
+# Bump whenever chart styling changes so cached images are not reused
+CHART_STYLE_VERSION = 1
 
-def get_period_data(df: pd.DataFrame, period_type: str = "weekly"):
+
+@instrument()
+def get_period_data(df: pd.DataFrame, period_type: str = "weekly", period: Optional[Period] = None):
     """
-    Filter data for the specified period (weekly or monthly).
+    Filter data for the specified period.
     
     Args:
         df: Transaction dataframe
-        period_type: "weekly" or "monthly"
+        period_type: "weekly", "monthly", "quarterly" or "yearly"
+        period: Explicit Period (see logic.periods.resolve_period); overrides period_type
         
     Returns:
         Filtered dataframe and period info (start_date, end_date)
     """
-    today = datetime.now().date()  # Get date only, not timestamp
-    
-    if period_type == "weekly":
-        # Last 7 days
-        start_date = today - timedelta(days=7)
-        period_name = "Weekly Report (Last 7 Days)"
-    else:  # monthly
-        # Current month from day 1 to today
-        start_date = today.replace(day=1)
-        period_name = f"Monthly Report ({datetime.now().strftime('%B %Y')})"
-    
-    end_date = today
-    
-    # Convert df Date to date only for comparison (remove time component)
-    df_copy = df.copy()
-    df_copy["Date"] = pd.to_datetime(df_copy["Date"]).dt.date
-    
-    # Filter dataframe
-    filtered_df = df_copy[
-        (df_copy["Date"] >= start_date) & 
-        (df_copy["Date"] <= end_date)
-    ].copy()
-    
-    # Convert back to datetime for charts compatibility
-    filtered_df["Date"] = pd.to_datetime(filtered_df["Date"])
-    
-    return filtered_df, start_date, end_date, period_name
+    period = period or resolve_period(period_type)
+    filtered_df = filter_period(df, period.start, period.end)
+    return filtered_df, period.start, period.end, period.name
 
 
+@instrument()
 def calculate_summary_stats(df: pd.DataFrame):
     """
     Calculate summary statistics for the report.
@@ -88,50 +78,137 @@ def calculate_summary_stats(df: pd.DataFrame):
     }
 
 
-def create_chart_image(df: pd.DataFrame, chart_type: str = "summary"):
+@instrument()
+def aggregate_chart_data(df: pd.DataFrame, chart_type: str = "summary"):
     """
-    Create chart using matplotlib and return as image bytes.
+    Reduce the period dataframe to the small aggregate a chart is drawn from.
     
     Args:
         df: Transaction dataframe
         chart_type: "summary", "category_breakdown", "daily_trend", "income_sources"
         
     Returns:
-        Image bytes
+        Aggregated series/dataframe, or None when there is no data at all
+    """
+    if df.empty:
+        return None
+    
+    if chart_type == "summary":
+        totals = df.groupby("Type")["Amount"].sum()
+        return pd.Series({
+            "Income": totals.get("Income", 0),
+            "Expenses": totals.get("Expense", 0),
+            "Investments": totals.get("Investment", 0)
+        })
+    
+    if chart_type == "income_sources":
+        return df[df["Type"] == "Income"].groupby("Category")["Amount"].sum().sort_values()
+    
+    if chart_type == "category_breakdown":
+        return df[df["Type"] == "Expense"].groupby("Category")["Amount"].sum().sort_values()
+    
+    if chart_type == "daily_trend":
+        return df.groupby([df["Date"].dt.date, "Type"])["Amount"].sum().reset_index()
+    
+    return None
+
+
+def _draw_placeholder(ax, message):
+    """Draw a centered grey message on an empty chart."""
+    ax.text(0.5, 0.5, message, 
+           ha='center', va='center', fontsize=16, color=get_report_theme().chart["muted"],
+           transform=ax.transAxes)
+    ax.axis('off')
+
+
+def _style_axes(ax, title, xlabel=None, ylabel=None, grid_axis='y'):
+    """Apply the report chart look: bold labels, dashed grid, light open spines."""
+    palette = get_report_theme().chart
+    if xlabel:
+        ax.set_xlabel(xlabel, fontsize=13, fontweight='bold', color=palette["text"])
+    if ylabel:
+        ax.set_ylabel(ylabel, fontsize=13, fontweight='bold', color=palette["text"])
+    ax.set_title(title, fontsize=17, fontweight='bold', pad=20, color=palette["text"])
+    ax.grid(axis=grid_axis, alpha=0.3, linestyle='--', linewidth=0.8)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_color(palette["axis"])
+    ax.spines['bottom'].set_color(palette["axis"])
+
+
+def _new_figure(figsize=(10, 5), dpi=150):
+    """
+    Create a standalone figure with its own Agg canvas.
+    
+    Nothing is registered with pyplot's global figure manager, so figures can
+    be built concurrently from any thread and are freed with the last reference.
+    """
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _chart_key(chart_type: str, data, profile) -> str:
+    return chart_cache_key(chart_type, data, CHART_STYLE_VERSION, profile.dpi, profile.chart_format)
+
+
+@instrument()
+def render_chart(chart_type: str, data, profile=None):
+    """
+    Render an aggregated chart input (see aggregate_chart_data) to image bytes.
+    
+    Thread safe: uses the object-oriented matplotlib API only. Successful
+    renders are memoized in the shared chart cache, keyed by the content of
+    the aggregate, so unchanged charts never reach matplotlib again.
+    
+    The report profile decides the output: PNG at the profile's dpi, or SVG
+    for vector profiles (when svglib is available to embed it).
+    """
+    profile = get_report_profile(profile)
+    cache_key = _chart_key(chart_type, data, profile)
+    cached = chart_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    image, rendered = _draw_chart(chart_type, data, profile)
+    if rendered:
+        chart_cache.put(cache_key, image)
+    return image
+
+
+def _draw_chart(chart_type: str, data, profile):
+    """
+    Draw one chart without touching the chart cache.
+    
+    Runs in chart pool worker processes as well as in-process, so it only
+    takes picklable inputs and returns plain bytes.
+    
+    Returns:
+        (image bytes, False when a failure placeholder was drawn instead)
     """
+    fmt = profile.chart_format
     try:
         buf = BytesIO()
         
         # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(10, 5), dpi=150)
-        fig.patch.set_facecolor('white')
-        ax.set_facecolor('white')
+        palette = get_report_theme().chart
+        fig = _new_figure(figsize=(10, 5), dpi=profile.dpi)
+        ax = fig.subplots()
+        fig.patch.set_facecolor(palette["background"])
+        ax.set_facecolor(palette["background"])
         
-        if df.empty:
+        if data is None:
             # Create empty placeholder
-            ax.text(0.5, 0.5, 'No data available', 
-                   ha='center', va='center', fontsize=16, color='#94a3b8',
-                   transform=ax.transAxes)
-            ax.axis('off')
+            _draw_placeholder(ax, 'No data available')
         
         elif chart_type == "summary":
             # Financial Summary bar chart
-            income = df[df["Type"] == "Income"]["Amount"].sum()
-            expenses = df[df["Type"] == "Expense"]["Amount"].sum()
-            investments = df[df["Type"] == "Investment"]["Amount"].sum()
+            categories = list(data.index)
+            values = list(data.values)
+            colors_list = [palette["Income"], palette["Expense"], palette["Investment"]]
             
-            categories = ['Income', 'Expenses', 'Investments']
-            values = [income, expenses, investments]
-            colors_list = ['#22c55e', '#ef4444', '#a855f7']
-            
-            bars = ax.bar(categories, values, color=colors_list, edgecolor='#1e293b', linewidth=2.5, width=0.6)
-            ax.set_ylabel('Amount (EGP)', fontsize=13, fontweight='bold', color='#1e293b')
-            ax.set_title('Financial Summary', fontsize=17, fontweight='bold', pad=20, color='#1e293b')
-            ax.grid(axis='y', alpha=0.3, linestyle='--', linewidth=0.8)
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color('#cbd5e1')
-            ax.spines['bottom'].set_color('#cbd5e1')
+            bars = ax.bar(categories, values, color=colors_list, edgecolor=palette["bar_edge"], linewidth=2.5, width=0.6)
+            _style_axes(ax, 'Financial Summary', ylabel='Amount (EGP)', grid_axis='y')
             
             # Add value labels on bars
             for bar, val in zip(bars, values):
@@ -139,143 +216,389 @@ def create_chart_image(df: pd.DataFrame, chart_type: str = "summary"):
                 if height > 0:
                     ax.text(bar.get_x() + bar.get_width()/2., height,
                            f'{val:,.0f} EGP', ha='center', va='bottom', 
-                           fontweight='bold', fontsize=11, color='#1e293b')
+                           fontweight='bold', fontsize=11, color=palette["text"])
         
-        elif chart_type == "income_sources":
-            # Income breakdown by category
-            income_df = df[df["Type"] == "Income"]
-            if not income_df.empty:
-                income_summary = income_df.groupby("Category")["Amount"].sum().sort_values().reset_index()
-                
-                bars = ax.barh(income_summary["Category"], income_summary["Amount"], 
-                       color='#22c55e', edgecolor='#059669', linewidth=2)
-                ax.set_xlabel('Amount (EGP)', fontsize=13, fontweight='bold', color='#1e293b')
-                ax.set_title('Income by Source', fontsize=17, fontweight='bold', pad=20, color='#1e293b')
-                ax.grid(axis='x', alpha=0.3, linestyle='--', linewidth=0.8)
-                ax.spines['top'].set_visible(False)
-                ax.spines['right'].set_visible(False)
-                ax.spines['left'].set_color('#cbd5e1')
-                ax.spines['bottom'].set_color('#cbd5e1')
-                
-                # Add value labels
-                for i, val in enumerate(income_summary["Amount"]):
-                    ax.text(val, i, f' {val:,.0f} EGP', va='center', 
-                           fontweight='bold', fontsize=10, color='#1e293b')
+        elif chart_type in ("income_sources", "category_breakdown"):
+            # Income by source / expenses by category
+            if chart_type == "income_sources":
+                color, edge, title, empty_message = palette["Income"], palette["income_edge"], 'Income by Source', 'No income data'
             else:
-                ax.text(0.5, 0.5, 'No income data', 
-                       ha='center', va='center', fontsize=16, color='#94a3b8',
-                       transform=ax.transAxes)
-                ax.axis('off')
-        
-        elif chart_type == "category_breakdown":
-            # Expenses by category
-            expenses_df = df[df["Type"] == "Expense"]
-            if not expenses_df.empty:
-                cat_summary = expenses_df.groupby("Category")["Amount"].sum().sort_values().reset_index()
-                
-                bars = ax.barh(cat_summary["Category"], cat_summary["Amount"],
-                       color='#ef4444', edgecolor='#b91c1c', linewidth=2)
-                ax.set_xlabel('Amount (EGP)', fontsize=13, fontweight='bold', color='#1e293b')
-                ax.set_title('Expense Breakdown', fontsize=17, fontweight='bold', pad=20, color='#1e293b')
-                ax.grid(axis='x', alpha=0.3, linestyle='--', linewidth=0.8)
-                ax.spines['top'].set_visible(False)
-                ax.spines['right'].set_visible(False)
-                ax.spines['left'].set_color('#cbd5e1')
-                ax.spines['bottom'].set_color('#cbd5e1')
+                color, edge, title, empty_message = palette["Expense"], palette["expense_edge"], 'Expense Breakdown', 'No expense data'
+            
+            if not data.empty:
+                ax.barh(data.index, data.values, color=color, edgecolor=edge, linewidth=2)
+                _style_axes(ax, title, xlabel='Amount (EGP)', grid_axis='x')
                 
                 # Add value labels
-                for i, val in enumerate(cat_summary["Amount"]):
+                for i, val in enumerate(data.values):
                     ax.text(val, i, f' {val:,.0f} EGP', va='center', 
-                           fontweight='bold', fontsize=10, color='#1e293b')
+                           fontweight='bold', fontsize=10, color=palette["text"])
             else:
-                ax.text(0.5, 0.5, 'No expense data', 
-                       ha='center', va='center', fontsize=16, color='#94a3b8',
-                       transform=ax.transAxes)
-                ax.axis('off')
+                _draw_placeholder(ax, empty_message)
         
         elif chart_type == "daily_trend":
             # Daily transaction trend
-            if not df.empty:
-                daily = df.groupby([df["Date"].dt.date, "Type"])["Amount"].sum().reset_index()
-                
-                # Plot each transaction type
-                has_data = False
-                for txn_type, color, marker in [("Income", "#22c55e", "o"), 
-                                                 ("Expense", "#ef4444", "s"), 
-                                                 ("Investment", "#a855f7", "^")]:
-                    type_data = daily[daily["Type"] == txn_type]
-                    if not type_data.empty:
-                        ax.plot(type_data["Date"], type_data["Amount"], 
-                               marker=marker, linewidth=2.5, markersize=8,
-                               color=color, label=txn_type, markeredgecolor='white',
-                               markeredgewidth=1.5)
-                        has_data = True
-                
-                if has_data:
-                    ax.set_xlabel('Date', fontsize=13, fontweight='bold', color='#1e293b')
-                    ax.set_ylabel('Amount (EGP)', fontsize=13, fontweight='bold', color='#1e293b')
-                    ax.set_title('Daily Transaction Trend', fontsize=17, fontweight='bold', 
-                                pad=20, color='#1e293b')
-                    ax.legend(loc='upper left', framealpha=0.95, edgecolor='#cbd5e1')
-                    ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.8)
-                    ax.spines['top'].set_visible(False)
-                    ax.spines['right'].set_visible(False)
-                    ax.spines['left'].set_color('#cbd5e1')
-                    ax.spines['bottom'].set_color('#cbd5e1')
-                    plt.xticks(rotation=45, ha='right')
-                else:
-                    ax.text(0.5, 0.5, 'No transaction data', 
-                           ha='center', va='center', fontsize=16, color='#94a3b8',
-                           transform=ax.transAxes)
-                    ax.axis('off')
+            # Plot each transaction type
+            has_data = False
+            for txn_type in ("Income", "Expense", "Investment"):
+                type_data = data[data["Type"] == txn_type]
+                if not type_data.empty:
+                    ax.plot(type_data["Date"], type_data["Amount"], 
+                           marker=get_report_theme().chart_markers[txn_type], linewidth=2.5, markersize=8,
+                           color=palette[txn_type], label=txn_type, markeredgecolor='white',
+                           markeredgewidth=1.5)
+                    has_data = True
+            
+            if has_data:
+                _style_axes(ax, 'Daily Transaction Trend', xlabel='Date', ylabel='Amount (EGP)', grid_axis='both')
+                ax.legend(loc='upper left', framealpha=0.95, edgecolor=palette["axis"])
+                ax.tick_params(axis='x', labelrotation=45)
+                for label in ax.get_xticklabels():
+                    label.set_horizontalalignment('right')
             else:
-                ax.text(0.5, 0.5, 'No transaction data', 
-                       ha='center', va='center', fontsize=16, color='#94a3b8',
-                       transform=ax.transAxes)
-                ax.axis('off')
+                _draw_placeholder(ax, 'No transaction data')
         
-        plt.tight_layout()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+        fig.tight_layout()
+        fig.savefig(buf, format=fmt, dpi=profile.dpi, bbox_inches='tight', facecolor=palette["background"])
         
-        buf.seek(0)
-        return buf.getvalue()
+        return buf.getvalue(), True
         
     except Exception as e:
         print(f"Chart generation error: {e}")
         # Return error placeholder image
         try:
-            fig_empty, ax_empty = plt.subplots(figsize=(10, 5), dpi=100)
+            fig_empty = _new_figure(figsize=(10, 5), dpi=100)
+            ax_empty = fig_empty.subplots()
             ax_empty.text(0.5, 0.5, f'Chart generation failed\n{str(e)}', 
-                         ha='center', va='center', fontsize=12, color='#ef4444',
+                         ha='center', va='center', fontsize=12, color=get_report_theme().chart["error"],
                          transform=ax_empty.transAxes)
             ax_empty.axis('off')
             buf_empty = BytesIO()
-            plt.savefig(buf_empty, format='png', dpi=100, bbox_inches='tight', facecolor='white')
-            plt.close(fig_empty)
+            fig_empty.savefig(buf_empty, format='png', dpi=100, bbox_inches='tight', facecolor='white')
             buf_empty.seek(0)
-            return buf_empty.getvalue()
+            return buf_empty.getvalue(), False
         except:
             # Last resort: return minimal image
-            return b''
+            return b'', False
+
+
+@instrument()
+def calculate_period_comparison(df: pd.DataFrame, period: Period):
+    """
+    Summary statistics of a period and of the period before it, computed in
+    one pass over the ledger.
+    
+    Returns:
+        (current stats, previous stats) dictionaries shaped like calculate_summary_stats
+    """
+    comparison = compare_periods(df, period)
+    
+    def stats_for(column):
+        totals = comparison[column]
+        income = totals.get("Income", 0)
+        expenses = totals.get("Expense", 0)
+        return {
+            "total_income": income,
+            "total_expenses": expenses,
+            "total_investments": totals.get("Investment", 0),
+            "net_balance": income - expenses,  # Net = Income - Expenses only
+            "num_transactions": int(totals.get("count", 0))
+        }
+    
+    return stats_for("current"), stats_for("previous")
+
 
+def _format_change(current, previous):
+    """Relative change between two period values as a signed percentage."""
+    if not previous:
+        return "—"
+    return f"{(current - previous) / abs(previous) * 100:+.1f}%"
 
-def generate_pdf_report(df: pd.DataFrame, period_type: str = "weekly"):
+
+@instrument()
+def create_chart_image(df: pd.DataFrame, chart_type: str = "summary", profile=None):
+    """
+    Create chart using matplotlib and return as image bytes.
+    
+    Args:
+        df: Transaction dataframe
+        chart_type: "summary", "category_breakdown", "daily_trend", "income_sources"
+        profile: Report profile name or ReportProfile (default: "standard")
+        
+    Returns:
+        Image bytes (PNG, or SVG for vector profiles)
+    """
+    return render_chart(chart_type, aggregate_chart_data(df, chart_type), profile)
+
+
+# Shared worker pool for the chart stage (created on first report).
+# Agg rendering holds the GIL for most of its work, so charts are drawn in
+# worker processes; with a single worker they are drawn in the calling process.
+CHART_POOL_WORKERS = min(4, os.cpu_count() or 1)
+_chart_pool = None
+_chart_pool_lock = threading.Lock()
+
+
+def set_chart_pool_workers(max_workers: int):
+    """
+    Set the number of chart worker processes of this process.
+    
+    Used by the batch CLI, whose worker processes already run reports in
+    parallel: each process then draws its charts itself (1) or on one or two
+    helpers. A pool created with another size is replaced on the next report.
+    """
+    global CHART_POOL_WORKERS
+    with _chart_pool_lock:
+        CHART_POOL_WORKERS = max(1, int(max_workers))
+        if _chart_pool is not None and _chart_pool._max_workers != CHART_POOL_WORKERS:
+            _shutdown_chart_pool()
+
+
+def _shutdown_chart_pool():
+    global _chart_pool
+    _chart_pool.shutdown(wait=False, cancel_futures=True)
+    _chart_pool = None
+
+
+def _shutdown_chart_pool_at_exit():
+    # Worker processes (e.g. of the batch CLI) join their children on exit,
+    # so idle chart workers must be stopped first
+    with _chart_pool_lock:
+        if _chart_pool is not None:
+            _chart_pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _forget_chart_pool():
+    # A forked child cannot use its parent's pool: the pool's threads did not survive the fork
+    global _chart_pool, _chart_pool_lock
+    _chart_pool = None
+    _chart_pool_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_chart_pool)
+
+
+def _get_chart_pool():
+    """
+    Return the process pool shared by all sessions to render report charts,
+    or None when charts are drawn in the calling process.
+    
+    Workers are started with forkserver (spawn where unavailable): forking
+    the multi-threaded Streamlit server directly is not safe. The fork
+    server preloads this module, so workers start without re-importing
+    matplotlib and reportlab.
+    """
+    global _chart_pool
+    with _chart_pool_lock:
+        if _chart_pool is None and CHART_POOL_WORKERS > 1:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload([__name__])
+            else:
+                context = multiprocessing.get_context("spawn")
+            _chart_pool = ProcessPoolExecutor(max_workers=CHART_POOL_WORKERS, mp_context=context)
+            # Runs before multiprocessing closes queues (priority 10) and joins children on exit
+            multiprocessing.util.Finalize(None, _shutdown_chart_pool_at_exit, exitpriority=100)
+        return _chart_pool
+
+
+@instrument()
+def render_charts(chart_inputs: dict, profile=None):
+    """
+    Render several charts concurrently.
+    
+    Cached charts are answered in this process; the others are drawn in
+    parallel on the shared chart process pool, so the stage takes about as
+    long as its slowest chart. Inputs are small aggregates and results are
+    image bytes, so little data crosses the process boundary. Concurrent
+    reports from different sessions queue more work on the same pool.
+    
+    Args:
+        chart_inputs: {chart_type: aggregated data}
+        profile: Report profile name or ReportProfile
+        
+    Returns:
+        {chart_type: image bytes or the exception raised while rendering}
+    """
+    profile = get_report_profile(profile)
+    pool = _get_chart_pool()
+    images, pending = {}, {}
+    for chart_type, data in chart_inputs.items():
+        if pool is None:
+            try:
+                images[chart_type] = render_chart(chart_type, data, profile)
+            except Exception as e:
+                images[chart_type] = e
+            continue
+        cache_key = _chart_key(chart_type, data, profile)
+        cached = chart_cache.get(cache_key)
+        if cached is not None:
+            images[chart_type] = cached
+        else:
+            pending[chart_type] = cache_key
+    
+    futures = {}
+    try:
+        for chart_type in pending:
+            futures[chart_type] = pool.submit(_draw_chart, chart_type, chart_inputs[chart_type], profile)
+    except BrokenProcessPool:
+        pass  # the remaining charts are drawn in-process below
+    
+    for chart_type, cache_key in pending.items():
+        try:
+            if chart_type not in futures:
+                raise BrokenProcessPool("chart pool is not accepting work")
+            image, rendered = futures[chart_type].result()
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed for memory); draw here and start a new pool next time
+            with _chart_pool_lock:
+                if _chart_pool is pool:
+                    print(f"⚠️ Chart pool failed ({e}) - drawing charts in-process")
+                    _shutdown_chart_pool()
+            image, rendered = _draw_chart(chart_type, chart_inputs[chart_type], profile)
+        except Exception as e:
+            images[chart_type] = e
+            continue
+        if rendered:
+            chart_cache.put(cache_key, image)
+        images[chart_type] = image
+    return {chart_type: images[chart_type] for chart_type in chart_inputs}
+
+
+@instrument()
+def chart_flowable(image_bytes: bytes, width, height):
+    """
+    Wrap rendered chart bytes in a flowable of the given size.
+    
+    SVG charts become reportlab vector drawings (via svglib), PNG charts
+    become raster images.
+    """
+    if image_bytes.lstrip()[:5] in (b"<?xml", b"<svg "):
+        from svglib.svglib import svg2rlg
+        
+        drawing = svg2rlg(BytesIO(image_bytes))
+        scale = min(width / drawing.width, height / drawing.height)
+        drawing.width, drawing.height = drawing.width * scale, drawing.height * scale
+        drawing.scale(scale, scale)
+        return drawing
+    return Image(BytesIO(image_bytes), width=width, height=height)
+
+
+TXN_TABLE_HEADER = ["Date", "Type", "Category", "Amount (EGP)", "Source"]
+TXN_TABLE_COL_WIDTHS = [1.2*inch, 1*inch, 1.5*inch, 1.2*inch, 1.1*inch]
+TXN_TABLE_CHUNK_ROWS = 500
+
+
+@instrument()
+def format_transaction_rows(df: pd.DataFrame):
+    """
+    Format transactions as table rows using column-wise string operations.
+    
+    Returns:
+        List of [date, type, category, amount, source] rows
+    """
+    columns = [
+        df["Date"].dt.strftime("%Y-%m-%d"),
+        df["Type"].astype(str),
+        df["Category"].astype("string").str[:20].fillna("N/A"),
+        df["Amount"].map("{:,.0f}".format),
+        df["Source"].astype("string").str[:15].fillna("N/A"),
+    ]
+    return [list(row) for row in zip(*columns)]
+
+
+def _transaction_table(chunk: pd.DataFrame):
+    """One LongTable of transactions that repeats its header across pages."""
+    table = LongTable([TXN_TABLE_HEADER] + format_transaction_rows(chunk),
+                      colWidths=TXN_TABLE_COL_WIDTHS, repeatRows=1)
+    table.setStyle(get_report_theme().transaction_table)
+    return table
+
+
+class _LazyTransactionTables(FrameActionFlowable):
+    """
+    Placeholder that becomes the next transaction table when laid out.
+    
+    When the frame reaches it, it hands back the table of the next chunk
+    followed by a placeholder for the remaining rows, so only the chunk
+    being laid out is formatted and held as a table at any time.
+    """
+    
+    def __init__(self, ordered: pd.DataFrame, chunk_rows: int, offset: int = 0):
+        self._ordered = ordered
+        self._chunk_rows = chunk_rows
+        self._offset = offset
+    
+    def frameAction(self, frame):
+        end = self._offset + self._chunk_rows
+        content = [_transaction_table(self._ordered.iloc[self._offset:end])]
+        if end < len(self._ordered):
+            content.append(_LazyTransactionTables(self._ordered, self._chunk_rows, end))
+        frame.add_generated_content(*content)
+
+
+@instrument()
+def build_transaction_tables(df: pd.DataFrame, chunk_rows: int = TXN_TABLE_CHUNK_ROWS):
+    """
+    Build the "Transaction Details" section for a report story.
+    
+    Rows are split into chunks of chunk_rows, each laid out as a LongTable
+    that repeats its header across pages. Chunks are formatted lazily while
+    doc.build lays out the story, and each table is released once drawn, so
+    only one chunk of formatted rows is held at a time. Memory still grows
+    with the period: the sorted period frame and the PDF's own page data
+    scale with the number of transactions.
+    
+    Returns:
+        List of flowables (empty for an empty frame), newest transactions first
+    """
+    if df.empty:
+        return []
+    ordered = df.sort_values("Date", ascending=False)
+    return [_LazyTransactionTables(ordered, chunk_rows)]
+
+
+@instrument()
+def generate_pdf_report(df: pd.DataFrame, period_type: str = "weekly", timings: Optional[dict] = None,
+                        progress: Optional[Callable[[str], None]] = None, period: Optional[Period] = None,
+                        profile=None):
     """
     Generate a professional PDF report.
     
     Args:
         df: Full transaction dataframe
-        period_type: "weekly" or "monthly"
+        period_type: "weekly", "monthly", "quarterly" or "yearly"
+        timings: Optional dict filled with wall-clock seconds per stage
+                 ("aggregate", "charts", "layout", "total"); "charts" covers
+                 rendering only, which runs in parallel (see render_charts)
+        progress: Optional callback invoked with the name of each stage
+                  ("aggregate", "charts", "layout") as it starts
+        period: Explicit Period (custom range, rolling window, past quarter...);
+                overrides period_type
+        profile: Report profile name ("draft", "standard", "print") or
+                 ReportProfile controlling chart dpi, vector charts and
+                 PDF compression (default: "standard")
         
     Returns:
         BytesIO object containing the PDF
     """
+    if timings is None:
+        timings = {}
+    timings.update({"aggregate": 0.0, "charts": 0.0, "layout": 0.0})
+    report_start = time.perf_counter()
+    if progress is None:
+        progress = lambda stage: None
+    profile = get_report_profile(profile)
+    
     # Get period data
-    filtered_df, start_date, end_date, period_name = get_period_data(df, period_type)
+    progress("aggregate")
+    stage_start = time.perf_counter()
+    period = period or resolve_period(period_type)
+    filtered_df, start_date, end_date, period_name = get_period_data(df, period=period)
     
-    # Calculate statistics
-    stats = calculate_summary_stats(filtered_df)
+    # Calculate statistics for this period and the previous one
+    stats, previous_stats = calculate_period_comparison(df, period)
+    timings["aggregate"] = time.perf_counter() - stage_start
     
     # Create PDF buffer
     buffer = BytesIO()
@@ -285,53 +608,24 @@ def generate_pdf_report(df: pd.DataFrame, period_type: str = "weekly"):
         topMargin=0.5*inch,
         bottomMargin=0.5*inch,
         leftMargin=0.75*inch,
-        rightMargin=0.75*inch
+        rightMargin=0.75*inch,
+        pageCompression=1 if profile.compress else 0
     )
     
     # Container for PDF elements
     story = []
     
-    # Styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles matching app colors
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor("#0f172a"),
-        spaceAfter=12,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.HexColor("#64748b"),
-        spaceAfter=20,
-        alignment=TA_CENTER
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor("#1e293b"),
-        spaceAfter=10,
-        spaceBefore=15,
-        fontName='Helvetica-Bold'
-    )
+    # Styles (built once per process and shared by all reports)
+    theme = get_report_theme()
+    title_style = theme.title
+    subtitle_style = theme.subtitle
+    heading_style = theme.heading
     
     # Header Section
     story.append(Paragraph(f"💎 Finance PRO - {period_name}", title_style))
     
-    # Add helpful note for monthly reports
-    if period_type == "monthly":
-        period_note = f"Period: {start_date.strftime('%B %d, %Y')} - {end_date.strftime('%B %d, %Y')} (Current Month to Date)"
-    else:
-        period_note = f"Period: {start_date.strftime('%B %d, %Y')} - {end_date.strftime('%B %d, %Y')} (Last 7 Days)"
+    # Add helpful note describing the period
+    period_note = f"Period: {start_date.strftime('%B %d, %Y')} - {end_date.strftime('%B %d, %Y')} ({period.label})"
     
     story.append(Paragraph(period_note, subtitle_style))
     story.append(Spacer(1, 0.2*inch))
@@ -340,146 +634,91 @@ def generate_pdf_report(df: pd.DataFrame, period_type: str = "weekly"):
     story.append(Paragraph("📊 Financial Summary", heading_style))
     
     # Create summary table with app colors
-    summary_data = [
-        ["Metric", "Amount (EGP)", "Status"],
-        ["Total Income", f"{stats['total_income']:,.0f}", "✓"],
-        ["Total Expenses", f"{stats['total_expenses']:,.0f}", "✓"],
-        ["Total Investments", f"{stats['total_investments']:,.0f}", "✓"],
-        ["Net Balance", f"{stats['net_balance']:,.0f}", 
-         "🟢 Positive" if stats['net_balance'] >= 0 else "🔴 Negative"],
-        ["Total Transactions", f"{stats['num_transactions']}", "✓"]
-    ]
+    summary_data = [["Metric", "Amount (EGP)", "Previous", "Change", "Status"]]
+    for metric, key, fmt in [
+        ("Total Income", "total_income", "{:,.0f}"),
+        ("Total Expenses", "total_expenses", "{:,.0f}"),
+        ("Total Investments", "total_investments", "{:,.0f}"),
+        ("Net Balance", "net_balance", "{:,.0f}"),
+        ("Total Transactions", "num_transactions", "{}"),
+    ]:
+        status = "✓"
+        if key == "net_balance":
+            status = "🟢 Positive" if stats['net_balance'] >= 0 else "🔴 Negative"
+        summary_data.append([
+            metric,
+            fmt.format(stats[key]),
+            fmt.format(previous_stats[key]),
+            _format_change(stats[key], previous_stats[key]),
+            status
+        ])
     
-    summary_table = Table(summary_data, colWidths=[2.5*inch, 2*inch, 1.5*inch])
-    summary_table.setStyle(TableStyle([
-        # Header row
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#0f172a")),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        
-        # Data rows
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor("#f8fafc")),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor("#1e293b")),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
-        ('ALIGN', (2, 1), (2, -1), 'CENTER'),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        
-        # Grid
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#cbd5e1")),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
+    summary_table = Table(summary_data, colWidths=[1.7*inch, 1.3*inch, 1.3*inch, 0.9*inch, 1.2*inch])
+    summary_table.setStyle(theme.summary_table)
     
     story.append(summary_table)
     story.append(Spacer(1, 0.3*inch))
     
     # Charts Section
     if not filtered_df.empty:
-        # Summary Chart
-        story.append(Paragraph("📈 Visual Analysis", heading_style))
-        try:
-            summary_chart = create_chart_image(filtered_df, "summary")
-            img = Image(BytesIO(summary_chart), width=6*inch, height=3*inch)
-            story.append(img)
-            story.append(Spacer(1, 0.2*inch))
-        except Exception as e:
-            story.append(Paragraph(f"Chart generation error: {str(e)}", styles['Normal']))
-        
-        # Income Sources Chart
+        # Render every chart up front, in parallel, then lay them out in order
+        chart_sections = [("summary", "📈 Visual Analysis")]
         if len(filtered_df[filtered_df["Type"] == "Income"]) > 0:
-            story.append(Paragraph("💰 Income by Source", heading_style))
-            try:
-                income_chart = create_chart_image(filtered_df, "income_sources")
-                img_income = Image(BytesIO(income_chart), width=6*inch, height=3*inch)
-                story.append(img_income)
-                story.append(Spacer(1, 0.2*inch))
-            except Exception as e:
-                story.append(Paragraph(f"Chart generation error: {str(e)}", styles['Normal']))
-        
-        # Expense Category Breakdown
+            chart_sections.append(("income_sources", "💰 Income by Source"))
         if len(filtered_df[filtered_df["Type"] == "Expense"]) > 0:
-            story.append(Paragraph("🎯 Expense Breakdown", heading_style))
+            chart_sections.append(("category_breakdown", "🎯 Expense Breakdown"))
+        chart_sections.append(("daily_trend", "📊 Daily Transaction Trend"))
+        
+        stage_start = time.perf_counter()
+        chart_inputs = {
+            chart_type: aggregate_chart_data(filtered_df, chart_type)
+            for chart_type, _ in chart_sections
+        }
+        timings["aggregate"] += time.perf_counter() - stage_start
+        
+        progress("charts")
+        stage_start = time.perf_counter()
+        chart_images = render_charts(chart_inputs, profile)
+        timings["charts"] = time.perf_counter() - stage_start
+        
+        # Wrapping the images (svglib for vector charts) is page assembly, timed as layout
+        stage_start = time.perf_counter()
+        for chart_type, heading in chart_sections:
+            story.append(Paragraph(heading, heading_style))
             try:
-                category_chart = create_chart_image(filtered_df, "category_breakdown")
-                img2 = Image(BytesIO(category_chart), width=6*inch, height=3*inch)
-                story.append(img2)
+                image_bytes = chart_images[chart_type]
+                if isinstance(image_bytes, Exception):
+                    raise image_bytes
+                story.append(chart_flowable(image_bytes, width=6*inch, height=3*inch))
                 story.append(Spacer(1, 0.2*inch))
             except Exception as e:
-                story.append(Paragraph(f"Chart generation error: {str(e)}", styles['Normal']))
-        
-        # Daily Trend Chart
-        story.append(Paragraph("📊 Daily Transaction Trend", heading_style))
-        try:
-            trend_chart = create_chart_image(filtered_df, "daily_trend")
-            img3 = Image(BytesIO(trend_chart), width=6*inch, height=3*inch)
-            story.append(img3)
-            story.append(Spacer(1, 0.2*inch))
-        except Exception as e:
-            story.append(Paragraph(f"Chart generation error: {str(e)}", styles['Normal']))
+                story.append(Paragraph(f"Chart generation error: {str(e)}", theme.normal))
+        timings["layout"] += time.perf_counter() - stage_start
         
         # Transaction Details
         story.append(PageBreak())
         story.append(Paragraph("📝 Transaction Details", heading_style))
         
-        # Create transactions table
-        txn_data = [["Date", "Type", "Category", "Amount (EGP)", "Source"]]
-        
-        for _, row in filtered_df.sort_values("Date", ascending=False).iterrows():
-            txn_data.append([
-                row["Date"].strftime("%Y-%m-%d"),
-                row["Type"],
-                row["Category"][:20] if pd.notna(row["Category"]) else "N/A",
-                f"{row['Amount']:,.0f}",
-                row["Source"][:15] if pd.notna(row["Source"]) else "N/A"
-            ])
-        
-        txn_table = Table(txn_data, colWidths=[1.2*inch, 1*inch, 1.5*inch, 1.2*inch, 1.1*inch])
-        txn_table.setStyle(TableStyle([
-            # Header
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#0f172a")),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            
-            # Data
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor("#1e293b")),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('ALIGN', (3, 1), (3, -1), 'RIGHT'),
-            
-            # Grid
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor("#cbd5e1")),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        
-        story.append(txn_table)
+        # Transactions table, formatted chunk by chunk during doc.build
+        story.extend(build_transaction_tables(filtered_df))
     else:
-        story.append(Paragraph("No transactions found in this period.", styles['Normal']))
+        story.append(Paragraph("No transactions found in this period.", theme.normal))
     
     # Footer
     story.append(Spacer(1, 0.3*inch))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.HexColor("#94a3b8"),
-        alignment=TA_CENTER
-    )
     story.append(Paragraph(
         f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')} | Finance PRO Dashboard",
-        footer_style
+        theme.footer
     ))
     
     # Build PDF
+    progress("layout")
+    stage_start = time.perf_counter()
     doc.build(story)
+    timings["layout"] += time.perf_counter() - stage_start
+    timings["total"] = time.perf_counter() - report_start
+    for stage in ("aggregate", "charts", "layout"):
+        observe(f"report_generator.stage.{stage}", timings[stage])
+    
     buffer.seek(0)
     return buffer
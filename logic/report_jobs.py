@@ -0,0 +1,139 @@
+"""
+Report Jobs Module
+Runs PDF report generation in a background worker pool.
+
+Jobs outlive Streamlit reruns: the queue lives at process level and a
+session only needs to remember its job ids to poll progress and fetch the
+finished PDF. The report stack itself is imported lazily by the first job.
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pandas as pd
+
+from logic.periods import Period
+
+# Ordered stages a job moves through, with the progress fraction shown for each
+JOB_STAGES = {
+    "queued": 0.0,
+    "aggregate": 0.1,
+    "charts": 0.3,
+    "layout": 0.7,
+    "done": 1.0,
+}
+
+
+@dataclass
+class ReportJob:
+    """State of one background report."""
+    job_id: str
+    user_id: int
+    period_type: str
+    period: Optional[Period] = None
+    profile: Optional[str] = None
+    status: str = "queued"  # queued | running | done | failed
+    stage: str = "queued"
+    result: Optional[bytes] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    @property
+    def progress(self) -> float:
+        return JOB_STAGES.get(self.stage, 0.0)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ("queued", "running")
+
+
+class ReportJobQueue:
+    """
+    Thread pool backed queue of report jobs.
+
+    Finished jobs are kept for retention_seconds so their PDFs can be
+    downloaded after any number of reruns, but at most max_finished_jobs of
+    them: beyond that the oldest are dropped first. A job's PDF is the same
+    bytes object as its report_cache entry, so it only costs extra memory
+    once the cache has evicted that entry.
+    """
+
+    def __init__(self, max_workers: int = 2, retention_seconds: float = 3600, max_finished_jobs: int = 16):
+        self.retention_seconds = retention_seconds
+        self.max_finished_jobs = max_finished_jobs
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, df: pd.DataFrame, period_type: str = "weekly", user_id=1,
+               period: Optional[Period] = None, profile: Optional[str] = None,
+               replaces: Optional[str] = None) -> str:
+        """
+        Queue a report and return its job id.
+
+        Args:
+            replaces: Id of an earlier job the caller no longer tracks (e.g. the
+                      previous report of the same period); it is dropped
+        """
+        if replaces is not None:
+            with self._lock:
+                self._jobs.pop(replaces, None)
+        self._prune()
+        if period is not None:
+            period_type = period.period_type
+        job = ReportJob(
+            job_id=uuid.uuid4().hex, user_id=user_id, period_type=period_type, period=period, profile=profile
+        )
+        with self._lock:
+            self._jobs[job.job_id] = job
+        self._pool.submit(self._run, job, df)
+        return job.job_id
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        """Return the job with this id, or None if unknown or expired."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: ReportJob, df: pd.DataFrame):
+        job.status = "running"
+
+        def set_stage(stage):
+            job.stage = stage
+
+        try:
+            # Imported on first use: pulls in reportlab and matplotlib, which
+            # most sessions never need
+            from logic.report_cache import get_pdf_report
+
+            job.result = get_pdf_report(
+                df, period_type=job.period_type, user_id=job.user_id, progress=set_stage,
+                period=job.period, profile=job.profile
+            ).getvalue()
+            job.stage = "done"
+            job.status = "done"
+        except Exception as e:
+            print(f"❌ Report job {job.job_id} failed: {e}")
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.finished_at = time.time()
+
+    def _prune(self):
+        cutoff = time.time() - self.retention_seconds
+        with self._lock:
+            finished = sorted(
+                (job for job in self._jobs.values() if job.finished_at is not None),
+                key=lambda job: job.finished_at
+            )
+            excess = len(finished) - self.max_finished_jobs
+            for i, job in enumerate(finished):
+                if i < excess or job.finished_at < cutoff:
+                    del self._jobs[job.job_id]
+
+
+# Process-wide queue shared by all sessions
+report_jobs = ReportJobQueue()
@@ -0,0 +1,60 @@
+"""
+Report Profiles Module
+Fidelity presets for PDF reports: chart resolution, vector charts and PDF
+stream compression.
+
+"draft" is small and fast for slow connections, "standard" is the default
+look, and "print" embeds charts as vector drawings for archival printing.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class ReportProfile:
+    """How a report is rendered; the content is the same for every profile."""
+    name: str
+    label: str
+    dpi: int  # raster chart resolution
+    vector_charts: bool  # embed charts as SVG-based drawings instead of PNGs
+    compress: bool  # deflate-compress PDF page streams
+
+    @property
+    def chart_format(self) -> str:
+        """Image format charts are rendered to ("svg" or "png")."""
+        return "svg" if self.vector_charts and vector_charts_available() else "png"
+
+
+REPORT_PROFILES = {
+    "draft": ReportProfile("draft", "⚡ Draft (small, fast)", dpi=72, vector_charts=False, compress=True),
+    "standard": ReportProfile("standard", "📄 Standard", dpi=150, vector_charts=False, compress=True),
+    "print": ReportProfile("print", "🖨️ Print (vector charts)", dpi=300, vector_charts=True, compress=True),
+}
+
+DEFAULT_REPORT_PROFILE = "standard"
+
+
+def get_report_profile(profile=None) -> ReportProfile:
+    """
+    Resolve a profile name (or ReportProfile) to a ReportProfile.
+
+    Raises:
+        ValueError: For unknown profile names
+    """
+    if isinstance(profile, ReportProfile):
+        return profile
+    name = profile or DEFAULT_REPORT_PROFILE
+    if name not in REPORT_PROFILES:
+        raise ValueError(f"Unknown report profile: {name} (expected one of {', '.join(REPORT_PROFILES)})")
+    return REPORT_PROFILES[name]
+
+
+@lru_cache(maxsize=1)
+def vector_charts_available() -> bool:
+    """True when svglib is installed; otherwise vector profiles fall back to PNG at their dpi."""
+    try:
+        import svglib  # noqa: F401
+        return True
+    except ImportError:
+        print("⚠️ svglib not installed - print reports will embed high-resolution PNG charts")
+        return False
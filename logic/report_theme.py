@@ -0,0 +1,140 @@
+"""
+Report Theme Module
+Paragraph styles, table styles and chart colors shared by every PDF report.
+
+The theme is built once per process (see get_report_theme) and only read
+afterwards, so all report types - dashboard downloads, background jobs and
+batch runs - share the same objects and the same look.
+"""
+from functools import lru_cache
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import TableStyle
+
+# Matplotlib colors used by report charts (matching the app palette)
+CHART_PALETTE = {
+    "Income": "#22c55e",
+    "Expense": "#ef4444",
+    "Investment": "#a855f7",
+    "income_edge": "#059669",
+    "expense_edge": "#b91c1c",
+    "bar_edge": "#1e293b",
+    "text": "#1e293b",
+    "axis": "#cbd5e1",
+    "muted": "#94a3b8",
+    "error": "#ef4444",
+    "background": "white",
+}
+
+# Marker per transaction type on line charts
+CHART_MARKERS = {
+    "Income": "o",
+    "Expense": "s",
+    "Investment": "^",
+}
+
+
+class ReportTheme:
+    """
+    Styles for one look of the PDF reports.
+    """
+
+    def __init__(self):
+        base = getSampleStyleSheet()
+        self.normal = base['Normal']
+
+        # Custom styles matching app colors
+        self.title = ParagraphStyle(
+            'CustomTitle',
+            parent=base['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor("#0f172a"),
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        )
+
+        self.subtitle = ParagraphStyle(
+            'CustomSubtitle',
+            parent=base['Normal'],
+            fontSize=11,
+            textColor=colors.HexColor("#64748b"),
+            spaceAfter=20,
+            alignment=TA_CENTER
+        )
+
+        self.heading = ParagraphStyle(
+            'CustomHeading',
+            parent=base['Heading2'],
+            fontSize=14,
+            textColor=colors.HexColor("#1e293b"),
+            spaceAfter=10,
+            spaceBefore=15,
+            fontName='Helvetica-Bold'
+        )
+
+        self.footer = ParagraphStyle(
+            'Footer',
+            parent=base['Normal'],
+            fontSize=8,
+            textColor=colors.HexColor("#94a3b8"),
+            alignment=TA_CENTER
+        )
+
+        self.summary_table = TableStyle([
+            # Header row
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#0f172a")),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+
+            # Data rows
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor("#f8fafc")),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor("#1e293b")),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('ALIGN', (1, 1), (3, -1), 'RIGHT'),
+            ('ALIGN', (4, 1), (4, -1), 'CENTER'),
+            ('TEXTCOLOR', (2, 1), (3, -1), colors.HexColor("#64748b")),
+            ('TOPPADDING', (0, 1), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+
+            # Grid
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#cbd5e1")),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ])
+
+        self.transaction_table = TableStyle([
+            # Header
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#0f172a")),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+
+            # Data
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor("#1e293b")),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('ALIGN', (3, 1), (3, -1), 'RIGHT'),
+
+            # Grid
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor("#cbd5e1")),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ])
+
+        self.chart = CHART_PALETTE
+        self.chart_markers = CHART_MARKERS
+
+
+@lru_cache(maxsize=1)
+def get_report_theme() -> ReportTheme:
+    """Return the process-wide report theme, building it on first use."""
+    return ReportTheme()
@@ -0,0 +1,386 @@
+"""
+View Models Module
+Precomputes everything the dashboard, expenses, income, investments and
+wallets views show, in one pass over the ledger per data version.
+
+The ledger is partitioned by Type once; per-type totals, category
+breakdowns, monthly series, cumulative timelines and per-source balances
+are derived from those partitions and handed to the UI as frozen
+dataclasses. Frames inside a view model are shared between reruns (and
+sessions of the same user) and must not be modified in place - copy before
+adding display columns.
+
+A saved transaction is applied with patch_view_model, which updates only
+the row's type summary and source instead of rebuilding everything.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from logic.calculations import get_monthly_summary
+from logic.formatting import format_amounts
+from logic.kpis import kpis_from_aggregates
+from logic.ledger import insert_by_date, insert_newest_first
+
+TRANSACTION_TYPES = ("Income", "Expense", "Investment", "Transfer")
+
+LEDGER_COLUMNS = ["Date", "Type", "Category", "Source", "Amount", "Description"]
+
+
+@dataclass(frozen=True)
+class TypeSummary:
+    """Aggregates of one transaction type."""
+    frame: pd.DataFrame  # rows of this type, in ledger order (newest first)
+    total: float
+    count: int
+    by_category: pd.DataFrame  # Category, Amount, Count, First, Last, Label; largest Amount first
+    categories: Mapping[str, pd.DataFrame]  # rows per category, in order of first appearance
+    monthly: pd.DataFrame  # Date, Amount, Month (see get_monthly_summary), Label
+    month_totals: pd.DataFrame  # Month, Amount, Count, Label for months with transactions only
+    timeline: pd.DataFrame  # rows sorted by Date with a running "Cumulative" total
+
+    @property
+    def empty(self) -> bool:
+        return self.count == 0
+
+
+@dataclass(frozen=True)
+class LedgerViewModel:
+    """Everything the views need from one version of a user's ledger."""
+    df: pd.DataFrame  # the full ledger, as loaded
+    data_version: Optional[int]
+    types: Mapping[str, TypeSummary]
+    kpis: Mapping[str, float]
+    source_balances: pd.DataFrame  # Source, Balance; largest first
+    source_timelines: Mapping[str, pd.DataFrame]  # rows per source by Date, with signed_amount and cumulative
+
+    @property
+    def empty(self) -> bool:
+        return self.df.empty
+
+    def of_type(self, txn_type: str) -> TypeSummary:
+        return self.types[txn_type]
+
+    def month_stats(self, month: str) -> Mapping[str, float]:
+        """
+        Income, expenses, net and number of transactions of one month.
+
+        Read from the per-type month totals (kept up to date on every save),
+        so no rows are scanned.
+
+        Args:
+            month: Month as "YYYY-MM"
+        """
+        totals = {}
+        count = 0
+        for txn_type, summary in self.types.items():
+            row = summary.month_totals[summary.month_totals["Month"] == month]
+            if not row.empty:
+                totals[txn_type] = float(row["Amount"].iloc[0])
+                count += int(row["Count"].iloc[0])
+        income = totals.get("Income", 0.0)
+        expenses = totals.get("Expense", 0.0)
+        return {
+            "month_income": income,
+            "month_expenses": expenses,
+            "total_transactions": count,
+            "net_balance": income - expenses,
+        }
+
+
+def _empty_frame(columns):
+    return pd.DataFrame({col: pd.Series(dtype="float64" if col == "Amount" else "object") for col in columns})
+
+
+def _month_totals(frame: pd.DataFrame) -> pd.DataFrame:
+    # Group on month periods and format only the group keys, not every row
+    totals = frame.groupby(frame["Date"].dt.to_period("M"))["Amount"].agg(["sum", "size"])
+    return pd.DataFrame({
+        "Month": totals.index.strftime("%Y-%m"),
+        "Amount": totals["sum"].to_numpy(),
+        "Count": totals["size"].to_numpy(),
+        "Label": format_amounts(totals["sum"].to_numpy()),
+    })
+
+
+def _monthly_summary(frame: pd.DataFrame) -> pd.DataFrame:
+    monthly = get_monthly_summary(frame)
+    return monthly.assign(Label=format_amounts(monthly["Amount"]))
+
+
+def _add_to_month(monthly: pd.DataFrame, month: str, amount: float):
+    """Add amount to the row of `month`; None when the month has no row yet."""
+    hit = (monthly["Month"] == month).to_numpy()
+    if not hit.any():
+        return None
+    monthly = monthly.copy()
+    monthly.loc[hit, "Amount"] += amount
+    if "Count" in monthly.columns:
+        monthly.loc[hit, "Count"] += 1
+    monthly.loc[hit, "Label"] = format_amounts(monthly.loc[hit, "Amount"])
+    return monthly
+
+
+def _summarize_type(frame: pd.DataFrame) -> TypeSummary:
+    if frame.empty:
+        return TypeSummary(
+            frame=frame,
+            total=0.0,
+            count=0,
+            by_category=_empty_frame(["Category", "Amount", "Count", "First", "Last", "Label"]),
+            categories=MappingProxyType({}),
+            monthly=pd.DataFrame(),
+            month_totals=_empty_frame(["Month", "Amount", "Count", "Label"]),
+            timeline=frame.assign(Cumulative=pd.Series(dtype="float64")),
+        )
+
+    by_category = (
+        frame.groupby("Category")
+        .agg(Amount=("Amount", "sum"), Count=("Amount", "size"), First=("Date", "min"), Last=("Date", "max"))
+        .sort_values("Amount", ascending=False)
+        .reset_index()
+    )
+    # Chart text labels are formatted once here, not on every render
+    by_category["Label"] = format_amounts(by_category["Amount"], " EGP")
+    categories = dict(tuple(frame.groupby("Category", sort=False)))
+
+    month_totals = _month_totals(frame)
+    monthly = _monthly_summary(frame)
+
+    timeline = frame.sort_values("Date", kind="stable")
+    timeline = timeline.assign(Cumulative=timeline["Amount"].cumsum())
+
+    return TypeSummary(
+        frame=frame,
+        total=float(frame["Amount"].sum()),
+        count=len(frame),
+        by_category=by_category,
+        categories=MappingProxyType(categories),
+        monthly=monthly,
+        month_totals=month_totals,
+        timeline=timeline,
+    )
+
+
+def _patch_type(summary: TypeSummary, row: pd.DataFrame) -> TypeSummary:
+    """Summary of the type's rows plus `row`, updating only what the row touches."""
+    if summary.empty:
+        return _summarize_type(row)
+
+    date = row["Date"].iloc[0]
+    category = row["Category"].iloc[0]
+    amount = float(row["Amount"].iloc[0])
+    frame = insert_newest_first(summary.frame, row)
+
+    by_category = summary.by_category.copy()
+    hit = (by_category["Category"] == category).to_numpy()
+    if hit.any():
+        by_category.loc[hit, "Amount"] += amount
+        by_category.loc[hit, "Count"] += 1
+        by_category.loc[hit, "First"] = min(by_category.loc[hit, "First"].iloc[0], date)
+        by_category.loc[hit, "Last"] = max(by_category.loc[hit, "Last"].iloc[0], date)
+    else:
+        by_category.loc[len(by_category)] = [category, amount, 1, date, date, ""]
+    by_category = by_category.sort_values("Amount", ascending=False).reset_index(drop=True)
+    by_category["Label"] = format_amounts(by_category["Amount"], " EGP")
+
+    categories = dict(summary.categories)
+    rows = categories.get(category)
+    categories[category] = insert_newest_first(rows, row) if rows is not None else row
+
+    # A row in a month without transactions changes the shape of the
+    # monthly series; rebuild those from the frame in that (rare) case
+    month = date.strftime("%Y-%m")
+    monthly = _add_to_month(summary.monthly, month, amount)
+    if monthly is None:
+        monthly = _monthly_summary(frame)
+    month_totals = _add_to_month(summary.month_totals, month, amount)
+    if month_totals is None:
+        month_totals = _month_totals(frame)
+
+    return TypeSummary(
+        frame=frame,
+        total=summary.total + amount,
+        count=summary.count + 1,
+        by_category=by_category,
+        categories=MappingProxyType(categories),
+        monthly=monthly,
+        month_totals=month_totals,
+        timeline=insert_by_date(summary.timeline, row, "Amount", "Cumulative"),
+    )
+
+
+def build_view_model(df: pd.DataFrame, data_version: Optional[int] = None) -> LedgerViewModel:
+    """
+    Build the view model of a ledger.
+
+    Args:
+        df: Full transaction dataframe of the user
+        data_version: Data version df was loaded at (informational)
+
+    Returns:
+        LedgerViewModel
+    """
+    if df.empty:
+        df = df if len(df.columns) else _empty_frame(LEDGER_COLUMNS)
+        partitions = {}
+    else:
+        partitions = dict(tuple(df.groupby("Type", sort=False)))
+
+    types = {
+        txn_type: _summarize_type(partitions.get(txn_type, df.iloc[0:0]))
+        for txn_type in TRANSACTION_TYPES
+    }
+    # Types outside the standard four still get a summary
+    for txn_type, frame in partitions.items():
+        if txn_type not in types:
+            types[txn_type] = _summarize_type(frame)
+
+    # Per-source running balances: income adds to a source, everything else draws from it
+    ordered = df.sort_values("Date", kind="stable")
+    signed = np.where(ordered["Type"] == "Income", ordered["Amount"], -ordered["Amount"])
+    ordered = ordered.assign(signed_amount=signed)
+    ordered = ordered.assign(cumulative=ordered.groupby("Source")["signed_amount"].cumsum())
+    source_timelines = dict(tuple(ordered.groupby("Source", sort=False)))
+
+    balances = ordered.groupby("Source")["signed_amount"].sum().sort_values(ascending=False)
+    source_balances = balances.rename("Balance").rename_axis("Source").reset_index()
+
+    kpis = kpis_from_aggregates(
+        {txn_type: summary.total for txn_type, summary in types.items()},
+        balances
+    )
+
+    return LedgerViewModel(
+        df=df,
+        data_version=data_version,
+        types=MappingProxyType(types),
+        kpis=MappingProxyType(kpis),
+        source_balances=source_balances,
+        source_timelines=MappingProxyType(source_timelines),
+    )
+
+
+def patch_view_model(model: LedgerViewModel, row: pd.DataFrame, df: pd.DataFrame,
+                     data_version: Optional[int] = None) -> LedgerViewModel:
+    """
+    View model of a ledger that is `model`'s ledger plus one new row.
+
+    Only the summary of the row's type and the timeline and balance of its
+    source are updated; everything else is shared with `model`.
+
+    Args:
+        model: View model of the ledger before the row was added
+        row: One-row frame of the new transaction (see logic.ledger.make_row)
+        df: The ledger including the row
+        data_version: Data version of df
+
+    Returns:
+        LedgerViewModel
+    """
+    if model.empty:
+        return build_view_model(df, data_version)
+
+    txn_type = row["Type"].iloc[0]
+    source = row["Source"].iloc[0]
+    amount = float(row["Amount"].iloc[0])
+
+    types = dict(model.types)
+    types[txn_type] = _patch_type(types[txn_type], row) if txn_type in types else _summarize_type(row)
+
+    # Income adds to a source, everything else draws from it
+    signed = amount if txn_type == "Income" else -amount
+    signed_row = row.assign(signed_amount=signed)
+    source_timelines = dict(model.source_timelines)
+    timeline = source_timelines.get(source)
+    if timeline is not None:
+        source_timelines[source] = insert_by_date(timeline, signed_row, "signed_amount", "cumulative")
+    else:
+        source_timelines[source] = signed_row.assign(cumulative=signed)
+
+    balances = model.source_balances.set_index("Source")["Balance"].copy()
+    balances.loc[source] = balances.get(source, 0.0) + signed
+    balances = balances.sort_values(ascending=False)
+    source_balances = balances.rename_axis("Source").reset_index()
+
+    kpis = kpis_from_aggregates(
+        {txn_type: summary.total for txn_type, summary in types.items()},
+        balances
+    )
+
+    return LedgerViewModel(
+        df=df,
+        data_version=data_version,
+        types=MappingProxyType(types),
+        kpis=MappingProxyType(kpis),
+        source_balances=source_balances,
+        source_timelines=MappingProxyType(source_timelines),
+    )
+
+
+class ViewModelCache:
+    """
+    Small LRU of view models keyed by (user_id, data_version).
+
+    Versions only increase, so an entry is never stale: old versions simply
+    age out.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, df: pd.DataFrame, user_id, data_version: Optional[int]) -> LedgerViewModel:
+        """Return the cached view model for this version, building it on a miss."""
+        if data_version is None:
+            return build_view_model(df)
+
+        key = (user_id, data_version)
+        with self._lock:
+            model = self._entries.get(key)
+            if model is not None:
+                self._entries.move_to_end(key)
+                return model
+
+        model = build_view_model(df, data_version)
+        self._put(key, model)
+        return model
+
+    def _put(self, key, model):
+        with self._lock:
+            self._entries[key] = model
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def patch(self, user_id, previous_version: int, data_version: int, df: pd.DataFrame, row: pd.DataFrame):
+        """
+        Derive the view model of a newly saved row from the previous version's
+        model, if that one is cached; otherwise the next get() builds it.
+        """
+        with self._lock:
+            model = self._entries.get((user_id, previous_version))
+        if model is None:
+            return None
+        model = patch_view_model(model, row, df, data_version)
+        self._put((user_id, data_version), model)
+        return model
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide cache shared by all sessions
+view_model_cache = ViewModelCache()
+
+
+def get_view_model(df: pd.DataFrame, user_id=1, data_version: Optional[int] = None) -> LedgerViewModel:
+    """View model of a user's ledger, built once per data version."""
+    return view_model_cache.get(df, user_id, data_version)
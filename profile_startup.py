@@ -0,0 +1,114 @@
+"""
+Startup profiling script
+Measures the cold-start import time of app.py in fresh interpreters and
+fails when it exceeds a budget or when modules that should load lazily
+(report dependencies) are imported at startup.
+
+Usage:
+    python profile_startup.py
+    python profile_startup.py --budget-ms 2500 --runs 5 --output startup_profile.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Loaded on first report download only; importing them at startup is a regression
+LAZY_MODULES = ("reportlab", "matplotlib")
+
+CHILD_CODE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+print(json.dumps({{"import_ms": elapsed * 1000, "modules": sorted({{m.split('.')[0] for m in sys.modules}})}}))
+"""
+
+
+def parse_importtime(stderr: str, top: int = 15):
+    """Top-level imports of app sorted by cumulative time, from -X importtime output."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative = int(cumulative)
+        except ValueError:
+            continue
+        # Direct imports of app are indented by exactly three spaces
+        if name.startswith("   ") and not name.startswith("    "):
+            entries.append((name.strip(), cumulative / 1000))
+    return sorted(entries, key=lambda e: e[1], reverse=True)[:top]
+
+
+def profile_once():
+    """Import app.py in a fresh interpreter and return its measurements."""
+    wall_start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_CODE.format(root=ROOT)],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    wall_ms = (time.perf_counter() - wall_start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing app.py failed:\n{proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["wall_ms"] = wall_ms
+    result["slowest_imports"] = parse_importtime(proc.stderr)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile Finance PRO cold-start import time.")
+    parser.add_argument("--runs", type=int, default=3, help="Number of cold starts to measure (default: 3)")
+    parser.add_argument("--budget-ms", type=float, default=float(os.environ.get("STARTUP_BUDGET_MS", "3000")),
+                        help="Fail when the median import time exceeds this (default: $STARTUP_BUDGET_MS or 3000)")
+    parser.add_argument("--output", help="Write the measurements to this JSON file")
+    args = parser.parse_args(argv)
+
+    runs = [profile_once() for _ in range(args.runs)]
+    import_ms = statistics.median(r["import_ms"] for r in runs)
+    wall_ms = statistics.median(r["wall_ms"] for r in runs)
+    eager = [m for m in LAZY_MODULES if m in runs[-1]["modules"]]
+
+    print("=" * 60)
+    print(f"app.py cold start over {args.runs} run(s)")
+    print("=" * 60)
+    print(f"Import time (median): {import_ms:8.0f} ms   budget {args.budget_ms:.0f} ms")
+    print(f"Process wall time:    {wall_ms:8.0f} ms")
+    print("\nSlowest imports:")
+    for name, ms in runs[-1]["slowest_imports"]:
+        print(f"  {ms:8.1f} ms  {name}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "runs": args.runs,
+                "import_ms_median": import_ms,
+                "wall_ms_median": wall_ms,
+                "budget_ms": args.budget_ms,
+                "eager_lazy_modules": eager,
+                "slowest_imports": runs[-1]["slowest_imports"],
+            }, f, indent=2)
+
+    failed = False
+    if eager:
+        print(f"\n❌ Loaded at startup but should be lazy: {', '.join(eager)}")
+        failed = True
+    if import_ms > args.budget_ms:
+        print(f"\n❌ Startup budget exceeded by {import_ms - args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("\n✅ Startup within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+import os
+
+from logic.chart_cache import ChartCache
+
+
+def _files(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".chart"))
+
+
+def test_disk_layer_evicts_least_recently_used_files(tmp_path):
+    cache = ChartCache(cache_dir=str(tmp_path), max_disk_bytes=250)
+    for age, key in enumerate(["a", "b"]):
+        cache.put(key, b"x" * 100)
+        os.utime(cache._path(key), (1000 + age, 1000 + age))
+
+    # Reading "a" from disk makes it the most recently used file
+    cache._entries.clear()
+    assert cache.get("a") == b"x" * 100
+
+    cache.put("c", b"x" * 100)
+    assert _files(tmp_path) == ["a.chart", "c.chart"]
+
+
+def test_clear_removes_files(tmp_path):
+    cache = ChartCache(cache_dir=str(tmp_path))
+    cache.put("a", b"png")
+    cache.clear()
+    assert len(cache) == 0
+    assert _files(tmp_path) == []
+    assert cache.get("a") is None
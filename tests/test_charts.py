@@ -0,0 +1,35 @@
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from logic.figure_cache import figure_cache
+from ui.charts import TEMPLATE_NAME, apply_theme, cached_figure
+
+
+def _bar_figure():
+    return apply_theme(go.Figure(go.Bar(x=["a", "b"], y=[1, 2])), title="Bars")
+
+
+def test_cached_figure_returns_independent_copies():
+    figure_cache.clear()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return _bar_figure()
+
+    first = cached_figure("test.bars", build, 1)
+    first["layout"]["title"]["text"] = "Changed"
+    first["data"][0]["y"].append(3)
+    second = cached_figure("test.bars", build, 1)
+
+    assert len(builds) == 1
+    assert second["layout"]["title"]["text"] == "Bars"
+    assert second["data"][0]["y"] == [1, 2]
+
+
+def test_apply_theme_leaves_styling_to_the_template():
+    layout = _bar_figure().layout
+    assert layout.title.text == "Bars"
+    assert layout.plot_bgcolor is None
+    assert layout.font.color is None
+    assert layout.template == pio.templates[TEMPLATE_NAME]
@@ -0,0 +1,45 @@
+from datetime import date
+
+from logic.periods import resolve_period
+
+
+def _previous(period_type, **kwargs):
+    previous = resolve_period(period_type, **kwargs).previous()
+    return previous.start, previous.end
+
+
+def test_previous_of_february_is_all_of_january():
+    assert _previous("monthly", year=2025, month=2) == (date(2025, 1, 1), date(2025, 1, 31))
+
+
+def test_previous_of_31_day_month_is_full_30_day_month():
+    assert _previous("monthly", year=2025, month=5) == (date(2025, 4, 1), date(2025, 4, 30))
+
+
+def test_previous_of_30_day_month_is_full_31_day_month():
+    assert _previous("monthly", year=2025, month=4) == (date(2025, 3, 1), date(2025, 3, 31))
+
+
+def test_previous_of_march_is_28_day_february():
+    assert _previous("monthly", year=2025, month=3) == (date(2025, 2, 1), date(2025, 2, 28))
+
+
+def test_previous_of_full_quarter_is_full_quarter():
+    assert _previous("quarterly", year=2025, quarter=2) == (date(2025, 1, 1), date(2025, 3, 31))
+
+
+def test_previous_of_full_year():
+    assert _previous("yearly", year=2024) == (date(2023, 1, 1), date(2023, 12, 31))
+
+
+def test_month_to_date_keeps_span_within_previous_month():
+    assert _previous("monthly", today=date(2025, 10, 19)) == (date(2025, 9, 1), date(2025, 9, 19))
+    assert _previous("monthly", today=date(2025, 3, 30)) == (date(2025, 2, 1), date(2025, 2, 28))
+
+
+def test_quarter_to_date_is_clamped_to_previous_quarter():
+    assert _previous("quarterly", today=date(2025, 5, 31)) == (date(2025, 1, 1), date(2025, 2, 28))
+
+
+def test_rolling_period_steps_back_by_its_length():
+    assert _previous("rolling", days=30, today=date(2025, 3, 31)) == (date(2025, 1, 31), date(2025, 3, 1))
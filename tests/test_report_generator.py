@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from logic import report_generator
+from logic.chart_cache import chart_cache
+from logic.report_generator import (aggregate_chart_data, build_transaction_tables, format_transaction_rows,
+                                    render_charts, set_chart_pool_workers)
+
+
+def _ledger(category, source):
+    return pd.DataFrame({
+        "Date": pd.to_datetime(["2025-01-02"]),
+        "Type": ["Expense"],
+        "Category": [category],
+        "Source": [source],
+        "Amount": [1234.5],
+        "Description": [""],
+    })
+
+
+def test_format_transaction_rows_with_missing_category_and_source():
+    rows = format_transaction_rows(_ledger(np.nan, None))
+    assert rows == [["2025-01-02", "Expense", "N/A", "1,234", "N/A"]]
+
+
+def test_format_transaction_rows_truncates_long_text():
+    rows = format_transaction_rows(_ledger("C" * 30, "S" * 30))
+    assert rows[0][2] == "C" * 20
+    assert rows[0][4] == "S" * 15
+
+
+def test_build_transaction_tables_of_empty_frame():
+    assert build_transaction_tables(_ledger("Food", "Cash").iloc[0:0]) == []
+
+
+def test_render_charts_in_worker_processes_matches_in_process():
+    df = pd.concat([_ledger("Food", "Cash"), _ledger("Rent", "Bank").assign(Type="Income")], ignore_index=True)
+    inputs = {chart_type: aggregate_chart_data(df, chart_type)
+              for chart_type in ("summary", "income_sources", "category_breakdown", "daily_trend")}
+    workers = report_generator.CHART_POOL_WORKERS
+    try:
+        set_chart_pool_workers(1)
+        chart_cache.clear()
+        in_process = render_charts(inputs, "draft")
+        set_chart_pool_workers(2)
+        chart_cache.clear()
+        pooled = render_charts(inputs, "draft")
+    finally:
+        set_chart_pool_workers(workers)
+        chart_cache.clear()
+    assert list(pooled) == list(inputs)
+    assert all(isinstance(image, bytes) and image for image in pooled.values())
+    assert pooled == in_process
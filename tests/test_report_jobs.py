@@ -0,0 +1,41 @@
+import time
+
+import pandas as pd
+
+from logic.report_jobs import ReportJob, ReportJobQueue
+
+
+def _finished_job(queue, job_id, finished_at):
+    job = ReportJob(job_id=job_id, user_id=1, period_type="weekly", status="done", stage="done",
+                    result=b"%PDF", finished_at=finished_at)
+    queue._jobs[job_id] = job
+    return job
+
+
+def test_prune_keeps_the_newest_finished_jobs():
+    queue = ReportJobQueue(max_workers=1, max_finished_jobs=2)
+    now = time.time()
+    for i in range(4):
+        _finished_job(queue, f"job{i}", now - 10 + i)
+    queue._jobs["active"] = ReportJob(job_id="active", user_id=1, period_type="weekly")
+
+    queue._prune()
+    assert sorted(queue._jobs) == ["active", "job2", "job3"]
+
+
+def test_prune_drops_expired_jobs():
+    queue = ReportJobQueue(max_workers=1, retention_seconds=60)
+    _finished_job(queue, "old", time.time() - 120)
+    _finished_job(queue, "new", time.time())
+
+    queue._prune()
+    assert sorted(queue._jobs) == ["new"]
+
+
+def test_submit_drops_the_replaced_job():
+    queue = ReportJobQueue(max_workers=1)
+    _finished_job(queue, "previous", time.time())
+
+    job_id = queue.submit(pd.DataFrame(), period_type="weekly", replaces="previous")
+    assert queue.get("previous") is None
+    assert queue.get(job_id) is not None
@@ -1,33 +1,30 @@
 import streamlit as st
 import datetime
-import pandas as pd
-from logic.data_loader import save_data, load_data
+from logic.data_loader import save_data
 
 def get_user_id():
     """Get current user_id from session"""
     return st.session_state.get('user_id', 1)
 
-@st.cache_data(ttl=60, show_spinner=False)
-def get_month_stats(df_hash):
-    """Calculate monthly stats with caching"""
-    df = df_hash['df']
-    if df.empty:
-        return None
-    
-    today = datetime.date.today()
-    this_month = df[df["Date"].dt.month == today.month]
+def get_month_stats(model, today=None):
+    """
+    This month's stats (year and month), from the view model's month totals.
     
-    return {
-        'month_income': this_month[this_month["Type"] == "Income"]["Amount"].sum(),
-        'month_expenses': this_month[this_month["Type"] == "Expense"]["Amount"].sum(),
-        'total_transactions': len(this_month),
-        'net_balance': this_month[this_month["Type"] == "Income"]["Amount"].sum() - 
-                       this_month[this_month["Type"] == "Expense"]["Amount"].sum()
-    }
+    Args:
+        model: LedgerViewModel of the current user
+        today: Date the month is taken from (defaults to today)
+    """
+    if model.empty:
+        return None
+    today = today or datetime.date.today()
+    return model.month_stats(today.strftime("%Y-%m"))
 
-def render_add_transaction():
+def render_add_transaction(model):
     """
     Render the professional 'Add Transaction' form with animations and visual enhancements.
+    
+    Args:
+        model: LedgerViewModel of the current user (see logic.view_models)
     """
     # Advanced Custom CSS with animations
     st.markdown("""
@@ -220,11 +217,8 @@ def render_add_transaction():
     
     # Quick Stats Section
     try:
-        df = load_data()
-        if not df.empty:
-            # Create hashable version for caching
-            df_hash = {'df': df, 'hash': hash(pd.util.hash_pandas_object(df).sum())}
-            stats = get_month_stats(df_hash)
+        if not model.empty:
+            stats = get_month_stats(model)
             
             if stats:
                 col_s1, col_s2, col_s3, col_s4 = st.columns(4)
@@ -403,7 +397,8 @@ def render_add_transaction():
                 if success:
                     st.success("✅ Transaction saved successfully!")
                     st.balloons()
-                    # Immediate rerun without delay
+                    # The cached ledger and aggregates were patched with the new
+                    # row, so this rerun does not reload from the database
                     st.rerun()
                 else:
                     st.error("❌ Failed to save transaction. Please try again.")
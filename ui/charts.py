@@ -0,0 +1,110 @@
+"""
+Shared chart building blocks: the app's plotly template, the figure cache
+and time-series traces.
+
+The finance_dark template is the single source of the chart theme. Charts
+are rendered with theme=None, since Streamlit's chart theme would
+otherwise overwrite the template's colors and fonts in the browser.
+
+Series longer than the point budget are downsampled (LTTB, see
+logic/downsampling.py) before they are sent to the browser, per-point
+markers are dropped once they would only add clutter, and long series are
+drawn with WebGL (Scattergl) instead of SVG.
+"""
+import json
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from logic.downsampling import downsample
+from logic.figure_cache import figure_cache
+from logic.profiling import span
+
+TEMPLATE_NAME = "finance_dark"
+GRID_COLOR = "rgba(148, 163, 184, 0.1)"
+
+pio.templates[TEMPLATE_NAME] = go.layout.Template(layout=dict(
+    plot_bgcolor="rgba(0,0,0,0)",
+    paper_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="#e5e7eb", size=11),
+    xaxis=dict(showgrid=True, gridcolor=GRID_COLOR),
+    yaxis=dict(showgrid=True, gridcolor=GRID_COLOR),
+))
+
+POINT_BUDGET = 1500  # roughly two points per horizontal pixel of a full-width chart
+WEBGL_THRESHOLD = 1000  # points above which Scattergl is used
+MARKER_LIMIT = 200  # points above which markers are not drawn
+
+
+def time_series_trace(x, y, max_points=POINT_BUDGET, method="lttb", **trace_args):
+    """
+    Build a scatter/line trace for a time series within a point budget.
+
+    Args:
+        x: Sorted x values (e.g. the Date column)
+        y: y values
+        max_points: Point budget after downsampling
+        method: Downsampling method ("lttb" or "minmax")
+        **trace_args: Passed to go.Scatter / go.Scattergl
+
+    Returns:
+        go.Scatter for short series, go.Scattergl above WEBGL_THRESHOLD points
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) > max_points:
+        kept = downsample(x, y, max_points, method)
+        x, y = x[kept], y[kept]
+
+    mode = trace_args.get("mode")
+    if mode and "lines" in mode and "markers" in mode and len(x) > MARKER_LIMIT:
+        trace_args["mode"] = mode.replace("+markers", "").replace("markers+", "")
+        trace_args.pop("marker", None)
+
+    trace_type = go.Scattergl if len(x) > WEBGL_THRESHOLD else go.Scatter
+    return trace_type(x=x, y=y, **trace_args)
+
+
+def apply_theme(fig, **layout):
+    """
+    Style a figure with the app template, then apply its own layout.
+
+    Args:
+        fig: plotly Figure
+        **layout: Figure-specific layout, applied over the template
+
+    Returns:
+        The figure
+    """
+    fig.update_layout(template=TEMPLATE_NAME, **layout)
+    return fig
+
+
+def cached_figure(name, build, data_version, *state):
+    """
+    Figure `name` for a data version and filter state, built on first use.
+
+    Data versions are unique across users, so (name, data_version, *state)
+    identifies the inputs of a chart. The cache holds the figure's JSON and
+    every call gets its own dict, so no figure object is shared between
+    reruns or sessions. Without a version the figure is rebuilt every time.
+
+    Args:
+        name: Chart identifier, e.g. "expenses.by_category"
+        build: Zero-argument callable building the figure
+        data_version: Data version of the ledger the chart is built from
+        *state: Hashable filter state the figure depends on
+
+    Returns:
+        Figure dict for st.plotly_chart (or the new Figure without a version)
+    """
+    def timed_build():
+        with span(f"build {name}"):
+            return build()
+
+    if data_version is None:
+        return timed_build()
+    with span(f"figure_cache {name}"):
+        figure_json = figure_cache.get((name, data_version) + state, lambda: timed_build().to_json())
+        return json.loads(figure_json)
@@ -2,14 +2,82 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+from ui.charts import apply_theme, cached_figure
 from ui.styles import kpi_card_html
-from logic.kpis import calculate_kpis
-from logic.report_generator import generate_pdf_report
+from ui.export import render_export_panel
+from logic.database import iter_transactions
+from logic.periods import resolve_period
+from logic.report_jobs import report_jobs
+from logic.report_profiles import DEFAULT_REPORT_PROFILE, REPORT_PROFILES
 
-def render_dashboard(df):
+def start_report_job(df, period_type, period=None):
+    """Queue a report in the background and remember its job id for this session."""
+    job_id = report_jobs.submit(
+        df,
+        period_type=period_type,
+        user_id=st.session_state.get('user_id', 1),
+        period=period,
+        profile=st.session_state.get("report_profile", DEFAULT_REPORT_PROFILE),
+        replaces=st.session_state.get("report_jobs", {}).get(period_type)
+    )
+    st.session_state.setdefault("report_jobs", {})[period_type] = job_id
+
+def _session_report_jobs():
+    """(period_type, job) pairs of this session that are still known to the queue."""
+    jobs = []
+    for period_type, job_id in st.session_state.get("report_jobs", {}).items():
+        job = report_jobs.get(job_id)
+        if job is not None:
+            jobs.append((period_type, job))
+    return jobs
+
+def _render_report_job_status(jobs):
+    for period_type, job in jobs:
+        label = period_type.capitalize()
+        if job.is_active:
+            st.progress(job.progress, text=f"⏳ Generating {label.lower()} report: {job.stage}...")
+        elif job.status == "done":
+            st.download_button(
+                label=f"⬇️ Download {label} PDF",
+                data=job.result,
+                file_name=f"{label}_Report_{datetime.fromtimestamp(job.created_at).strftime('%Y%m%d')}.pdf",
+                mime="application/pdf",
+                use_container_width=True,
+                key=f"report_download_{job.job_id}"
+            )
+            st.success(f"✅ {label} report generated!")
+        else:
+            st.error(f"❌ Error: {job.error}")
+
+@st.fragment(run_every=1.0)
+def _poll_report_jobs():
+    """Refresh job progress every second without rerunning the whole app."""
+    jobs = _session_report_jobs()
+    _render_report_job_status(jobs)
+    if not any(job.is_active for _, job in jobs):
+        # Everything finished: rerun once so the panel stops polling
+        st.rerun()
+
+def render_report_jobs():
+    """
+    Show progress and download buttons for this session's report jobs.
+    """
+    jobs = _session_report_jobs()
+    if not jobs:
+        return
+    if any(job.is_active for _, job in jobs):
+        _poll_report_jobs()
+    else:
+        _render_report_job_status(jobs)
+
+def render_dashboard(model):
     """
     Render the main dashboard view.
+    
+    Args:
+        model: LedgerViewModel of the current user (see logic.view_models)
     """
+    df = model.df
     # Hero Section
     st.markdown(
         """
@@ -25,7 +93,7 @@ def render_dashboard(df):
     )
     
     # KPIs
-    kpis = calculate_kpis(df)
+    kpis = model.kpis
     
     k1, k2, k3, k4 = st.columns(4)
     
@@ -73,6 +141,17 @@ def render_dashboard(df):
     month_start = today.replace(day=1).strftime('%d %b')
     today_str = today.strftime('%d %b %Y')
     
+    # Fidelity of the generated PDFs (applies to every report button below)
+    st.radio(
+        "Report Quality",
+        list(REPORT_PROFILES),
+        index=list(REPORT_PROFILES).index(DEFAULT_REPORT_PROFILE),
+        format_func=lambda name: REPORT_PROFILES[name].label,
+        horizontal=True,
+        key="report_profile",
+        help="Draft is smallest and fastest to download; Print embeds vector charts for archival printing."
+    )
+    
     rep_col1, rep_col2, rep_col3 = st.columns([1, 1, 2])
     
     with rep_col1:
@@ -85,19 +164,7 @@ def render_dashboard(df):
         """, unsafe_allow_html=True)
         
         if st.button("📄 Download Weekly Report", type="primary", use_container_width=True):
-            with st.spinner("Generating weekly report..."):
-                try:
-                    pdf_buffer = generate_pdf_report(df, period_type="weekly")
-                    st.download_button(
-                        label="⬇️ Download PDF",
-                        data=pdf_buffer,
-                        file_name=f"Weekly_Report_{datetime.now().strftime('%Y%m%d')}.pdf",
-                        mime="application/pdf",
-                        use_container_width=True
-                    )
-                    st.success("✅ Weekly report generated!")
-                except Exception as e:
-                    st.error(f"❌ Error: {str(e)}")
+            start_report_job(df, "weekly")
     
     with rep_col2:
         st.markdown(f"""
@@ -109,19 +176,7 @@ def render_dashboard(df):
         """, unsafe_allow_html=True)
         
         if st.button("📄 Download Monthly Report", type="primary", use_container_width=True):
-            with st.spinner("Generating monthly report..."):
-                try:
-                    pdf_buffer = generate_pdf_report(df, period_type="monthly")
-                    st.download_button(
-                        label="⬇️ Download PDF",
-                        data=pdf_buffer,
-                        file_name=f"Monthly_Report_{datetime.now().strftime('%Y%m%d')}.pdf",
-                        mime="application/pdf",
-                        use_container_width=True
-                    )
-                    st.success("✅ Monthly report generated!")
-                except Exception as e:
-                    st.error(f"❌ Error: {str(e)}")
+            start_report_job(df, "monthly")
     
     with rep_col3:
         st.markdown("""
@@ -135,6 +190,40 @@ def render_dashboard(df):
             </ul>
         </div>
         """, unsafe_allow_html=True)
+    
+    # Any date range, compared with the range just before it
+    with st.expander("🗓️ Custom Period Report"):
+        custom_col1, custom_col2 = st.columns([2, 1])
+        with custom_col1:
+            custom_range = st.date_input(
+                "Report Period",
+                value=(today.date().replace(day=1), today.date()),
+                key="custom_report_range"
+            )
+        with custom_col2:
+            st.markdown("<br>", unsafe_allow_html=True)
+            if st.button("📄 Generate Custom Report", use_container_width=True):
+                if isinstance(custom_range, (tuple, list)) and len(custom_range) == 2:
+                    start_report_job(
+                        df,
+                        "custom",
+                        period=resolve_period("custom", start=custom_range[0], end=custom_range[1])
+                    )
+                else:
+                    st.warning("⚠️ Please select both a start and an end date.")
+    
+    # Background report jobs of this session
+    render_report_jobs()
+    
+    # Full ledger export, streamed from the database in chunks
+    with st.expander("📤 Export All Transactions"):
+        user_id = st.session_state.get('user_id', 1)
+        render_export_panel(
+            "ledger",
+            lambda: iter_transactions(user_id),
+            "Transactions",
+            signature=(user_id, model.data_version)
+        )
         
     st.divider()
         
@@ -148,119 +237,118 @@ def render_dashboard(df):
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        # Enhanced Income vs Expense chart
-        df_chart = df.copy()
-        df_chart["Month"] = df_chart["Date"].dt.strftime("%Y-%m")
-        grouped = df_chart.groupby(["Month", "Type"])["Amount"].sum().reset_index()
+        # Enhanced Income vs Expense chart (monthly totals precomputed per type)
+        income_data = model.of_type("Income").month_totals
+        expense_data = model.of_type("Expense").month_totals
         
-        # Filter for only Income and Expense
-        grouped_main = grouped[grouped["Type"].isin(["Income", "Expense"])]
-        
-        if not grouped_main.empty:
-            fig = go.Figure()
-            
-            # Add Income bars
-            income_data = grouped_main[grouped_main["Type"] == "Income"]
-            if not income_data.empty:
-                fig.add_trace(go.Bar(
-                    x=income_data["Month"],
-                    y=income_data["Amount"],
-                    name="Income",
-                    marker=dict(
-                        color="#22c55e",
-                        line=dict(color='#16a34a', width=1.5)
-                    ),
-                    text=income_data["Amount"].apply(lambda x: f"{x:,.0f}"),
-                    textposition='outside',
-                    hovertemplate="<b>%{x}</b><br>Income: %{y:,.0f} EGP<extra></extra>"
-                ))
-            
-            # Add Expense bars
-            expense_data = grouped_main[grouped_main["Type"] == "Expense"]
-            if not expense_data.empty:
-                fig.add_trace(go.Bar(
-                    x=expense_data["Month"],
-                    y=expense_data["Amount"],
-                    name="Expenses",
-                    marker=dict(
-                        color="#ef4444",
-                        line=dict(color='#dc2626', width=1.5)
-                    ),
-                    text=expense_data["Amount"].apply(lambda x: f"{x:,.0f}"),
-                    textposition='outside',
-                    hovertemplate="<b>%{x}</b><br>Expenses: %{y:,.0f} EGP<extra></extra>"
-                ))
-            
-            fig.update_layout(
-                title="Monthly Income vs Expenses",
-                plot_bgcolor="rgba(0,0,0,0)",
-                paper_bgcolor="rgba(0,0,0,0)",
-                font=dict(color="#e5e7eb", size=11),
-                xaxis=dict(
-                    showgrid=True,
-                    gridcolor="rgba(148, 163, 184, 0.1)",
-                    title=""
-                ),
-                yaxis=dict(
-                    showgrid=True,
-                    gridcolor="rgba(148, 163, 184, 0.1)",
-                    title="Amount (EGP)"
-                ),
-                barmode='group',
-                hovermode='x unified',
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1,
-                    bgcolor="rgba(15, 23, 42, 0.8)",
-                    bordercolor="rgba(148, 163, 184, 0.3)",
-                    borderwidth=1
-                ),
-                height=400
+        if not income_data.empty or not expense_data.empty:
+            fig = cached_figure(
+                "dashboard.income_vs_expenses",
+                lambda: _income_vs_expenses_figure(income_data, expense_data),
+                model.data_version
             )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, theme=None)
         else:
             st.info("No income/expense data to plot.")
 
     with col2:
         # Enhanced expense distribution pie chart
-        df_exp = df[df["Type"] == "Expense"]
-        if not df_exp.empty:
-            exp_by_cat = df_exp.groupby("Category")["Amount"].sum().sort_values(ascending=False).reset_index()
-            
-            fig_pie = go.Figure(data=[go.Pie(
-                labels=exp_by_cat["Category"],
-                values=exp_by_cat["Amount"],
-                hole=0.5,
-                marker=dict(
-                    colors=px.colors.sequential.Reds_r,
-                    line=dict(color='#1e293b', width=2)
-                ),
-                textposition='auto',
-                textinfo='label+percent',
-                hovertemplate="<b>%{label}</b><br>%{value:,.0f} EGP<br>%{percent}<extra></extra>"
-            )])
-            
-            fig_pie.update_layout(
-                title="Expense Distribution",
-                plot_bgcolor="rgba(0,0,0,0)",
-                paper_bgcolor="rgba(0,0,0,0)",
-                font=dict(color="#e5e7eb", size=10),
-                height=400,
-                showlegend=True,
-                legend=dict(
-                    orientation="v",
-                    yanchor="middle",
-                    y=0.5,
-                    xanchor="left",
-                    x=1.05,
-                    bgcolor="rgba(15, 23, 42, 0.8)",
-                    bordercolor="rgba(148, 163, 184, 0.3)",
-                    borderwidth=1
-                )
+        exp_by_cat = model.of_type("Expense").by_category
+        if not exp_by_cat.empty:
+            fig_pie = cached_figure(
+                "dashboard.expense_distribution",
+                lambda: _expense_distribution_figure(exp_by_cat),
+                model.data_version
             )
-            st.plotly_chart(fig_pie, use_container_width=True)
+            st.plotly_chart(fig_pie, use_container_width=True, theme=None)
         else:
             st.info("No expenses found.")
+
+def _income_vs_expenses_figure(income_data, expense_data):
+    """Grouped monthly income and expense bars."""
+    fig = go.Figure()
+
+    # Add Income bars
+    if not income_data.empty:
+        fig.add_trace(go.Bar(
+            x=income_data["Month"],
+            y=income_data["Amount"],
+            name="Income",
+            marker=dict(
+                color="#22c55e",
+                line=dict(color='#16a34a', width=1.5)
+            ),
+            text=income_data["Label"],
+            textposition='outside',
+            hovertemplate="<b>%{x}</b><br>Income: %{y:,.0f} EGP<extra></extra>"
+        ))
+
+    # Add Expense bars
+    if not expense_data.empty:
+        fig.add_trace(go.Bar(
+            x=expense_data["Month"],
+            y=expense_data["Amount"],
+            name="Expenses",
+            marker=dict(
+                color="#ef4444",
+                line=dict(color='#dc2626', width=1.5)
+            ),
+            text=expense_data["Label"],
+            textposition='outside',
+            hovertemplate="<b>%{x}</b><br>Expenses: %{y:,.0f} EGP<extra></extra>"
+        ))
+
+    apply_theme(
+        fig,
+        title="Monthly Income vs Expenses",
+        xaxis=dict(title=""),
+        yaxis=dict(title="Amount (EGP)"),
+        barmode='group',
+        hovermode='x unified',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            bgcolor="rgba(15, 23, 42, 0.8)",
+            bordercolor="rgba(148, 163, 184, 0.3)",
+            borderwidth=1
+        ),
+        height=400
+    )
+    return fig
+
+def _expense_distribution_figure(exp_by_cat):
+    """Donut of expenses per category."""
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=exp_by_cat["Category"],
+        values=exp_by_cat["Amount"],
+        hole=0.5,
+        marker=dict(
+            colors=px.colors.sequential.Reds_r,
+            line=dict(color='#1e293b', width=2)
+        ),
+        textposition='auto',
+        textinfo='label+percent',
+        hovertemplate="<b>%{label}</b><br>%{value:,.0f} EGP<br>%{percent}<extra></extra>"
+    )])
+
+    apply_theme(
+        fig_pie,
+        title="Expense Distribution",
+        font=dict(size=10),
+        height=400,
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            yanchor="middle",
+            y=0.5,
+            xanchor="left",
+            x=1.05,
+            bgcolor="rgba(15, 23, 42, 0.8)",
+            bordercolor="rgba(148, 163, 184, 0.3)",
+            borderwidth=1
+        )
+    )
+    return fig_pie
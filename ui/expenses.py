@@ -1,12 +1,19 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
 from logic.calculations import filter_data, get_monthly_summary, group_by_category
+from logic.export import iter_frame_chunks
+from logic.formatting import format_amounts
+from ui.export import render_export_panel
+from ui.charts import apply_theme, cached_figure, time_series_trace
+from ui.tables import render_transaction_table
 
-def render_expenses(df: pd.DataFrame):
+def render_expenses(model):
     """
     Render professional expenses analysis page with animations.
+    
+    Args:
+        model: LedgerViewModel of the current user (see logic.view_models)
     """
     # Custom CSS with animations
     st.markdown("""
@@ -52,17 +59,31 @@ def render_expenses(df: pd.DataFrame):
     </div>
     """, unsafe_allow_html=True)
     
-    if df.empty:
+    if model.empty:
         st.info("No data available.")
         return
     
-    # Filter only Expenses
-    df_exp = df[df["Type"] == "Expense"].copy()
+    # Expenses only (partitioned once per data version)
+    expense = model.of_type("Expense")
+    df_exp = expense.frame
     
     if df_exp.empty:
         st.info("💡 No expense records found. Start tracking your expenses!")
         return
-        
+    
+    _render_expense_analysis(expense, model.data_version)
+
+@st.fragment
+def _render_expense_analysis(expense, data_version):
+    """
+    Filters and everything that depends on them.
+    
+    Runs as a fragment: changing a filter reruns only this function, not the
+    whole app (data loading, database check, navigation). Figures are cached
+    per data version and filter state.
+    """
+    df_exp = expense.frame
+    
     # Filters with better styling
     st.markdown('<div class="section-header-pro">🔍 Filter Options</div>', unsafe_allow_html=True)
     
@@ -72,7 +93,7 @@ def render_expenses(df: pd.DataFrame):
     with c2:
         end_date = st.date_input("To Date", df_exp["Date"].max())
     with c3:
-        all_cats = list(df_exp["Category"].dropna().unique())
+        all_cats = list(expense.categories)
         cats = st.multiselect("Categories", all_cats, default=all_cats)
     
     # Apply filters
@@ -83,6 +104,15 @@ def render_expenses(df: pd.DataFrame):
     if filtered.empty:
         st.warning("⚠️ No matching expenses found for selected filters.")
         return
+    filter_state = (str(start_date), str(end_date), tuple(cats))
+    
+    # Without active filters the precomputed aggregates already match the view
+    unfiltered = len(filtered) == expense.count
+    if unfiltered:
+        by_cat = expense.by_category[["Category", "Amount", "Label"]]
+    else:
+        by_cat = group_by_category(filtered)
+        by_cat = by_cat.assign(Label=format_amounts(by_cat["Amount"], " EGP"))
     
     # Calculate statistics
     total = filtered["Amount"].sum()
@@ -90,9 +120,9 @@ def render_expenses(df: pd.DataFrame):
     num_transactions = len(filtered)
     daily_avg = total / max(1, (filtered["Date"].max() - filtered["Date"].min()).days + 1)
     
-    # Top category
-    top_category = filtered.groupby("Category")["Amount"].sum().idxmax()
-    top_category_amount = filtered.groupby("Category")["Amount"].sum().max()
+    # Top category (by_cat is sorted largest first)
+    top_category = by_cat["Category"].iloc[0]
+    top_category_amount = by_cat["Amount"].iloc[0]
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -144,152 +174,163 @@ def render_expenses(df: pd.DataFrame):
     col_chart1, col_chart2 = st.columns([1.2, 1])
     
     with col_chart1:
-        by_cat = group_by_category(filtered).sort_values("Amount", ascending=True)
-        fig_bar = go.Figure()
-        
-        fig_bar.add_trace(go.Bar(
-            x=by_cat["Amount"],
-            y=by_cat["Category"],
-            orientation='h',
-            marker=dict(
-                color=by_cat["Amount"],
-                colorscale=[
-                    [0, "#fca5a5"],
-                    [0.5, "#f87171"],
-                    [1, "#dc2626"]
-                ],
-                line=dict(color='#b91c1c', width=1)
-            ),
-            text=by_cat["Amount"].apply(lambda x: f"{x:,.0f} EGP"),
-            textposition='outside',
-            hovertemplate="<b>%{y}</b><br>Amount: %{x:,.0f} EGP<extra></extra>"
-        ))
-        
-        fig_bar.update_layout(
-            title="Expenses by Category",
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#e5e7eb", size=11),
-            xaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(148, 163, 184, 0.1)",
-                title="Amount (EGP)"
-            ),
-            yaxis=dict(
-                showgrid=False,
-                title=""
-            ),
-            height=350,
-            margin=dict(l=10, r=80, t=40, b=40),
-            showlegend=False
+        fig_bar = cached_figure(
+            "expenses.by_category",
+            lambda: _category_bar_figure(by_cat),
+            data_version, *filter_state
         )
-        st.plotly_chart(fig_bar, use_container_width=True)
+        st.plotly_chart(fig_bar, use_container_width=True, theme=None)
     
     with col_chart2:
         # Pie chart for distribution
-        fig_pie = px.pie(
-            by_cat,
-            values="Amount",
-            names="Category",
-            title="Distribution %",
-            hole=0.4,
-            color_discrete_sequence=px.colors.sequential.Reds_r
-        )
-        fig_pie.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#e5e7eb", size=10),
-            height=350,
-            margin=dict(l=10, r=10, t=40, b=10)
+        fig_pie = cached_figure(
+            "expenses.distribution",
+            lambda: _distribution_figure(by_cat),
+            data_version, *filter_state
         )
-        fig_pie.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            hovertemplate="<b>%{label}</b><br>%{value:,.0f} EGP<br>%{percent}<extra></extra>"
-        )
-        st.plotly_chart(fig_pie, use_container_width=True)
+        st.plotly_chart(fig_pie, use_container_width=True, theme=None)
     
     # Monthly Trend with enhanced visualization
     st.markdown('<div class="section-header-pro">📈 Monthly Expense Trend</div>', unsafe_allow_html=True)
     
-    monthly = get_monthly_summary(filtered)
+    if unfiltered:
+        monthly = expense.monthly
+    else:
+        monthly = get_monthly_summary(filtered)
+        monthly = monthly.assign(Label=format_amounts(monthly["Amount"]))
     if not monthly.empty:
-        fig_trend = go.Figure()
-        
-        # Add bars
-        fig_trend.add_trace(go.Bar(
-            x=monthly["Month"],
-            y=monthly["Amount"],
-            name="Monthly Expenses",
-            marker=dict(
-                color=monthly["Amount"],
-                colorscale=[
-                    [0, "#fca5a5"],
-                    [1, "#dc2626"]
-                ],
-                line=dict(color='#b91c1c', width=1.5)
-            ),
-            text=monthly["Amount"].apply(lambda x: f"{x:,.0f}"),
-            textposition='outside',
-            hovertemplate="<b>%{x}</b><br>Expenses: %{y:,.0f} EGP<extra></extra>"
-        ))
-        
-        # Add trend line
-        fig_trend.add_trace(go.Scatter(
-            x=monthly["Month"],
-            y=monthly["Amount"],
-            mode='lines+markers',
-            name='Trend',
-            line=dict(color='#f97316', width=3, dash='dash'),
-            marker=dict(size=8, color='#fb923c', line=dict(width=2, color='#ea580c')),
-            hovertemplate="<b>%{x}</b><br>Trend: %{y:,.0f} EGP<extra></extra>"
-        ))
-        
-        fig_trend.update_layout(
-            title="Monthly Expense Progress",
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#e5e7eb", size=11),
-            xaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(148, 163, 184, 0.1)",
-                title="Month"
-            ),
-            yaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(148, 163, 184, 0.1)",
-                title="Amount (EGP)"
-            ),
-            height=400,
-            hovermode='x unified',
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
+        fig_trend = cached_figure(
+            "expenses.monthly_trend",
+            lambda: _monthly_trend_figure(monthly),
+            data_version, *filter_state
         )
-        st.plotly_chart(fig_trend, use_container_width=True)
+        st.plotly_chart(fig_trend, use_container_width=True, theme=None)
     
     # Transaction Details with better formatting
     st.markdown('<div class="section-header-pro">📋 Transaction Details</div>', unsafe_allow_html=True)
     
-    # Format the dataframe
-    df_display = filtered.copy()
-    df_display["Date"] = df_display["Date"].dt.strftime("%d %b %Y")
-    df_display["Amount"] = df_display["Amount"].apply(lambda x: f"{x:,.0f} EGP")
-    
-    # Select and reorder columns
+    # Only the latest 20 rows are selected and formatted
     display_columns = ["Date", "Category", "Amount", "Source", "Description"]
-    df_display = df_display[display_columns].sort_values("Date", ascending=False)
-    
-    # Style the dataframe
-    st.dataframe(
-        df_display.head(20),
-        use_container_width=True,
-        hide_index=True
-    )
+    render_transaction_table(filtered, display_columns, limit=20)
     
     if len(filtered) > 20:
         st.info(f"💡 Showing latest 20 transactions out of {len(filtered)} total expense records")
+    
+    # Export of the filtered view
+    st.markdown('<div class="section-header-pro">📤 Export Filtered Expenses</div>', unsafe_allow_html=True)
+    render_export_panel(
+        "expenses",
+        lambda: iter_frame_chunks(filtered),
+        "Expenses",
+        signature=(data_version,) + filter_state
+    )
+
+def _category_bar_figure(by_cat):
+    """Horizontal bars of expenses per category, largest on top."""
+    by_cat_asc = by_cat.iloc[::-1]
+    fig_bar = go.Figure()
+
+    fig_bar.add_trace(go.Bar(
+        x=by_cat_asc["Amount"],
+        y=by_cat_asc["Category"],
+        orientation='h',
+        marker=dict(
+            color=by_cat_asc["Amount"],
+            colorscale=[
+                [0, "#fca5a5"],
+                [0.5, "#f87171"],
+                [1, "#dc2626"]
+            ],
+            line=dict(color='#b91c1c', width=1)
+        ),
+        text=by_cat_asc["Label"],
+        textposition='outside',
+        hovertemplate="<b>%{y}</b><br>Amount: %{x:,.0f} EGP<extra></extra>"
+    ))
+
+    apply_theme(
+        fig_bar,
+        title="Expenses by Category",
+        xaxis=dict(title="Amount (EGP)"),
+        yaxis=dict(
+            showgrid=False,
+            title=""
+        ),
+        height=350,
+        margin=dict(l=10, r=80, t=40, b=40),
+        showlegend=False
+    )
+    return fig_bar
+
+def _distribution_figure(by_cat):
+    """Donut of each category's share of expenses."""
+    fig_pie = px.pie(
+        by_cat,
+        values="Amount",
+        names="Category",
+        title="Distribution %",
+        hole=0.4,
+        color_discrete_sequence=px.colors.sequential.Reds_r
+    )
+    apply_theme(
+        fig_pie,
+        font=dict(size=10),
+        height=350,
+        margin=dict(l=10, r=10, t=40, b=10)
+    )
+    fig_pie.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate="<b>%{label}</b><br>%{value:,.0f} EGP<br>%{percent}<extra></extra>"
+    )
+    return fig_pie
+
+def _monthly_trend_figure(monthly):
+    """Monthly expense bars with a trend line."""
+    fig_trend = go.Figure()
+
+    # Add bars
+    fig_trend.add_trace(go.Bar(
+        x=monthly["Month"],
+        y=monthly["Amount"],
+        name="Monthly Expenses",
+        marker=dict(
+            color=monthly["Amount"],
+            colorscale=[
+                [0, "#fca5a5"],
+                [1, "#dc2626"]
+            ],
+            line=dict(color='#b91c1c', width=1.5)
+        ),
+        text=monthly["Label"],
+        textposition='outside',
+        hovertemplate="<b>%{x}</b><br>Expenses: %{y:,.0f} EGP<extra></extra>"
+    ))
+
+    # Add trend line
+    fig_trend.add_trace(time_series_trace(
+        monthly["Month"],
+        monthly["Amount"],
+        mode='lines+markers',
+        name='Trend',
+        line=dict(color='#f97316', width=3, dash='dash'),
+        marker=dict(size=8, color='#fb923c', line=dict(width=2, color='#ea580c')),
+        hovertemplate="<b>%{x}</b><br>Trend: %{y:,.0f} EGP<extra></extra>"
+    ))
+
+    apply_theme(
+        fig_trend,
+        title="Monthly Expense Progress",
+        xaxis=dict(title="Month"),
+        yaxis=dict(title="Amount (EGP)"),
+        height=400,
+        hovermode='x unified',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    return fig_trend
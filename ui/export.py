@@ -0,0 +1,44 @@
+import streamlit as st
+from datetime import datetime
+from logic.export import EXPORT_FORMATS, export_transactions
+
+def render_export_panel(key, make_chunks, file_stem, signature=None):
+    """
+    Render a format picker with a two-step "prepare, then download" export.
+
+    The file is only built when asked for, by streaming the chunks returned
+    by make_chunks() into the chosen format. The prepared file is kept in
+    session state together with its signature (e.g. the active filters) and
+    is dropped as soon as the signature changes.
+    """
+    state_key = f"{key}_export_file"
+
+    col_fmt, col_btn = st.columns([1, 2])
+    with col_fmt:
+        fmt = st.selectbox(
+            "Export Format",
+            list(EXPORT_FORMATS),
+            format_func=lambda f: EXPORT_FORMATS[f][0],
+            key=f"{key}_export_format"
+        )
+    with col_btn:
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.button("📦 Prepare Export", key=f"{key}_export_prepare", use_container_width=True):
+            with st.spinner("Preparing export..."):
+                try:
+                    buf = export_transactions(make_chunks(), fmt)
+                    st.session_state[state_key] = (fmt, signature, buf.getvalue())
+                except Exception as e:
+                    st.error(f"❌ Export failed: {str(e)}")
+
+    prepared = st.session_state.get(state_key)
+    if prepared and prepared[0] == fmt and prepared[1] == signature:
+        label, mime, ext = EXPORT_FORMATS[fmt]
+        st.download_button(
+            label=f"⬇️ Download {label}",
+            data=prepared[2],
+            file_name=f"{file_stem}_{datetime.now().strftime('%Y%m%d')}.{ext}",
+            mime=mime,
+            use_container_width=True,
+            key=f"{key}_export_download"
+        )
@@ -1,12 +1,15 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
-from logic.calculations import filter_data, get_monthly_summary
+from ui.charts import apply_theme, cached_figure, time_series_trace
+from ui.tables import render_transaction_table
 
-def render_income(df: pd.DataFrame):
+def render_income(model):
     """
     Render professional income tracking page with animations.
+    
+    Args:
+        model: LedgerViewModel of the current user (see logic.view_models)
     """
     # Custom CSS with animations
     st.markdown("""
@@ -52,24 +55,27 @@ def render_income(df: pd.DataFrame):
     </div>
     """, unsafe_allow_html=True)
     
-    if df.empty:
+    if model.empty:
         st.info("No data available.")
         return
         
-    df_inc = df[df["Type"] == "Income"].copy()
+    income = model.of_type("Income")
+    df_inc = income.frame
     
     if df_inc.empty:
         st.info("💡 No income records found. Start adding your income transactions!")
         return
 
     # Total stats with enhanced cards
-    total_income = df_inc["Amount"].sum()
-    monthly_avg = total_income / max(1, df_inc["Date"].dt.to_period("M").nunique())
-    num_transactions = len(df_inc)
+    total_income = income.total
+    monthly_avg = total_income / max(1, len(income.month_totals))
+    num_transactions = income.count
     
-    # Freelancing stats
-    freelance = df_inc[df_inc["Category"].str.contains("Freelanc|Mostaql", case=False, na=False)]
-    freelance_total = freelance["Amount"].sum()
+    # Freelancing stats (from the per-category totals)
+    by_category = income.by_category
+    freelance_total = by_category.loc[
+        by_category["Category"].str.contains("Freelanc|Mostaql", case=False, na=False), "Amount"
+    ].sum()
     freelance_pct = (freelance_total / total_income * 100) if total_income > 0 else 0
     
     # Enhanced metrics
@@ -120,153 +126,151 @@ def render_income(df: pd.DataFrame):
     col_chart1, col_chart2 = st.columns([1.2, 1])
     
     with col_chart1:
-        category_summary = df_inc.groupby("Category")["Amount"].sum().sort_values(ascending=True).reset_index()
-        fig_bar = go.Figure()
-        
-        fig_bar.add_trace(go.Bar(
-            x=category_summary["Amount"],
-            y=category_summary["Category"],
-            orientation='h',
-            marker=dict(
-                color=category_summary["Amount"],
-                colorscale=[
-                    [0, "#10b981"],
-                    [0.5, "#22c55e"],
-                    [1, "#84cc16"]
-                ],
-                line=dict(color='#059669', width=1)
-            ),
-            text=category_summary["Amount"].apply(lambda x: f"{x:,.0f} EGP"),
-            textposition='outside',
-            hovertemplate="<b>%{y}</b><br>Amount: %{x:,.0f} EGP<extra></extra>"
-        ))
-        
-        fig_bar.update_layout(
-            title="Income by Source",
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#e5e7eb", size=11),
-            xaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(148, 163, 184, 0.1)",
-                title="Amount (EGP)"
-            ),
-            yaxis=dict(
-                showgrid=False,
-                title=""
-            ),
-            height=350,
-            margin=dict(l=10, r=80, t=40, b=40),
-            showlegend=False
+        category_summary = by_category[["Category", "Amount", "Label"]].iloc[::-1]
+        fig_bar = cached_figure(
+            "income.by_source",
+            lambda: _source_bar_figure(category_summary),
+            model.data_version
         )
-        st.plotly_chart(fig_bar, use_container_width=True)
+        st.plotly_chart(fig_bar, use_container_width=True, theme=None)
     
     with col_chart2:
         # Pie chart for distribution
-        fig_pie = px.pie(
-            category_summary,
-            values="Amount",
-            names="Category",
-            title="Distribution %",
-            hole=0.4,
-            color_discrete_sequence=px.colors.sequential.Greens_r
-        )
-        fig_pie.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#e5e7eb", size=10),
-            height=350,
-            margin=dict(l=10, r=10, t=40, b=10)
+        fig_pie = cached_figure(
+            "income.distribution",
+            lambda: _distribution_figure(category_summary),
+            model.data_version
         )
-        fig_pie.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            hovertemplate="<b>%{label}</b><br>%{value:,.0f} EGP<br>%{percent}<extra></extra>"
-        )
-        st.plotly_chart(fig_pie, use_container_width=True)
+        st.plotly_chart(fig_pie, use_container_width=True, theme=None)
     
     # Monthly Growth with enhanced visualization
     st.markdown('<div class="section-header-pro">📈 Monthly Growth Trend</div>', unsafe_allow_html=True)
     
-    monthly = get_monthly_summary(df_inc)
+    monthly = income.monthly
     if not monthly.empty:
         # Create combination chart
-        fig_growth = go.Figure()
-        
-        # Add bars
-        fig_growth.add_trace(go.Bar(
-            x=monthly["Month"],
-            y=monthly["Amount"],
-            name="Monthly Income",
-            marker=dict(
-                color=monthly["Amount"],
-                colorscale=[
-                    [0, "#10b981"],
-                    [1, "#22c55e"]
-                ],
-                line=dict(color='#059669', width=1.5)
-            ),
-            text=monthly["Amount"].apply(lambda x: f"{x:,.0f}"),
-            textposition='outside',
-            hovertemplate="<b>%{x}</b><br>Income: %{y:,.0f} EGP<extra></extra>"
-        ))
-        
-        # Add trend line
-        fig_growth.add_trace(go.Scatter(
-            x=monthly["Month"],
-            y=monthly["Amount"],
-            mode='lines+markers',
-            name='Trend',
-            line=dict(color='#3b82f6', width=3, dash='dash'),
-            marker=dict(size=8, color='#60a5fa', line=dict(width=2, color='#1e40af')),
-            hovertemplate="<b>%{x}</b><br>Trend: %{y:,.0f} EGP<extra></extra>"
-        ))
-        
-        fig_growth.update_layout(
-            title="Monthly Income Progress",
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#e5e7eb", size=11),
-            xaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(148, 163, 184, 0.1)",
-                title="Month"
-            ),
-            yaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(148, 163, 184, 0.1)",
-                title="Amount (EGP)"
-            ),
-            height=400,
-            hovermode='x unified',
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
+        fig_growth = cached_figure(
+            "income.monthly_growth",
+            lambda: _monthly_growth_figure(monthly),
+            model.data_version
         )
-        st.plotly_chart(fig_growth, use_container_width=True)
+        st.plotly_chart(fig_growth, use_container_width=True, theme=None)
     
     # Recurring Income Details with better formatting
     st.markdown('<div class="section-header-pro">📋 Recurring Income Details</div>', unsafe_allow_html=True)
     
-    # Format the dataframe
-    df_display = df_inc.copy()
-    df_display["Date"] = df_display["Date"].dt.strftime("%d %b %Y")
-    df_display["Amount"] = df_display["Amount"].apply(lambda x: f"{x:,.0f} EGP")
-    
-    # Select and reorder columns
+    # Only the latest 20 rows are selected and formatted
     display_columns = ["Date", "Category", "Amount", "Source", "Description"]
-    df_display = df_display[display_columns].sort_values("Date", ascending=False)
-    
-    # Style the dataframe
-    st.dataframe(
-        df_display.head(20),
-        use_container_width=True,
-        hide_index=True
-    )
+    render_transaction_table(df_inc, display_columns, limit=20)
     
     if len(df_inc) > 20:
         st.info(f"💡 Showing latest 20 transactions out of {len(df_inc)} total income records")
+
+def _source_bar_figure(category_summary):
+    """Horizontal bars of income per source, largest on top."""
+    fig_bar = go.Figure()
+
+    fig_bar.add_trace(go.Bar(
+        x=category_summary["Amount"],
+        y=category_summary["Category"],
+        orientation='h',
+        marker=dict(
+            color=category_summary["Amount"],
+            colorscale=[
+                [0, "#10b981"],
+                [0.5, "#22c55e"],
+                [1, "#84cc16"]
+            ],
+            line=dict(color='#059669', width=1)
+        ),
+        text=category_summary["Label"],
+        textposition='outside',
+        hovertemplate="<b>%{y}</b><br>Amount: %{x:,.0f} EGP<extra></extra>"
+    ))
+
+    apply_theme(
+        fig_bar,
+        title="Income by Source",
+        xaxis=dict(title="Amount (EGP)"),
+        yaxis=dict(
+            showgrid=False,
+            title=""
+        ),
+        height=350,
+        margin=dict(l=10, r=80, t=40, b=40),
+        showlegend=False
+    )
+    return fig_bar
+
+def _distribution_figure(category_summary):
+    """Donut of each source's share of income."""
+    fig_pie = px.pie(
+        category_summary,
+        values="Amount",
+        names="Category",
+        title="Distribution %",
+        hole=0.4,
+        color_discrete_sequence=px.colors.sequential.Greens_r
+    )
+    apply_theme(
+        fig_pie,
+        font=dict(size=10),
+        height=350,
+        margin=dict(l=10, r=10, t=40, b=10)
+    )
+    fig_pie.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate="<b>%{label}</b><br>%{value:,.0f} EGP<br>%{percent}<extra></extra>"
+    )
+    return fig_pie
+
+def _monthly_growth_figure(monthly):
+    """Monthly income bars with a trend line."""
+    fig_growth = go.Figure()
+
+    # Add bars
+    fig_growth.add_trace(go.Bar(
+        x=monthly["Month"],
+        y=monthly["Amount"],
+        name="Monthly Income",
+        marker=dict(
+            color=monthly["Amount"],
+            colorscale=[
+                [0, "#10b981"],
+                [1, "#22c55e"]
+            ],
+            line=dict(color='#059669', width=1.5)
+        ),
+        text=monthly["Label"],
+        textposition='outside',
+        hovertemplate="<b>%{x}</b><br>Income: %{y:,.0f} EGP<extra></extra>"
+    ))
+
+    # Add trend line
+    fig_growth.add_trace(time_series_trace(
+        monthly["Month"],
+        monthly["Amount"],
+        mode='lines+markers',
+        name='Trend',
+        line=dict(color='#3b82f6', width=3, dash='dash'),
+        marker=dict(size=8, color='#60a5fa', line=dict(width=2, color='#1e40af')),
+        hovertemplate="<b>%{x}</b><br>Trend: %{y:,.0f} EGP<extra></extra>"
+    ))
+
+    apply_theme(
+        fig_growth,
+        title="Monthly Income Progress",
+        xaxis=dict(title="Month"),
+        yaxis=dict(title="Amount (EGP)"),
+        height=400,
+        hovermode='x unified',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    return fig_growth
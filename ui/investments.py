@@ -1,11 +1,15 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
+from ui.charts import apply_theme, cached_figure, time_series_trace
+from ui.tables import render_transaction_table
 
-def render_investments(df: pd.DataFrame):
+def render_investments(model):
     """
     Render professional investments tracking page with analytics.
+    
+    Args:
+        model: LedgerViewModel of the current user (see logic.view_models)
     """
     # Custom CSS with animations
     st.markdown("""
@@ -58,20 +62,21 @@ def render_investments(df: pd.DataFrame):
     </div>
     """, unsafe_allow_html=True)
     
-    if df.empty:
+    if model.empty:
         st.info("No data available.")
         return
         
-    df_inv = df[df["Type"] == "Investment"].copy()
+    investment = model.of_type("Investment")
+    df_inv = investment.frame
     
     if df_inv.empty:
         st.info("💡 No investment records found. Start building your portfolio!")
         return
     
     # Overall Portfolio Stats
-    total_invested = df_inv["Amount"].sum()
-    num_investments = len(df_inv)
-    categories = df_inv["Category"].nunique()
+    total_invested = investment.total
+    num_investments = investment.count
+    categories = len(investment.categories)
     
     st.markdown('<div class="section-header-pro">💼 Portfolio Overview</div>', unsafe_allow_html=True)
     
@@ -112,117 +117,41 @@ def render_investments(df: pd.DataFrame):
     col_chart1, col_chart2 = st.columns([1.3, 1])
     
     with col_chart1:
-        category_summary = df_inv.groupby("Category")["Amount"].sum().sort_values(ascending=True).reset_index()
-        fig_bar = go.Figure()
-        
-        fig_bar.add_trace(go.Bar(
-            x=category_summary["Amount"],
-            y=category_summary["Category"],
-            orientation='h',
-            marker=dict(
-                color=category_summary["Amount"],
-                colorscale=[
-                    [0, "#c084fc"],
-                    [0.5, "#a855f7"],
-                    [1, "#9333ea"]
-                ],
-                line=dict(color='#7e22ce', width=1)
-            ),
-            text=category_summary["Amount"].apply(lambda x: f"{x:,.0f} EGP"),
-            textposition='outside',
-            hovertemplate="<b>%{y}</b><br>Amount: %{x:,.0f} EGP<extra></extra>"
-        ))
-        
-        fig_bar.update_layout(
-            title="Investment by Category",
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#e5e7eb", size=11),
-            xaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(148, 163, 184, 0.1)",
-                title="Amount (EGP)"
-            ),
-            yaxis=dict(
-                showgrid=False,
-                title=""
-            ),
-            height=350,
-            margin=dict(l=10, r=80, t=40, b=40),
-            showlegend=False
+        category_summary = investment.by_category[["Category", "Amount", "Label"]].iloc[::-1]
+        fig_bar = cached_figure(
+            "investments.by_category",
+            lambda: _category_bar_figure(category_summary),
+            model.data_version
         )
-        st.plotly_chart(fig_bar, use_container_width=True)
+        st.plotly_chart(fig_bar, use_container_width=True, theme=None)
     
     with col_chart2:
-        fig_pie = px.pie(
-            category_summary,
-            values="Amount",
-            names="Category",
-            title="Portfolio Distribution",
-            hole=0.4,
-            color_discrete_sequence=px.colors.sequential.Purples_r
-        )
-        fig_pie.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#e5e7eb", size=10),
-            height=350,
-            margin=dict(l=10, r=10, t=40, b=10)
+        fig_pie = cached_figure(
+            "investments.distribution",
+            lambda: _distribution_figure(category_summary),
+            model.data_version
         )
-        fig_pie.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            hovertemplate="<b>%{label}</b><br>%{value:,.0f} EGP<br>%{percent}<extra></extra>"
-        )
-        st.plotly_chart(fig_pie, use_container_width=True)
+        st.plotly_chart(fig_pie, use_container_width=True, theme=None)
     
     # Investment Timeline
     st.markdown('<div class="section-header-pro">📈 Investment Timeline</div>', unsafe_allow_html=True)
     
-    df_timeline = df_inv.sort_values("Date").copy()
-    df_timeline["Cumulative"] = df_timeline["Amount"].cumsum()
-    
-    fig_timeline = go.Figure()
+    df_timeline = investment.timeline
     
-    fig_timeline.add_trace(go.Scatter(
-        x=df_timeline["Date"],
-        y=df_timeline["Cumulative"],
-        mode='lines+markers',
-        name='Cumulative Investment',
-        line=dict(color='#a855f7', width=3),
-        marker=dict(size=8, color='#c084fc', line=dict(width=2, color='#7e22ce')),
-        fill='tozeroy',
-        fillcolor='rgba(168, 85, 247, 0.2)',
-        hovertemplate="<b>%{x|%b %d, %Y}</b><br>Cumulative: %{y:,.0f} EGP<extra></extra>"
-    ))
-    
-    fig_timeline.update_layout(
-        title="Cumulative Investment Growth",
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="#e5e7eb", size=11),
-        xaxis=dict(
-            showgrid=True,
-            gridcolor="rgba(148, 163, 184, 0.1)",
-            title="Date"
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor="rgba(148, 163, 184, 0.1)",
-            title="Cumulative Amount (EGP)"
-        ),
-        height=400,
-        hovermode='x unified'
+    fig_timeline = cached_figure(
+        "investments.timeline",
+        lambda: _timeline_figure(df_timeline),
+        model.data_version
     )
-    st.plotly_chart(fig_timeline, use_container_width=True)
+    st.plotly_chart(fig_timeline, use_container_width=True, theme=None)
     
     # Detailed Breakdown by Category
     st.markdown('<div class="section-header-pro">💎 Detailed Asset Breakdown</div>', unsafe_allow_html=True)
     
-    for category in df_inv["Category"].unique():
-        cat_data = df_inv[df_inv["Category"] == category]
-        cat_total = cat_data["Amount"].sum()
-        cat_count = len(cat_data)
+    category_stats = investment.by_category.set_index("Category")
+    for category, cat_data in investment.categories.items():
+        cat_total = category_stats.at[category, "Amount"]
+        cat_count = category_stats.at[category, "Count"]
         
         # Icon mapping
         icons = {
@@ -238,16 +167,7 @@ def render_investments(df: pd.DataFrame):
             col_a, col_b = st.columns([2, 1])
             
             with col_a:
-                # Format data
-                display_df = cat_data.copy()
-                display_df["Date"] = display_df["Date"].dt.strftime("%d %b %Y")
-                display_df["Amount"] = display_df["Amount"].apply(lambda x: f"{x:,.0f} EGP")
-                
-                st.dataframe(
-                    display_df[["Date", "Amount", "Source", "Description"]].sort_values("Date", ascending=False),
-                    use_container_width=True,
-                    hide_index=True
-                )
+                render_transaction_table(cat_data, ["Date", "Amount", "Source", "Description"], limit=None)
             
             with col_b:
                 st.markdown(f"""
@@ -256,13 +176,22 @@ def render_investments(df: pd.DataFrame):
                     <div style="font-size: 28px; font-weight: 800; color: #a855f7; margin-bottom: 15px;">{cat_total:,.0f} EGP</div>
                     <div style="font-size: 12px; color: #cbd5e1;">
                         <div style="margin-bottom: 8px;">📊 Transactions: {cat_count}</div>
-                        <div style="margin-bottom: 8px;">📅 First: {cat_data['Date'].min().strftime('%d %b %Y')}</div>
-                        <div>📅 Latest: {cat_data['Date'].max().strftime('%d %b %Y')}</div>
+                        <div style="margin-bottom: 8px;">📅 First: {category_stats.at[category, 'First'].strftime('%d %b %Y')}</div>
+                        <div>📅 Latest: {category_stats.at[category, 'Last'].strftime('%d %b %Y')}</div>
                     </div>
                 </div>
                 """, unsafe_allow_html=True)
     
     # Performance Calculator Section
+    _render_performance_calculator(total_invested)
+
+@st.fragment
+def _render_performance_calculator(total_invested):
+    """
+    Current value input and unrealized P/L.
+    
+    Runs as a fragment so typing a value reruns only the calculator.
+    """
     st.markdown('<div class="section-header-pro">🎯 Performance Calculator</div>', unsafe_allow_html=True)
     st.markdown('<div style="background: rgba(59, 130, 246, 0.05); padding: 20px; border-radius: 12px; border: 1px solid rgba(59, 130, 246, 0.2); margin-bottom: 20px;">', unsafe_allow_html=True)
     
@@ -298,3 +227,88 @@ def render_investments(df: pd.DataFrame):
         """, unsafe_allow_html=True)
     
     st.markdown('</div>', unsafe_allow_html=True)
+
+def _category_bar_figure(category_summary):
+    """Horizontal bars of invested amounts per asset type, largest on top."""
+    fig_bar = go.Figure()
+
+    fig_bar.add_trace(go.Bar(
+        x=category_summary["Amount"],
+        y=category_summary["Category"],
+        orientation='h',
+        marker=dict(
+            color=category_summary["Amount"],
+            colorscale=[
+                [0, "#c084fc"],
+                [0.5, "#a855f7"],
+                [1, "#9333ea"]
+            ],
+            line=dict(color='#7e22ce', width=1)
+        ),
+        text=category_summary["Label"],
+        textposition='outside',
+        hovertemplate="<b>%{y}</b><br>Amount: %{x:,.0f} EGP<extra></extra>"
+    ))
+
+    apply_theme(
+        fig_bar,
+        title="Investment by Category",
+        xaxis=dict(title="Amount (EGP)"),
+        yaxis=dict(
+            showgrid=False,
+            title=""
+        ),
+        height=350,
+        margin=dict(l=10, r=80, t=40, b=40),
+        showlegend=False
+    )
+    return fig_bar
+
+def _distribution_figure(category_summary):
+    """Donut of each asset type's share of the portfolio."""
+    fig_pie = px.pie(
+        category_summary,
+        values="Amount",
+        names="Category",
+        title="Portfolio Distribution",
+        hole=0.4,
+        color_discrete_sequence=px.colors.sequential.Purples_r
+    )
+    apply_theme(
+        fig_pie,
+        font=dict(size=10),
+        height=350,
+        margin=dict(l=10, r=10, t=40, b=10)
+    )
+    fig_pie.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate="<b>%{label}</b><br>%{value:,.0f} EGP<br>%{percent}<extra></extra>"
+    )
+    return fig_pie
+
+def _timeline_figure(df_timeline):
+    """Cumulative invested amount over time."""
+    fig_timeline = go.Figure()
+
+    fig_timeline.add_trace(time_series_trace(
+        df_timeline["Date"],
+        df_timeline["Cumulative"],
+        mode='lines+markers',
+        name='Cumulative Investment',
+        line=dict(color='#a855f7', width=3),
+        marker=dict(size=8, color='#c084fc', line=dict(width=2, color='#7e22ce')),
+        fill='tozeroy',
+        fillcolor='rgba(168, 85, 247, 0.2)',
+        hovertemplate="<b>%{x|%b %d, %Y}</b><br>Cumulative: %{y:,.0f} EGP<extra></extra>"
+    ))
+
+    apply_theme(
+        fig_timeline,
+        title="Cumulative Investment Growth",
+        xaxis=dict(title="Date"),
+        yaxis=dict(title="Cumulative Amount (EGP)"),
+        height=400,
+        hovermode='x unified'
+    )
+    return fig_timeline
@@ -0,0 +1,85 @@
+"""
+Opt-in rerun profiler: starts a profile per rerun and shows its waterfall
+in the sidebar.
+
+Enable with ?profile=1 (or cprofile / pyinstrument) in the URL or the
+FINANCE_PROFILE environment variable; see logic/profiling.py.
+"""
+from statistics import median
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from logic.profiling import resolve_mode, start_rerun, finish_rerun
+from ui.charts import apply_theme
+
+HISTORY_LENGTH = 20  # reruns kept per view for the comparison
+SLOW_FACTOR = 1.5  # rerun flagged when this much slower than the recent median
+
+
+def start_profiling(label="rerun"):
+    """Start a profile for this rerun if profiling is enabled, else return None."""
+    mode = resolve_mode(st.query_params.get("profile"))
+    if mode is None:
+        return None
+    return start_rerun(mode, label)
+
+
+def finish_profiling(profile):
+    """Finish the rerun profile started by start_profiling (None is ignored)."""
+    if profile is not None:
+        finish_rerun(profile)
+
+
+def _waterfall_figure(profile):
+    spans = profile.waterfall()
+    labels = [f"{'· ' * s.depth}{s.name}" for s in spans]
+    fig = go.Figure(go.Bar(
+        y=labels,
+        x=[s.duration * 1000 for s in spans],
+        base=[s.start * 1000 for s in spans],
+        orientation="h",
+        marker_color=["#818cf8" if s.depth == 0 else "#64748b" for s in spans],
+        hovertemplate="%{y}<br>%{x:.1f} ms<extra></extra>",
+    ))
+    return apply_theme(
+        fig,
+        height=80 + 22 * len(spans),
+        margin=dict(l=0, r=0, t=10, b=0),
+        xaxis_title="ms",
+        yaxis=dict(autorange="reversed", showgrid=False),
+        showlegend=False,
+    )
+
+
+def render_profile_panel(profile, view_name):
+    """
+    Show the waterfall of a finished rerun profile in the sidebar.
+
+    Args:
+        profile: Finished RerunProfile, or None when profiling is off
+        view_name: Active view, used to compare against earlier reruns of it
+    """
+    if profile is None or profile.total is None:
+        return
+
+    total_ms = profile.total * 1000
+    history = st.session_state.setdefault("_profile_history", {}).setdefault(view_name, [])
+    previous = median(history) if history else None
+    history.append(total_ms)
+    del history[:-HISTORY_LENGTH]
+
+    with st.sidebar.expander(f"⏱️ Rerun profile: {total_ms:,.0f} ms", expanded=True):
+        st.metric(
+            "Rerun time",
+            f"{total_ms:,.0f} ms",
+            delta=f"{total_ms - previous:+,.0f} ms vs median" if previous is not None else None,
+            delta_color="inverse",
+        )
+        if previous is not None and total_ms > previous * SLOW_FACTOR:
+            st.warning(f"⚠️ Slower than the last {len(history) - 1} reruns of this view")
+        if profile.spans:
+            st.plotly_chart(_waterfall_figure(profile), use_container_width=True, theme=None,
+                            config={"displayModeBar": False})
+        if profile.output_path:
+            st.caption(f"📄 {profile.mode} output: `{profile.output_path}`")
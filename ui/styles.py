@@ -137,6 +137,33 @@ APP_STYLE = """
     box-shadow: 0 4px 16px rgba(129, 140, 248, 0.6);
 }
 
+/* View navigation (pill bar like the tabs) */
+.st-key-active_view div[role="radiogroup"] {
+    gap: 6px;
+    background: radial-gradient(circle at top, rgba(15, 23, 42, 0.96), rgba(15, 23, 42, 0.9));
+    padding: 8px;
+    border-radius: 999px;
+    margin-bottom: 20px;
+}
+
+.st-key-active_view div[role="radiogroup"] label {
+    border-radius: 999px;
+    padding: 8px 24px;
+    color: #9ca3af;
+    font-size: 14px;
+    font-weight: 600;
+}
+
+.st-key-active_view div[role="radiogroup"] label > div:first-child {
+    display: none;
+}
+
+.st-key-active_view div[role="radiogroup"] label:has(input:checked) {
+    background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 50%, #ec4899 100%);
+    color: #f9fafb !important;
+    box-shadow: 0 4px 16px rgba(129, 140, 248, 0.6);
+}
+
 /* UI Elements overrides */
 div[data-testid="stMetricValue"] {
     font-size: 20px;
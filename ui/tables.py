@@ -0,0 +1,37 @@
+"""
+Transaction tables.
+
+The newest rows are picked before anything is formatted: dates stay
+datetimes and are formatted by Streamlit, and amounts are labelled on the
+visible slice only.
+"""
+import streamlit as st
+
+from logic.formatting import format_amounts, latest_rows
+
+DATE_FORMAT = "DD MMM YYYY"  # e.g. 05 Mar 2024
+
+
+def render_transaction_table(df, columns, limit=20):
+    """
+    Render the newest transactions of a frame as a table.
+
+    Args:
+        df: Transactions (not modified)
+        columns: Columns to show, in order
+        limit: Maximum number of rows to show (None for all)
+
+    Returns:
+        Number of rows shown
+    """
+    visible = latest_rows(df, limit)[columns]
+    if "Amount" in columns:
+        visible = visible.assign(Amount=format_amounts(visible["Amount"], " EGP"))
+
+    st.dataframe(
+        visible,
+        use_container_width=True,
+        hide_index=True,
+        column_config={"Date": st.column_config.DateColumn("Date", format=DATE_FORMAT)}
+    )
+    return len(visible)
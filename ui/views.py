@@ -0,0 +1,66 @@
+"""
+View registry for the top navigation.
+
+Only the selected view is rendered on a rerun, so its figures and
+groupbys are the only ones computed - unlike st.tabs, which runs the body
+of every tab each time.
+"""
+from dataclasses import dataclass
+from typing import Callable
+
+import streamlit as st
+
+from logic.profiling import span
+
+from ui.dashboard import render_dashboard
+from ui.add_transaction import render_add_transaction
+from ui.expenses import render_expenses
+from ui.income import render_income
+from ui.investments import render_investments
+from ui.wallets import render_wallets
+
+
+@dataclass(frozen=True)
+class View:
+    """A page of the app: its navigation label and how to render it."""
+    label: str
+    render: Callable  # render(model: LedgerViewModel)
+
+
+# Navigation order follows insertion order
+VIEWS = {
+    "dashboard": View("Dashboard", render_dashboard),
+    "add_transaction": View("Add Transaction", render_add_transaction),
+    "expenses": View("Expenses Analysis", render_expenses),
+    "income": View("Income Tracking", render_income),
+    "investments": View("Investments", render_investments),
+    "wallets": View("Wallets & Banks", render_wallets),
+}
+
+DEFAULT_VIEW = "dashboard"
+
+
+def select_view():
+    """Render the navigation bar and return the name of the active view."""
+    return st.radio(
+        "Navigation",
+        list(VIEWS),
+        index=list(VIEWS).index(DEFAULT_VIEW),
+        format_func=lambda name: VIEWS[name].label,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_view"
+    )
+
+
+def render_active_view(model):
+    """
+    Render the navigation bar and only the selected view.
+    
+    Args:
+        model: LedgerViewModel of the current user (see logic.view_models)
+    """
+    name = select_view()
+    with span(f"render_{name}"):
+        VIEWS[name].render(model)
+    return name
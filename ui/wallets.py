@@ -1,52 +1,23 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+from ui.charts import apply_theme, cached_figure, time_series_trace
+from ui.tables import render_transaction_table
 
-@st.cache_data(show_spinner=False)
-def calculate_balances(df_hash):
-    """Calculate balances for each source (cached for performance)"""
-    df = df_hash['df']
-    df_calc = df.copy()
-    df_calc['signed_amount'] = df_calc.apply(
-        lambda row: row['Amount'] if row['Type'] == 'Income' else -row['Amount'], axis=1
-    )
-    balances = df_calc.groupby("Source")["signed_amount"].sum().sort_values(ascending=False).reset_index()
-    balances.columns = ["Source", "Balance"]
-    return balances
-
-@st.cache_data(show_spinner=False)
-def get_source_transactions(df_hash, selected_source):
-    """Get and process transactions for a specific source (cached)"""
-    df = df_hash['df']
-    source_txns = df[df["Source"] == selected_source].sort_values("Date", ascending=False)
-    
-    if source_txns.empty:
-        return None, None
-    
-    # Calculate cumulative for chart
-    source_txns_sorted = source_txns.sort_values("Date")
-    source_txns_sorted['signed_amount'] = source_txns_sorted.apply(
-         lambda row: row['Amount'] if row['Type'] == 'Income' else -row['Amount'], axis=1
-    )
-    source_txns_sorted['cumulative'] = source_txns_sorted['signed_amount'].cumsum()
-    
-    return source_txns, source_txns_sorted
-
-def render_wallets(df: pd.DataFrame):
+def render_wallets(model):
     """
     Render wallets and banks status.
+    
+    Args:
+        model: LedgerViewModel of the current user (see logic.view_models)
     """
     st.markdown('<div class="section-header-pro">Wallets & Banks</div>', unsafe_allow_html=True)
     
-    if df.empty:
+    if model.empty:
         st.info("No data available.")
         return
     
-    # Create hashable version for caching
-    df_hash = {'df': df, 'hash': hash(pd.util.hash_pandas_object(df).sum())}
-    
-    # Calculate balances using cache
-    balances = calculate_balances(df_hash)
+    # Per-source balances and running balances are precomputed per data version
+    balances = model.source_balances
     
     # Overall Cards
     st.markdown("### 💳 Current Balances")
@@ -68,52 +39,51 @@ def render_wallets(df: pd.DataFrame):
     
     selected_source = st.selectbox("Select Source for Details", balances["Source"].unique(), key="wallet_source_select")
     
-    # Get source transactions using cache
-    source_txns, source_txns_sorted = get_source_transactions(df_hash, selected_source)
+    # Oldest first for the trend, newest first for the activity table
+    source_txns_sorted = model.source_timelines.get(selected_source)
+    source_txns = source_txns_sorted.iloc[::-1] if source_txns_sorted is not None else None
     
     if source_txns is not None and not source_txns.empty:
-        # Mini chart of flow over time for this source
-        fig = px.line(source_txns_sorted, x="Date", y="cumulative", title=f"{selected_source} Balance Trend (Calculated)")
-        fig.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)", 
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#e5e7eb"),
-            hovermode="x unified",
-            xaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(148, 163, 184, 0.1)",
-                zeroline=False
-            ),
-            yaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(148, 163, 184, 0.1)",
-                zeroline=True,
-                zerolinecolor="rgba(148, 163, 184, 0.3)",
-                zerolinewidth=1
-            ),
-            margin=dict(l=10, r=10, t=40, b=10)
+        # Mini chart of flow over time for this source (downsampled for long histories)
+        fig = cached_figure(
+            "wallets.balance_trend",
+            lambda: _balance_trend_figure(selected_source, source_txns_sorted),
+            model.data_version, selected_source
         )
-        # Use cyan color matching the design with enhanced visibility
-        fig.update_traces(
-            line_color="#00f2ff", 
-            line_width=3,
-            mode='lines+markers',
-            marker=dict(size=8, color="#00f2ff", line=dict(width=2, color="#0891b2")),
-            hovertemplate="<b>Date:</b> %{x|%b %d, %Y}<br><b>Balance:</b> %{y:,.0f} EGP<extra></extra>"
-        )
-        st.plotly_chart(fig, use_container_width=True, key=f"wallet_chart_{selected_source}")
+        st.plotly_chart(fig, use_container_width=True, theme=None, key=f"wallet_chart_{selected_source}")
         
         st.markdown('<div class="section-header-pro">📋 Recent Activity</div>', unsafe_allow_html=True)
         
-        # Format dataframe with proper date formatting
-        display_df = source_txns.copy()
-        display_df["Date"] = display_df["Date"].dt.strftime("%d %b %Y")
-        display_df["Amount"] = display_df["Amount"].apply(lambda x: f"{x:,.0f} EGP")
-        
-        st.dataframe(
-            display_df[["Date", "Type", "Category", "Amount", "Description"]].head(20),
-            use_container_width=True,
-            hide_index=True
-        )
+        render_transaction_table(source_txns, ["Date", "Type", "Category", "Amount", "Description"], limit=20)
     else:
         st.info(f"No transactions found for {selected_source}")
+
+def _balance_trend_figure(selected_source, source_txns_sorted):
+    """Running balance of one source over time."""
+    fig = go.Figure()
+    # Use cyan color matching the design with enhanced visibility
+    fig.add_trace(time_series_trace(
+        source_txns_sorted["Date"],
+        source_txns_sorted["cumulative"],
+        mode='lines+markers',
+        line=dict(color="#00f2ff", width=3),
+        marker=dict(size=8, color="#00f2ff", line=dict(width=2, color="#0891b2")),
+        hovertemplate="<b>Date:</b> %{x|%b %d, %Y}<br><b>Balance:</b> %{y:,.0f} EGP<extra></extra>"
+    ))
+    apply_theme(
+        fig,
+        title=f"{selected_source} Balance Trend (Calculated)",
+        hovermode="x unified",
+        xaxis=dict(
+            zeroline=False,
+            title="Date"
+        ),
+        yaxis=dict(
+            zeroline=True,
+            zerolinecolor="rgba(148, 163, 184, 0.3)",
+            zerolinewidth=1,
+            title="cumulative"
+        ),
+        margin=dict(l=10, r=10, t=40, b=10)
+    )
+    return fig